@@ -0,0 +1,7 @@
+def child_exit(server, worker):
+    """Drop the live gauges (in-flight requests, pool usage) of an exited worker from /metrics."""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
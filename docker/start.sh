@@ -2,5 +2,12 @@
 
 set -e
 
+# Prometheus multiprocess mode: every worker writes its metrics here and /metrics aggregates them
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR" && mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# Write logs from a background thread in each worker, off the event loop
+export LOG_ENQUEUE="${LOG_ENQUEUE:-true}"
+
 alembic upgrade head
-gunicorn -w 4 -k uvicorn.workers.UvicornWorker app.main:create_app --bind "0.0.0.0:7132"
\ No newline at end of file
+gunicorn -c gunicorn.conf.py -w 4 -k uvicorn.workers.UvicornWorker app.main:create_app --bind "0.0.0.0:7132"
\ No newline at end of file
@@ -5,18 +5,27 @@ from fastapi import APIRouter, Depends, status
 
 from app.features.auth.deps import get_current_user, on_superuser
 from app.features.auth.models import User
-from app.features.auth.schemas import UserCreate, UserRead, UsersRead
+from app.features.auth.schemas import UserBulkResult, UserCreate, UserRead, UsersRead
 from app.features.auth.usecases.admin import (
+    BulkCreateUserUseCase,
     CreateAdminUseCase,
     CreateUserUseCase,
     DeleteUserUseCase,
     GetMultiUserUseCase,
+    RevokeUserTokensUseCase,
 )
+from app_base.base.deps.bulk import BulkRows, bulk_body
 from app_base.base.deps.params.page import PaginationParam
+from app_base.base.deps.timeout import request_timeout
 from app_base.base.schemas.delete_resp import DeleteResponse
+from app_base.config import get_auth_settings
 
 router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(on_superuser)])
 
+# The row limit and timeout are read per request: the auth settings are not loaded at import
+user_bulk_body = bulk_body(UserCreate, max_rows=lambda: get_auth_settings().USER_BULK_MAX_ROWS)
+user_bulk_timeout = request_timeout(lambda: get_auth_settings().USER_BULK_TIMEOUT)
+
 
 @router.post("/user", status_code=status.HTTP_201_CREATED, response_model=UserRead)
 async def create_user(
@@ -28,6 +37,19 @@ async def create_user(
     return user
 
 
+@router.post("/users/bulk", response_model=UserBulkResult, dependencies=[Depends(user_bulk_timeout)])
+async def create_users_bulk(
+    body: Annotated[BulkRows[UserCreate], Depends(user_bulk_body)],
+    use_case: Annotated[BulkCreateUserUseCase, Depends()],
+):
+    """
+    Create many users at once, from a JSON list of users or NDJSON (one user per line,
+    `Content-Type: application/x-ndjson`). Rows that are invalid or whose email is taken
+    are reported by position in `errors`; the others are created.
+    """
+    return await use_case.execute(body)
+
+
 @router.post("/admin", status_code=status.HTTP_201_CREATED, response_model=UserRead)
 async def create_admin(
     user_in: UserCreate,
@@ -55,3 +77,12 @@ async def delete_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     return await use_case.execute(user_id, current_user)
+
+
+@router.post("/{user_id}/revoke-tokens", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_user_tokens(
+    use_case: Annotated[RevokeUserTokensUseCase, Depends()],
+    user_id: uuid.UUID,
+):
+    """Sign a user out everywhere: access tokens stop authorizing at once, refresh tokens are revoked."""
+    await use_case.execute(user_id)
@@ -1,12 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.exceptions import IncorrectEmailOrPasswordException
 from app.features.auth.services import UserService
-from app.features.auth.token_schemas import Token
+from app.features.auth.token_schemas import RefreshTokenRequest, Token
+from app.features.auth.usecases.token import IssueTokenUseCase, RefreshTokenUseCase, RevokeRefreshTokenUseCase
 from app_base.core.database.deps import get_session
 
 router = APIRouter(tags=["Login"])
@@ -17,11 +18,28 @@ async def login(
     data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: Annotated[AsyncSession, Depends(get_session)],
     service: Annotated[UserService, Depends()],
+    use_case: Annotated[IssueTokenUseCase, Depends()],
 ):
     user = await service.authenticate(session, email=data.username, password=data.password)
     if user is None:
         raise IncorrectEmailOrPasswordException()
-    return Token(
-        access_token=service.create_access_token(user),
-        token_type="bearer",
-    )
+    return await use_case.execute(user)
+
+
+@router.post("/token/refresh", response_model=Token)
+async def refresh_token(
+    data: RefreshTokenRequest,
+    use_case: Annotated[RefreshTokenUseCase, Depends()],
+):
+    """Exchange a refresh token for new tokens (the refresh token is rotated), without the password."""
+    return await use_case.execute(data.refresh_token)
+
+
+@router.post("/token/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_token(
+    data: RefreshTokenRequest,
+    use_case: Annotated[RevokeRefreshTokenUseCase, Depends()],
+):
+    """Revoke a refresh token and every token rotated from the same login (logout)."""
+    await use_case.execute(data.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,77 @@
+import uuid
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.auth.models import User
+from app.features.auth.token_schemas import TokenUserClaims
+from app_base.config import get_auth_settings
+from app_base.core.cache import TTLCache
+
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns if column.key != "hashed_password")
+
+
+class UserCache:
+    """
+    Authenticated users by id, so that get_current_user does not query the database on
+    every request.
+
+    Column values are cached, not the ORM instance: every hit returns a new (transient)
+    User, so that no instance is shared by concurrent requests and sessions.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache: TTLCache[uuid.UUID, dict[str, Any]] = TTLCache("user", maxsize=maxsize, ttl=ttl)
+
+    @property
+    def version(self) -> int:
+        return self.cache.version
+
+    def get(self, user_id: uuid.UUID) -> Optional[User]:
+        values = self.cache.get(user_id)
+        return User(**values) if values is not None else None
+
+    def set(self, user: User, version: Optional[int] = None) -> None:
+        self.cache.set(user.id, {key: getattr(user, key) for key in _USER_COLUMNS}, version=version)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self.cache.invalidate(user_id)
+
+
+@lru_cache
+def get_user_cache() -> UserCache:
+    settings = get_auth_settings()
+    return UserCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+@lru_cache
+def get_token_version_cache() -> TTLCache[uuid.UUID, int]:
+    """Current token version of users by id, for authorization from the token claims alone."""
+    settings = get_auth_settings()
+    return TTLCache("token_version", maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.TOKEN_VERSION_CACHE_TTL)
+
+
+def invalidate_cached_user(session: AsyncSession, user_id: uuid.UUID) -> None:
+    """
+    Drop a user (and its token version) from the caches of this process now, and again
+    once the session commits: a concurrent request may cache the row as it was before the
+    commit in between.
+
+    Other workers see the change once their entry expires (USER_CACHE_TTL,
+    TOKEN_VERSION_CACHE_TTL).
+    """
+    caches = (get_user_cache(), get_token_version_cache())
+
+    def invalidate(*_) -> None:
+        for cache in caches:
+            cache.invalidate(user_id)
+
+    invalidate()
+    event.listen(session.sync_session, "after_commit", invalidate, once=True)
+
+
+def user_from_claims(user_id: uuid.UUID, claims: TokenUserClaims) -> User:
+    """The user as signed into the access token (STATELESS_AUTH), without any lookup."""
+    return User(id=user_id, **claims.model_dump())
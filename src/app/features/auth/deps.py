@@ -1,19 +1,28 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 import jwt
-from fastapi import Depends
+from fastapi import Depends, Request, Response
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.types import Scope
 
+from app.features.auth.cache import get_token_version_cache, get_user_cache, user_from_claims
 from app.features.auth.exceptions import (
     InvalidCredentialsException,
     PermissionDeniedException,
     UserNotFoundException,
 )
+from app.features.auth.models import Scope as AuthScope
 from app.features.auth.models import User
+from app.features.auth.repos import UserRepository
 from app.features.auth.services import UserService
 from app.features.auth.token_schemas import TokenPayload
+from app_base.base.deps.rate_limit import RateLimiter
+from app_base.config import get_auth_settings
+from app_base.core.database import engine
 from app_base.core.database.deps import get_session
+from app_base.core.timing import AUTH_PHASE, timed
 
 oauth2 = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
 
@@ -22,12 +31,13 @@ def get_token_data(
     token: Annotated[str, Depends(oauth2)],
     user_service: Annotated[UserService, Depends()],
 ) -> TokenPayload:
-    try:
-        secret_key = user_service.settings.SECRET_KEY.get_secret_value()
-        payload = jwt.decode(token, secret_key, algorithms=[user_service.ALGORITHM])
-        token_data = TokenPayload(**payload)
-    except Exception:
-        raise InvalidCredentialsException() from None
+    with timed(AUTH_PHASE):
+        try:
+            secret_key = user_service.settings.SECRET_KEY.get_secret_value()
+            payload = jwt.decode(token, secret_key, algorithms=[user_service.ALGORITHM])
+            token_data = TokenPayload(**payload)
+        except Exception:
+            raise InvalidCredentialsException() from None
     return token_data
 
 
@@ -38,16 +48,122 @@ async def get_current_user(
 ) -> User:
     if token.user_id is None:
         raise InvalidCredentialsException()
-    user = await user_service.get(session, obj_id=token.user_id)
+    settings = user_service.settings
+    if settings.STATELESS_AUTH and token.user is not None:
+        return user_from_claims(token.user_id, token.user)
+    cache = get_user_cache() if settings.USER_CACHE_ENABLED else None
+    user = cache.get(token.user_id) if cache is not None else None
     if user is None:
-        raise UserNotFoundException()
+        with timed(AUTH_PHASE):
+            # The session only checks out a connection here, on a cache miss
+            version = cache.version if cache is not None else None
+            user = await user_service.get(session, obj_id=token.user_id)
+        if user is None:
+            raise UserNotFoundException()
+        if cache is not None:
+            cache.set(user, version=version)
+    # Checked on cached users too: revoked tokens are rejected on every request
+    if token.ver is not None and token.ver != user.token_version:
+        raise InvalidCredentialsException()
     return user
 
 
 def get_current_superuser(user: Annotated[User, Depends(get_current_user)]) -> User:
+    """The current user, if an admin: for routes needing the User row itself (see require_scopes)."""
     if user.role != User.Role.ADMIN:
         raise PermissionDeniedException()
     return user
 
 
-on_superuser = get_current_superuser
+async def get_verified_token(
+    token: Annotated[TokenPayload, Depends(get_token_data)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    user_service: Annotated[UserService, Depends()],
+) -> TokenPayload:
+    """
+    The access token claims, if not revoked: the `ver` claim must match the current token
+    version of the user (UserService.revoke_tokens bumps it). The version is one cached
+    integer per user, so the user row is never loaded. With STATELESS_AUTH the claims are
+    trusted until the token expires.
+    """
+    if token.user_id is None or token.ver is None:
+        raise InvalidCredentialsException()
+    if user_service.settings.STATELESS_AUTH:
+        return token
+    cache = get_token_version_cache() if user_service.settings.USER_CACHE_ENABLED else None
+    current = cache.get(token.user_id) if cache is not None else None
+    if current is None:
+        with timed(AUTH_PHASE):
+            version = cache.version if cache is not None else None
+            current = await user_service.repo.get_token_version(session, token.user_id)
+        if current is None:
+            raise UserNotFoundException()
+        if cache is not None:
+            cache.set(token.user_id, current, version=version)
+    if token.ver != current:
+        raise InvalidCredentialsException()
+    return token
+
+
+def require_scopes(*scopes: str):
+    """
+    Dependency authorizing from the signed `scope` claim of the access token alone.
+
+    Usage:
+        router = APIRouter(dependencies=[Depends(require_scopes(Scope.ADMIN))])
+    """
+    required = set(scopes)
+
+    async def check_scopes(token: Annotated[TokenPayload, Depends(get_verified_token)]) -> TokenPayload:
+        if not required <= token.scopes:
+            raise PermissionDeniedException()
+        return token
+
+    return check_scopes
+
+
+on_superuser = require_scopes(AuthScope.ADMIN)
+
+
+async def is_superuser_request(scope: Scope) -> bool:
+    """
+    Whether the bearer token of a raw ASGI request grants the diagnostics scope (admins),
+    for middlewares running before dependency resolution (the request profiler).
+    """
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    user_service = UserService(settings=get_auth_settings(), repo=UserRepository())
+    try:
+        token_data = get_token_data(token, user_service)
+        if AuthScope.DIAGNOSTICS not in token_data.scopes:
+            return False
+        async with engine.get_session_maker()() as session:
+            await get_verified_token(token_data, session, user_service)
+    except (InvalidCredentialsException, UserNotFoundException):
+        return False
+    return True
+
+
+def rate_limit(limit: int, period: float = 60.0, per_workspace: bool = False, name: Optional[str] = None):
+    """
+    Dependency limiting each user to `limit` requests per `period` seconds.
+
+    With `per_workspace`, each (user, workspace_id path parameter) pair gets its own bucket.
+
+    Usage:
+        router.include_router(memos_router, dependencies=[Depends(rate_limit(300, per_workspace=True))])
+    """
+    limiter = RateLimiter(limit, period, name=name or f"{limit}/{period:g}s")
+
+    async def check_rate_limit(
+        request: Request,
+        response: Response,
+        user: Annotated[User, Depends(get_current_user)],
+    ) -> None:
+        key_parts = [user.id]
+        if per_workspace and "workspace_id" in request.path_params:
+            key_parts.append(request.path_params["workspace_id"])
+        await limiter.check(response, *key_parts)
+
+    return check_rate_limit
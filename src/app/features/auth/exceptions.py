@@ -16,6 +16,11 @@ class InvalidCredentialsException(ForbiddenException):
     trace = False
 
 
+class InvalidRefreshTokenException(InvalidCredentialsException):
+    message = "Invalid or expired refresh token"
+    trace = False
+
+
 class PermissionDeniedException(ForbiddenException):
     message = "The user doesn't have enough privileges"
     trace = False
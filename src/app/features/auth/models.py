@@ -1,5 +1,8 @@
+import datetime
+import uuid
 from enum import StrEnum
 
+from sqlalchemy import UUID, DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
@@ -13,7 +16,40 @@ class User(Base, UUIDMixin, TimestampMixin):
     role: Mapped[str] = mapped_column()
     email: Mapped[str] = mapped_column(unique=True)
     hashed_password: Mapped[str] = mapped_column()
+    # Signed into access tokens (the `ver` claim); bumped to revoke all of them at once
+    token_version: Mapped[int] = mapped_column(default=0, server_default="0")
 
     class Role(StrEnum):
         ADMIN = "admin"
         USER = "user"
+
+
+class Scope(StrEnum):
+    """Permissions signed into access tokens (the `scope` claim), granted by role."""
+
+    ADMIN = "admin"
+    DIAGNOSTICS = "diagnostics"
+
+
+ROLE_SCOPES: dict[str, tuple[Scope, ...]] = {
+    User.Role.ADMIN: (Scope.ADMIN, Scope.DIAGNOSTICS),
+    User.Role.USER: (),
+}
+
+
+class RefreshToken(Base):
+    """
+    A refresh token, stored compactly: the SHA-256 digest of the opaque token (never the
+    token itself), its owner, its rotation family and its expiry.
+
+    Tokens are rotated on use: the used token is revoked and a new one of the same family
+    is issued. A revoked token presented again (stolen and replayed) revokes its family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    token_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    family_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), index=True)
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+    revoked: Mapped[bool] = mapped_column(default=False)
@@ -0,0 +1,125 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Literal, Optional, Sequence
+
+from passlib.context import CryptContext
+
+from app_base.config import get_auth_settings
+
+
+@lru_cache
+def _crypt_context(rounds: int) -> CryptContext:
+    # Built once per process (and per pool process)
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def _hash(rounds: int, password: str) -> str:
+    return _crypt_context(rounds).hash(password)
+
+
+def _hash_many(rounds: int, passwords: list[str]) -> list[str]:
+    return [_hash(rounds, password) for password in passwords]
+
+
+def _verify(rounds: int, password: str, hashed_password: str) -> bool:
+    return _crypt_context(rounds).verify(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing and verification off the event loop.
+
+    A bcrypt round trip takes ~250 ms of CPU at the default cost: run on the loop, every
+    login stalls all the requests of the worker. Here the work runs on a bounded pool of
+    `max_workers` threads (bcrypt releases the GIL) or processes; calls beyond that wait
+    for a free worker without blocking the loop, so a burst of logins is spread over the
+    pool instead of taking every core.
+
+    Hashes of another cost (made before PASSWORD_HASH_ROUNDS changed) still verify.
+    """
+
+    def __init__(
+        self,
+        rounds: int,
+        max_workers: int,
+        executor: Literal["thread", "process"] = "thread",
+        chunk_size: int = 8,
+    ):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.executor_type = executor
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), _hash, self.rounds, password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """
+        Hash passwords on the pool in chunks of `chunk_size`, at most one chunk per worker
+        at a time: a process pool pays one round trip per chunk rather than per password,
+        calls queued on the pool meanwhile run between chunks, and nothing is left queued
+        when the caller is cancelled (request timeout).
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def hash_chunk(chunk: list[str]) -> list[str]:
+            async with semaphore:
+                return await loop.run_in_executor(executor, _hash_many, self.rounds, chunk)
+
+        chunks = [list(passwords[i : i + self.chunk_size]) for i in range(0, len(passwords), self.chunk_size)]
+        hashed = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+        return [hashed_password for chunk in hashed for hashed_password in chunk]
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _verify, self.rounds, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    settings = get_auth_settings()
+    return PasswordHasher(
+        rounds=settings.PASSWORD_HASH_ROUNDS,
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        executor=settings.PASSWORD_HASH_EXECUTOR,
+    )
+
+
+@lru_cache
+def get_bulk_password_hasher() -> PasswordHasher:
+    """The pool of bulk provisioning, apart from the one of logins."""
+    settings = get_auth_settings()
+    return PasswordHasher(
+        rounds=settings.PASSWORD_HASH_ROUNDS,
+        max_workers=settings.PASSWORD_HASH_BULK_WORKERS,
+        executor=settings.PASSWORD_HASH_BULK_EXECUTOR,
+        chunk_size=settings.PASSWORD_HASH_BULK_CHUNK_SIZE,
+    )
+
+
+@asynccontextmanager
+async def password_hasher_lifespan(app):
+    """Shut the hashing pools down with the app (the pools are started on first use)."""
+    try:
+        yield
+    finally:
+        get_password_hasher().shutdown()
+        get_bulk_password_hasher().shutdown()
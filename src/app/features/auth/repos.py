@@ -1,5 +1,13 @@
-from app.features.auth.models import User
+import datetime
+import uuid
+from typing import Sequence
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.auth.models import RefreshToken, User
 from app.features.auth.schemas import UserDbCreate, UserDbUpdate
+from app.features.auth.token_schemas import RefreshTokenCreate, RefreshTokenUpdate
 from app_base.base.repos.base import BaseRepository
 
 
@@ -13,3 +21,50 @@ class UserRepository(BaseRepository[User, UserDbCreate, UserDbUpdate]):
         stmt = self._select(where=User.email == email)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_existing_emails(self, session: AsyncSession, emails: Sequence[str]) -> set[str]:
+        """The given emails already taken, with one `IN` query per BATCH_SIZE emails."""
+        existing: set[str] = set()
+        for i in range(0, len(emails), self.BATCH_SIZE):
+            result = await session.scalars(select(User.email).where(User.email.in_(emails[i : i + self.BATCH_SIZE])))
+            existing.update(result.all())
+        return existing
+
+    async def get_token_version(self, session: AsyncSession, user_id: uuid.UUID) -> int | None:
+        """The current token version of a user (None if no such user), without loading the row."""
+        result = await session.execute(select(User.token_version).where(User.id == user_id))
+        return result.scalar_one_or_none()
+
+    async def bump_token_version(self, session: AsyncSession, user_id: uuid.UUID) -> bool:
+        """Increment the token version of a user; return whether the user exists."""
+        stmt = update(User).where(User.id == user_id).values(token_version=User.token_version + 1)
+        result = await session.execute(stmt)
+        return result.rowcount == 1
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken, RefreshTokenCreate, RefreshTokenUpdate]):
+    """Repository for RefreshToken model."""
+
+    model = RefreshToken
+
+    async def revoke(self, session: AsyncSession, token_hash: str) -> bool:
+        """Revoke a token unless already revoked; return whether this call revoked it (atomic)."""
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == token_hash, RefreshToken.revoked.is_(False))
+            .values(revoked=True)
+        )
+        result = await session.execute(stmt)
+        return result.rowcount == 1
+
+    async def revoke_family(self, session: AsyncSession, family_id: uuid.UUID) -> None:
+        stmt = update(RefreshToken).where(RefreshToken.family_id == family_id).values(revoked=True)
+        await session.execute(stmt)
+
+    async def revoke_user(self, session: AsyncSession, user_id: uuid.UUID) -> None:
+        stmt = update(RefreshToken).where(RefreshToken.user_id == user_id).values(revoked=True)
+        await session.execute(stmt)
+
+    async def delete_expired(self, session: AsyncSession, user_id: uuid.UUID, now: datetime.datetime) -> None:
+        stmt = delete(RefreshToken).where(RefreshToken.user_id == user_id, RefreshToken.expires_at < now)
+        await session.execute(stmt)
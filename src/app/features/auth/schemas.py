@@ -1,6 +1,9 @@
+import uuid
+
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr
 
 from app.features.auth.models import User
+from app_base.base.schemas.bulk import BulkRowError
 from app_base.base.schemas.mixin import TimestampSchemaMixin, UUIDSchemaMixin
 
 
@@ -46,3 +49,14 @@ class UsersRead(BaseModel):
     total_count: int = Field(..., description="The total number of users.")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserBulkCreated(BaseModel):
+    index: int = Field(..., description="Position of the row in the request.")
+    id: uuid.UUID = Field(..., description="The id of the created user.")
+    email: EmailStr = Field(..., description="The user's email address.")
+
+
+class UserBulkResult(BaseModel):
+    created: list[UserBulkCreated] = Field(..., description="The created users.")
+    errors: list[BulkRowError] = Field(..., description="The rejected rows, by position.")
@@ -1,17 +1,31 @@
+import hashlib
+import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Union
+from typing import Annotated, Any, Mapping, Union
 from uuid import UUID
 
 import jwt
 from fastapi import Depends
-from passlib.context import CryptContext
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.auth.cache import invalidate_cached_user
 from app.features.auth.exceptions import UserAlreadyExistsException
-from app.features.auth.models import User
-from app.features.auth.repos import UserRepository
-from app.features.auth.schemas import UserCreate, UserDbCreate, UserDbUpdate, UserUpdate
+from app.features.auth.models import ROLE_SCOPES, RefreshToken, User
+from app.features.auth.passwords import get_bulk_password_hasher, get_password_hasher
+from app.features.auth.repos import RefreshTokenRepository, UserRepository
+from app.features.auth.schemas import (
+    UserBulkCreated,
+    UserBulkResult,
+    UserCreate,
+    UserDbCreate,
+    UserDbUpdate,
+    UserUpdate,
+)
+from app.features.auth.token_schemas import RefreshTokenCreate, TokenUserClaims
+from app_base.base.schemas.bulk import BulkRowError
+from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.services.base import (
     BaseContextKwargs,
     BaseDeleteServiceMixin,
@@ -44,8 +58,9 @@ class UserService(
     ):
         self.settings: AuthSettings = settings
         self._repo = repo
-
-        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.hasher = get_password_hasher()
+        self.bulk_hasher = get_bulk_password_hasher()
+        self.refresh_token_repo = RefreshTokenRepository()
 
     @property
     def repo(self) -> UserRepository:
@@ -66,7 +81,7 @@ class UserService(
         user_data = UserDbCreate(
             **obj_data.model_dump(),
             role=User.Role.USER,
-            hashed_password=self.get_password_hash(obj_data.password.get_secret_value()),
+            hashed_password=await self.get_password_hash(obj_data.password.get_secret_value()),
         )
         return await self.repo.create(session, user_data)
 
@@ -76,16 +91,83 @@ class UserService(
         user_data = UserDbCreate(
             **obj_data.model_dump(),
             role=User.Role.ADMIN,
-            hashed_password=self.get_password_hash(obj_data.password.get_secret_value()),
+            hashed_password=await self.get_password_hash(obj_data.password.get_secret_value()),
         )
         return await self.repo.create(session, user_data)
 
+    async def hash_bulk_passwords(self, rows: Mapping[int, UserCreate]) -> dict[int, str]:
+        """
+        Hash the passwords of a bulk creation (by row position) on the bulk hashing pool.
+        Call it before opening the transaction, so that no connection is held meanwhile.
+        Rows repeating an email of the batch are skipped: `create_users_bulk` rejects them.
+        """
+        first_rows: dict[str, int] = {}
+        for index, row in rows.items():
+            first_rows.setdefault(str(row.email), index)
+        indexes = list(first_rows.values())
+        hashed_passwords = await self.bulk_hasher.hash_many(
+            [rows[index].password.get_secret_value() for index in indexes]
+        )
+        return dict(zip(indexes, hashed_passwords, strict=True))
+
+    async def create_users_bulk(
+        self, session: AsyncSession, rows: Mapping[int, UserCreate], hashed_passwords: Mapping[int, str]
+    ) -> UserBulkResult:
+        """
+        Create many users (by row position), with the passwords of `hash_bulk_passwords`:
+        emails are checked with one `IN` query and rows inserted in bulk. Rows whose email
+        is taken, or repeated in the batch, are reported as errors; the others are created.
+        """
+        errors: list[BulkRowError] = []
+        accepted: dict[str, tuple[int, UserCreate]] = {}
+        for index, row in rows.items():
+            email = str(row.email)
+            if email in accepted:
+                errors.append(BulkRowError(index=index, message=f"Duplicate email in the batch: {email}"))
+            else:
+                accepted[email] = (index, row)
+        for email in await self.repo.get_existing_emails(session, list(accepted)):
+            index, _ = accepted.pop(email)
+            errors.append(BulkRowError(index=index, message=f"Email already registered: {email}"))
+
+        pending = list(accepted.values())
+        users = await self.repo.bulk_create(
+            session,
+            [
+                UserDbCreate(**row.model_dump(), role=User.Role.USER, hashed_password=hashed_passwords[index])
+                for index, row in pending
+            ],
+        )
+        return UserBulkResult(
+            created=[
+                UserBulkCreated(index=index, id=user.id, email=user.email)
+                for (index, _), user in zip(pending, users, strict=True)
+            ],
+            errors=sorted(errors, key=lambda error: error.index),
+        )
+
     async def update_user(self, session: AsyncSession, obj_data: UserUpdate, user_id: UUID) -> User | None:
         """Update an existing user."""
         user_data = UserDbUpdate(**obj_data.model_dump(exclude={"password"}))
         if obj_data.password:
-            user_data.hashed_password = self.get_password_hash(obj_data.password.get_secret_value())
-        return await self.repo.update_by_pk(session, pk=user_id, obj_in=user_data)
+            user_data.hashed_password = await self.get_password_hash(obj_data.password.get_secret_value())
+            # Sessions started with the old password end now
+            await self.revoke_tokens(session, user_id)
+        user = await self.repo.update_by_pk(session, pk=user_id, obj_in=user_data)
+        invalidate_cached_user(session, user_id)
+        return user
+
+    async def revoke_tokens(self, session: AsyncSession, user_id: UUID) -> bool:
+        """
+        End every session of a user: the access tokens issued so far stop authorizing (token
+        version bump) and the refresh tokens are revoked. Call it on password or role
+        changes. Return whether the user exists.
+        """
+        if not await self.repo.bump_token_version(session, user_id):
+            return False
+        await self.refresh_token_repo.revoke_user(session, user_id)
+        invalidate_cached_user(session, user_id)
+        return True
 
     async def get_by_email(self, session: AsyncSession, email: str) -> User | None:
         """Get a user by email."""
@@ -93,20 +175,110 @@ class UserService(
 
     async def authenticate(self, session: AsyncSession, email: str, password: str) -> User | None:
         user = await self.repo.get_by_email(session, email=email)
-        if user is not None and self.is_valid_password(password, user.hashed_password):
+        if user is not None and await self.is_valid_password(password, user.hashed_password):
             return user
         return None
 
+    async def _post_delete(
+        self, session: AsyncSession, obj_id: UUID, result: DeleteResponse, context: BaseContextKwargs
+    ) -> DeleteResponse:
+        invalidate_cached_user(session, obj_id)
+        await self.refresh_token_repo.revoke_user(session, obj_id)
+        return await super()._post_delete(session, obj_id, result, context)
+
     def create_access_token(self, user: User) -> str:
         expire = datetime.now(tz=timezone.utc) + timedelta(minutes=self.settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        claims: dict[str, Any] = {
+            "exp": expire,
+            "user_id": str(user.id),
+            "role": user.role,
+            "scope": " ".join(ROLE_SCOPES.get(user.role, ())),
+            "ver": user.token_version,
+        }
+        if self.settings.STATELESS_AUTH:
+            claims["user"] = TokenUserClaims.model_validate(user, from_attributes=True).model_dump(mode="json")
         return jwt.encode(
-            {"exp": expire, "user_id": str(user.id)},
+            claims,
             key=self.settings.SECRET_KEY.get_secret_value(),
             algorithm=self.ALGORITHM,
         )
 
-    def is_valid_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.context.verify(plain_password, hashed_password)
+    async def is_valid_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.hasher.verify(plain_password, hashed_password)
+
+    async def get_password_hash(self, password: str) -> str:
+        return await self.hasher.hash(password)
+
+
+class RefreshTokenService:
+    """
+    Issue, rotate and revoke refresh tokens.
+
+    A refresh token is an opaque random string; only its SHA-256 digest is stored, so
+    refreshing costs one indexed lookup and no password hashing.
+    """
+
+    def __init__(
+        self,
+        settings: Annotated[AuthSettings, Depends(get_auth_settings)],
+        repo: Annotated[RefreshTokenRepository, Depends()],
+    ):
+        self.settings: AuthSettings = settings
+        self._repo = repo
+
+    @property
+    def repo(self) -> RefreshTokenRepository:
+        return self._repo
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def issue(self, session: AsyncSession, user_id: UUID, family_id: UUID | None = None) -> str:
+        """Issue a refresh token, starting a new family (a login) unless one is given (a rotation)."""
+        token = secrets.token_urlsafe(32)
+        now = datetime.now(tz=timezone.utc)
+        if family_id is None:
+            # A login: drop the expired tokens of the user, so that the table stays small
+            await self.repo.delete_expired(session, user_id, now)
+        await self.repo.create(
+            session,
+            RefreshTokenCreate(
+                token_hash=self.hash_token(token),
+                user_id=user_id,
+                family_id=family_id or uuid.uuid4(),
+                expires_at=now + timedelta(days=self.settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            ),
+        )
+        return token
+
+    async def rotate(self, session: AsyncSession, token: str) -> tuple[UUID, str] | None:
+        """
+        Revoke a valid refresh token and issue its successor; return (user id, new token),
+        or None if the token is invalid.
+
+        A token already rotated is being replayed (leaked): its whole family is revoked,
+        which must be committed even though the refresh is rejected.
+        """
+        stored = await self._get_valid(session, token)
+        if stored is None:
+            return None
+        if not await self.repo.revoke(session, stored.token_hash):
+            await self.repo.revoke_family(session, stored.family_id)
+            return None
+        return stored.user_id, await self.issue(session, stored.user_id, family_id=stored.family_id)
+
+    async def revoke(self, session: AsyncSession, token: str) -> None:
+        """Revoke a refresh token and the tokens of its family (logout)."""
+        stored = await self.repo.get_by_pk(session, self.hash_token(token))
+        if stored is not None:
+            await self.repo.revoke_family(session, stored.family_id)
 
-    def get_password_hash(self, password: str) -> str:
-        return self.context.hash(password)
+    async def _get_valid(self, session: AsyncSession, token: str) -> RefreshToken | None:
+        stored = await self.repo.get_by_pk(session, self.hash_token(token))
+        if stored is None:
+            return None
+        expires_at = stored.expires_at
+        if expires_at.tzinfo is None:  # SQLite returns naive datetimes
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return stored if expires_at > datetime.now(tz=timezone.utc) else None
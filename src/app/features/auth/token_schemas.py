@@ -1,13 +1,49 @@
+import datetime
 import uuid
 from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Token(BaseModel):
     access_token: str
     token_type: Literal["bearer"]
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(..., description="The refresh token returned by the last login or refresh.")
+
+
+class RefreshTokenCreate(BaseModel):
+    token_hash: str
+    user_id: uuid.UUID
+    family_id: uuid.UUID
+    expires_at: datetime.datetime
+
+
+class RefreshTokenUpdate(BaseModel):
+    revoked: bool
+
+
+class TokenUserClaims(BaseModel):
+    """Snapshot of the user signed into the access token (STATELESS_AUTH)."""
+
+    name: str
+    surname: str
+    role: str
+    email: str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
 
 
 class TokenPayload(BaseModel):
     user_id: Optional[uuid.UUID]
+    role: Optional[str] = None
+    scope: str = Field(default="", description="Space-separated scopes granted by the role.")
+    ver: Optional[int] = Field(default=None, description="Token version of the user when issued.")
+    user: Optional[TokenUserClaims] = None
+
+    @property
+    def scopes(self) -> set[str]:
+        return set(self.scope.split())
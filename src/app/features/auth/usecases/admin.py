@@ -3,10 +3,11 @@ from uuid import UUID
 
 from fastapi import Depends
 
-from app.features.auth.exceptions import UserCantDeleteItselfException
+from app.features.auth.exceptions import UserCantDeleteItselfException, UserNotFoundException
 from app.features.auth.models import User
-from app.features.auth.schemas import UserCreate
+from app.features.auth.schemas import UserBulkResult, UserCreate
 from app.features.auth.services import UserService
+from app_base.base.deps.bulk import BulkRows
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.services.base import BaseContextKwargs, TContextKwargs
 from app_base.base.usecases.base import BaseUseCase
@@ -44,6 +45,21 @@ class CreateUserUseCase(BaseUseCase):
             return await self.service.create_user(session, obj_data)
 
 
+class BulkCreateUserUseCase(BaseUseCase):
+    """Create many users in one transaction; invalid rows are reported, the others created."""
+
+    def __init__(self, service: Annotated[UserService, Depends()]):
+        self.service = service
+
+    async def execute(self, body: BulkRows[UserCreate], context: Optional[TContextKwargs] = None) -> UserBulkResult:
+        # Hashing takes minutes for a full batch: no connection is held meanwhile
+        hashed_passwords = await self.service.hash_bulk_passwords(body.rows)
+        async with AsyncTransaction() as session:
+            result = await self.service.create_users_bulk(session, body.rows, hashed_passwords)
+        result.errors = sorted([*body.errors, *result.errors], key=lambda error: error.index)
+        return result
+
+
 class CreateAdminUseCase(BaseUseCase):
     def __init__(self, service: Annotated[UserService, Depends()]):
         self.service = service
@@ -51,3 +67,15 @@ class CreateAdminUseCase(BaseUseCase):
     async def execute(self, obj_data: UserCreate, context: Optional[TContextKwargs] = None) -> User:
         async with AsyncTransaction() as session:
             return await self.service.create_admin(session, obj_data)
+
+
+class RevokeUserTokensUseCase(BaseUseCase):
+    """End every session of a user: issued access and refresh tokens stop working."""
+
+    def __init__(self, service: Annotated[UserService, Depends()]):
+        self.service = service
+
+    async def execute(self, user_id: UUID, context: Optional[TContextKwargs] = None) -> None:
+        async with AsyncTransaction() as session:
+            if not await self.service.revoke_tokens(session, user_id):
+                raise UserNotFoundException()
@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.features.auth.exceptions import InvalidRefreshTokenException
+from app.features.auth.models import User
+from app.features.auth.services import RefreshTokenService, UserService
+from app.features.auth.token_schemas import Token
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+
+
+class IssueTokenUseCase(BaseUseCase):
+    """Issue an access token and a new refresh token family to an authenticated user."""
+
+    def __init__(
+        self,
+        service: Annotated[UserService, Depends()],
+        refresh_token_service: Annotated[RefreshTokenService, Depends()],
+    ):
+        self.service = service
+        self.refresh_token_service = refresh_token_service
+
+    async def execute(self, user: User) -> Token:
+        async with AsyncTransaction() as session:
+            refresh_token = await self.refresh_token_service.issue(session, user.id)
+        return Token(
+            access_token=self.service.create_access_token(user),
+            token_type="bearer",
+            refresh_token=refresh_token,
+        )
+
+
+class RefreshTokenUseCase(BaseUseCase):
+    """Exchange a refresh token for a new access token and the next refresh token."""
+
+    def __init__(
+        self,
+        service: Annotated[UserService, Depends()],
+        refresh_token_service: Annotated[RefreshTokenService, Depends()],
+    ):
+        self.service = service
+        self.refresh_token_service = refresh_token_service
+
+    async def execute(self, refresh_token: str) -> Token:
+        user = None
+        async with AsyncTransaction() as session:
+            rotated = await self.refresh_token_service.rotate(session, refresh_token)
+            if rotated is not None:
+                user = await self.service.get(session, rotated[0])
+        # Raised after the commit: the revocation of a replayed token's family must be kept
+        if rotated is None or user is None:
+            raise InvalidRefreshTokenException()
+        return Token(
+            access_token=self.service.create_access_token(user),
+            token_type="bearer",
+            refresh_token=rotated[1],
+        )
+
+
+class RevokeRefreshTokenUseCase(BaseUseCase):
+    """Revoke a refresh token and its family (logout)."""
+
+    def __init__(self, refresh_token_service: Annotated[RefreshTokenService, Depends()]):
+        self.refresh_token_service = refresh_token_service
+
+    async def execute(self, refresh_token: str) -> None:
+        async with AsyncTransaction() as session:
+            await self.refresh_token_service.revoke(session, refresh_token)
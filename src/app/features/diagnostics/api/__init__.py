@@ -0,0 +1,3 @@
+from .v1 import router as v1_diagnostics_router
+
+__all__ = ["v1_diagnostics_router"]
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from app.features.auth.deps import require_scopes
+from app.features.auth.models import Scope
+from app.features.diagnostics.schemas import (
+    CoalescingStatsRead,
+    ConcurrencyLimitRead,
+    EventLoopStatsRead,
+    ProfileRead,
+    QueryStatsRead,
+)
+from app_base.base.exceptions.basic import NotFoundException
+from app_base.core.database.profiling import QueryStatsOrderBy, get_query_stats_registry
+from app_base.core.loop_monitor import get_event_loop_monitor
+from app_base.core.middlewares.concurrency_limit import get_concurrency_limiters
+from app_base.core.middlewares.profiler import ProfileFormat, get_profile_store, render_profile
+from app_base.core.singleflight import get_request_singleflight
+
+router = APIRouter(
+    prefix="/admin/diagnostics", tags=["Diagnostics"], dependencies=[Depends(require_scopes(Scope.DIAGNOSTICS))]
+)
+
+
+@router.get("/queries", response_model=QueryStatsRead)
+async def get_query_stats(
+    route: Annotated[Optional[str], Query(description="Filter by route, e.g. 'GET /api/v1/workspaces'")] = None,
+    order_by: Annotated[QueryStatsOrderBy, Query(description="Sort key (descending)")] = "total_time",
+    limit: Annotated[int, Query(ge=1, le=500, description="Max number of statements")] = 50,
+):
+    """Per-statement timings aggregated by fingerprint and route (pg_stat_statements-style)."""
+    registry = get_query_stats_registry()
+    return QueryStatsRead(
+        items=registry.snapshot(route=route, order_by=order_by, limit=limit),
+        dropped=registry.dropped,
+    )
+
+
+@router.delete("/queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_stats():
+    """Reset the aggregated statement statistics."""
+    get_query_stats_registry().reset()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/coalescing", response_model=CoalescingStatsRead)
+async def get_coalescing_stats():
+    """How many requests to coalescing routes were served by an in-flight execution."""
+    singleflight = get_request_singleflight()
+    return CoalescingStatsRead(items=singleflight.snapshot(), in_flight=singleflight.in_flight)
+
+
+@router.delete("/coalescing", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_coalescing_stats():
+    """Reset the coalescing statistics."""
+    get_request_singleflight().reset()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/concurrency", response_model=list[ConcurrencyLimitRead])
+async def get_concurrency_limits():
+    """Adaptive concurrency limits of the worker that handles this request, by route class."""
+    return [limiter.snapshot() for limiter in get_concurrency_limiters().values()]
+
+
+@router.get("/event-loop", response_model=EventLoopStatsRead)
+async def get_event_loop_stats():
+    """Event loop lag percentiles and recent blocks, with the stacks that caused them, of this worker."""
+    return get_event_loop_monitor().snapshot()
+
+
+@router.delete("/event-loop", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_event_loop_stats():
+    """Reset the event loop lag samples and block reports."""
+    get_event_loop_monitor().reset()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/profiles", response_model=list[ProfileRead])
+async def get_profiles():
+    """Stored request profiles (requested with `X-Profile: store`), most recent first."""
+    return await asyncio.to_thread(get_profile_store().list)
+
+
+@router.get("/profiles/{profile_id}", response_class=Response)
+async def download_profile(
+    profile_id: str,
+    format: Annotated[ProfileFormat, Query(description="html call tree, json or speedscope")] = "html",
+):
+    """Download a stored request profile."""
+    session = await asyncio.to_thread(get_profile_store().load, profile_id)
+    if session is None:
+        raise NotFoundException(message="Profile not found")
+    body, media_type = await asyncio.to_thread(render_profile, session, format)
+    return Response(body, media_type=media_type)
@@ -0,0 +1,78 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class QueryStatRead(BaseModel):
+    route: str = Field(..., description="The route template (or '<background>') the statement ran under.")
+    query_id: str = Field(..., description="Stable fingerprint of the normalized statement.")
+    query: str = Field(..., description="The normalized statement with literals replaced by '?'.")
+    calls: int = Field(..., description="Number of executions.")
+    total_time_ms: float = Field(..., description="Total execution time in milliseconds.")
+    mean_time_ms: float = Field(..., description="Mean execution time in milliseconds.")
+    min_time_ms: float = Field(..., description="Minimum execution time in milliseconds.")
+    max_time_ms: float = Field(..., description="Maximum execution time in milliseconds.")
+    p95_time_ms: float = Field(..., description="95th percentile over recent executions in milliseconds.")
+
+
+class QueryStatsRead(BaseModel):
+    items: list[QueryStatRead] = Field(..., description="The aggregated statement statistics.")
+    dropped: int = Field(..., description="Executions not recorded because the entry limit was reached.")
+
+
+class CoalescingStatRead(BaseModel):
+    route: str = Field(..., description="The route template of the coalescing endpoint.")
+    calls: int = Field(..., description="Requests that reached the endpoint.")
+    executions: int = Field(..., description="Requests that actually executed the endpoint.")
+    coalesced: int = Field(..., description="Requests served with the result of an in-flight execution.")
+    coalescing_ratio: float = Field(..., description="Share of requests that were coalesced.")
+
+
+class CoalescingStatsRead(BaseModel):
+    items: list[CoalescingStatRead] = Field(..., description="Per-route coalescing statistics.")
+    in_flight: int = Field(..., description="Executions currently in flight.")
+
+
+class LoopBlockStackRead(BaseModel):
+    samples: int = Field(..., description="Stack samples taken with this stack.")
+    frames: list[str] = Field(..., description="Innermost frames of the loop thread, outermost first.")
+
+
+class LoopBlockRead(BaseModel):
+    started_at: float = Field(..., description="Unix time the block started at.")
+    duration_ms: float = Field(..., description="How long the loop could not run other callbacks.")
+    samples: int = Field(..., description="Stack samples taken during the block.")
+    stacks: list[LoopBlockStackRead] = Field(..., description="Most frequent stacks, most frequent first.")
+
+
+class EventLoopStatsRead(BaseModel):
+    running: bool = Field(..., description="Whether the monitor runs in this worker (LOOP_MONITOR_ENABLED).")
+    threshold_ms: float = Field(..., description="Lag reported as a block.")
+    lag_samples: int = Field(..., description="Recent lag samples the percentiles are computed from.")
+    lag_p50_ms: float = Field(..., description="Median loop lag.")
+    lag_p90_ms: float = Field(..., description="90th percentile loop lag.")
+    lag_p99_ms: float = Field(..., description="99th percentile loop lag.")
+    lag_max_ms: float = Field(..., description="Max loop lag.")
+    blocks: int = Field(..., description="Blocks detected since start or reset.")
+    reports: list[LoopBlockRead] = Field(..., description="Most recent blocks first.")
+
+
+class ConcurrencyLimitRead(BaseModel):
+    route_class: str = Field(..., description="The route class the limit applies to.")
+    limit: int = Field(..., description="Current concurrency limit of this worker.")
+    in_flight: int = Field(..., description="Requests currently being handled.")
+    queued: int = Field(..., description="Requests waiting for a slot.")
+    baseline_latency_ms: float = Field(..., description="Smoothed latency the overload detection compares to.")
+    accepted: int = Field(..., description="Requests admitted.")
+    rejected: int = Field(..., description="Requests shed with 503.")
+
+
+class ProfileRead(BaseModel):
+    id: str = Field(..., description="Profile ID (the request ID of the profiled request).")
+    created_at: float = Field(..., description="Unix time the request started at.")
+    method: str = Field(..., description="HTTP method of the profiled request.")
+    path: str = Field(..., description="Path of the profiled request.")
+    route: Optional[str] = Field(None, description="Route template of the profiled request.")
+    status_code: int = Field(..., description="Response status of the profiled request.")
+    duration_ms: float = Field(..., description="Profiled duration.")
+    samples: int = Field(..., description="Stack samples taken.")
@@ -13,6 +13,8 @@ from app.features.memos.usecases.crud import (
     GetMultiMemoUseCase,
     UpdateMemoUseCase,
 )
+from app_base.base.deps.coalesce import coalesce_requests
+from app_base.base.deps.conditional import ConditionalRequestParam, make_etag, make_page_etag
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
@@ -36,13 +38,16 @@ async def create_memo(
 
 
 @router.get("", response_model=PaginatedList[MemoRead])
+@coalesce_requests()
 async def get_memos(
     use_case: Annotated[GetMultiMemoUseCase, Depends()],
     workspace_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     pagination: PaginationParam,
+    conditional: ConditionalRequestParam,
 ):
-    return await use_case.execute(**pagination, context={"parent_id": workspace_id, "user_id": current_user.id})
+    memos = await use_case.execute(**pagination, context={"parent_id": workspace_id, "user_id": current_user.id})
+    return conditional.not_modified(make_page_etag(memos)) or memos
 
 
 @router.get("/{memo_id}", response_model=MemoRead)
@@ -51,11 +56,15 @@ async def get_memo(
     workspace_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     memo_id: uuid.UUID,
+    conditional: ConditionalRequestParam,
 ):
-    memo = await use_case.execute(memo_id, context={"parent_id": workspace_id, "user_id": current_user.id})
+    context = {"parent_id": workspace_id, "user_id": current_user.id}
+    if not_modified := await conditional.check_version(lambda: use_case.get_version(memo_id, context=context)):
+        return not_modified
+    memo = await use_case.execute(memo_id, context=context)
     if not memo:
         raise NotFoundException()
-    return memo
+    return conditional.not_modified(make_etag(memo.updated_at)) or memo
 
 
 @router.put("/{memo_id}", response_model=MemoRead)
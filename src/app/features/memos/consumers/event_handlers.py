@@ -42,7 +42,7 @@ async def handle_memo_created_event(event: DomainEvent):
             event_type=payload.event_type.value,
         )
         await create_notification_use_case.execute(notification_data)
-        logger.debug(f"Notification created for user {payload.user_id} regarding memo {payload.id}.")
+        logger.debug("Notification created for user %s regarding memo %s.", payload.user_id, payload.id)
     except Exception as e:
         raise EventProcessingException(f"Failed to create notification for memo {payload.id}") from e
 
@@ -72,7 +72,7 @@ async def handle_memo_updated_event(event: DomainEvent):
             event_type=payload.event_type.value,
         )
         await create_notification_use_case.execute(notification_data)
-        logger.debug(f"Notification created for user {payload.user_id} regarding memo {payload.id}.")
+        logger.debug("Notification created for user %s regarding memo %s.", payload.user_id, payload.id)
     except Exception as e:
         raise EventProcessingException(f"Failed to create notification for memo {payload.id}") from e
 
@@ -102,6 +102,6 @@ async def handle_memo_deleted_event(event: DomainEvent):
             event_type=payload.event_type.value,
         )
         await create_notification_use_case.execute(notification_data)
-        logger.debug(f"Notification created for user {payload.user_id} regarding memo {payload.id}.")
+        logger.debug("Notification created for user %s regarding memo %s.", payload.user_id, payload.id)
     except Exception as e:
         raise EventProcessingException(f"Failed to create notification for memo {payload.id}") from e
@@ -0,0 +1,34 @@
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.features.auth.deps import on_superuser
+from app.features.outbox.models import EventStatus
+from app.features.outbox.schemas import OutboxRead, OutboxReplay, OutboxReplayed
+from app.features.outbox.usecases.admin import GetOutboxEventsUseCase, ReplayOutboxEventsUseCase
+from app_base.base.deps.params.page import PaginationParam
+from app_base.base.schemas.paginated import PaginatedList
+
+router = APIRouter(prefix="/admin/outbox", tags=["Outbox"], dependencies=[Depends(on_superuser)])
+
+
+@router.get("/events", response_model=PaginatedList[OutboxRead])
+async def read_outbox_events(
+    pagination: PaginationParam,
+    use_case: Annotated[GetOutboxEventsUseCase, Depends()],
+    status: Annotated[Optional[EventStatus], Query(description="Filter by status, e.g. DEAD_LETTER")] = None,
+):
+    """Outbox events, oldest first, with their attempts and last error."""
+    return await use_case.execute(status=status, **pagination)
+
+
+@router.post("/replay", response_model=OutboxReplayed)
+async def replay_outbox_events(
+    body: OutboxReplay,
+    use_case: Annotated[ReplayOutboxEventsUseCase, Depends()],
+):
+    """
+    Put dead-lettered (and legacy failed) events back in the queue with fresh attempts:
+    all of them, or only `event_ids`.
+    """
+    return await use_case.execute(body)
@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+import logging
+import random
+from dataclasses import dataclass
+from typing import Sequence
+
+from app.features.outbox.metrics import observe_processed_event
+from app.features.outbox.models import EventStatus, Outbox
+from app.features.outbox.registry import dispatch_event
+from app_base.base.exceptions.event import InvalidEventPayloadException
+from app_base.base.schemas.event import DomainEvent
+from app_base.config import OutboxSettings
+
+logger = logging.getLogger(__name__)
+
+# Failures that a retry can not fix: dead-lettered at once
+NOT_RETRIABLE = (InvalidEventPayloadException,)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+
+    @classmethod
+    def from_settings(cls, settings: OutboxSettings) -> "RetryPolicy":
+        return cls(settings.OUTBOX_MAX_ATTEMPTS, settings.OUTBOX_RETRY_BASE_DELAY, settings.OUTBOX_RETRY_MAX_DELAY)
+
+    def delay(self, failures: int) -> float:
+        """
+        Exponential backoff with jitter: base_delay * 2^(failures - 1), capped at max_delay,
+        of which a random half is dropped, so that events failing together do not retry
+        together.
+        """
+        delay = min(self.base_delay * 2 ** (failures - 1), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def dispatch_outbox_event(event: Outbox, retry_policy: RetryPolicy) -> bool:
+    """
+    Dispatch one event to its handler and record the outcome on it; return whether it
+    succeeded. A failed event is scheduled for a retry (PENDING at a later
+    next_attempt_at) until out of attempts, then dead-lettered.
+    """
+    try:
+        await dispatch_event(
+            event.event_type,
+            DomainEvent(
+                id=event.id,
+                event_type=event.event_type,
+                payload=event.payload,
+                meta={
+                    "aggregate_type": event.aggregate_type,
+                    "aggregate_id": event.aggregate_id,
+                    "event_id": str(event.id),
+                },
+            ),
+        )
+    except Exception as e:
+        event.retry_count += 1
+        event.last_error = f"{type(e).__name__}: {e}"[:2000]
+        if isinstance(e, NOT_RETRIABLE) or event.retry_count >= retry_policy.max_attempts:
+            logger.error("Dead-lettered event %s after %d attempt(s): %s", event.id, event.retry_count, e)
+            event.status = EventStatus.DEAD_LETTER
+        else:
+            delay = retry_policy.delay(event.retry_count)
+            logger.warning(
+                "Failed to process event %s (attempt %d), retry in %.1fs: %s", event.id, event.retry_count, delay, e
+            )
+            event.status = EventStatus.PENDING
+            event.next_attempt_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=delay)
+        observe_processed_event(
+            event.created_at, succeeded=False, dead_lettered=event.status == EventStatus.DEAD_LETTER
+        )
+        return False
+    event.status = EventStatus.COMPLETED
+    event.processed_at = datetime.datetime.now(datetime.timezone.utc)
+    observe_processed_event(event.created_at, succeeded=True)
+    return True
+
+
+async def dispatch_outbox_batch(events: Sequence[Outbox], concurrency: int, retry_policy: RetryPolicy) -> None:
+    """
+    Dispatch a batch with at most `concurrency` handlers running at once.
+
+    A batch holds at most one event per aggregate (see
+    OutboxRepository.get_and_lock_pending_events), so its events are independent and all
+    run in parallel; the order within an aggregate comes from the claim, batch after batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def dispatch(event: Outbox) -> None:
+        async with semaphore:
+            await dispatch_outbox_event(event, retry_policy)
+
+    await asyncio.gather(*(dispatch(event) for event in events))
@@ -0,0 +1,113 @@
+import hashlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import IO, Optional
+
+import asyncpg
+
+from app.features.outbox.notifier import get_postgres_dsn
+from app_base.config import get_app_settings, get_outbox_settings
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxLeaderLock(ABC):
+    """
+    Elects the one process that runs the outbox scheduler among those that could (e.g. the
+    gunicorn workers of the app). The scheduler calls `acquire` before every batch: a
+    follower keeps trying, and takes over once the leader is gone.
+    """
+
+    @abstractmethod
+    async def acquire(self) -> bool:
+        """Take the lock if free; return whether this process holds it."""
+        pass
+
+    @abstractmethod
+    async def release(self) -> None:
+        """Give the lock up (if held)."""
+        pass
+
+
+class FileOutboxLeaderLock(OutboxLeaderLock):
+    """
+    An exclusive flock on a local file, released by the OS when the leader dies: one leader
+    per host, which is enough for SQLite (the database file is local too).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: Optional[IO] = None
+
+    async def acquire(self) -> bool:
+        if self._file is not None:
+            return True
+        import fcntl  # POSIX only, like the gunicorn deployment
+
+        file = open(self.path, "a")
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return False
+        self._file = file
+        logger.info("Outbox scheduler leadership acquired (lock file %s).", self.path)
+        return True
+
+    async def release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PostgresOutboxLeaderLock(OutboxLeaderLock):
+    """
+    A session-level advisory lock (pg_try_advisory_lock) held by a dedicated connection
+    outside the pool: one leader across all hosts. The lock goes with the connection, so a
+    dead leader frees it at once.
+
+    Leadership only saves work here: rows are claimed with SKIP LOCKED, so two schedulers
+    running for a moment (a leader whose connection was lost unnoticed) is still correct.
+    """
+
+    def __init__(self, dsn: str, key: int) -> None:
+        self.dsn = dsn
+        self.key = key
+        self._connection: Optional[asyncpg.Connection] = None
+        self._held = False
+
+    async def acquire(self) -> bool:
+        try:
+            if self._connection is None or self._connection.is_closed():
+                if self._held:
+                    logger.warning("Outbox scheduler leadership lost with its connection.")
+                self._held = False
+                self._connection = await asyncpg.connect(self.dsn)
+            if not self._held:
+                self._held = await self._connection.fetchval("SELECT pg_try_advisory_lock($1)", self.key)
+                if self._held:
+                    logger.info("Outbox scheduler leadership acquired (advisory lock %d).", self.key)
+        except (OSError, asyncpg.PostgresError) as exc:
+            logger.warning("Could not take the outbox scheduler leadership: %s", exc)
+            return False
+        return self._held
+
+    async def release(self) -> None:
+        if self._connection is not None:
+            # Closing the session releases the lock
+            await self._connection.close(timeout=1)
+            self._connection = None
+            self._held = False
+
+
+def create_outbox_leader_lock() -> OutboxLeaderLock:
+    settings = get_outbox_settings()
+    if (dsn := get_postgres_dsn()) is not None:
+        return PostgresOutboxLeaderLock(dsn, settings.OUTBOX_LEADER_LOCK_KEY)
+    path = settings.OUTBOX_LEADER_LOCK_FILE
+    if path is None:
+        database = hashlib.sha256(get_app_settings().DATABASE_URL.encode()).hexdigest()[:16]
+        path = os.path.join(tempfile.gettempdir(), f"outbox-leader-{database}.lock")
+    return FileOutboxLeaderLock(path)
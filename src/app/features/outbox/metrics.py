@@ -0,0 +1,38 @@
+import datetime
+
+from app.features.outbox.repos import OutboxRepository
+from app_base.core.database.transaction import AsyncTransaction
+from app_base.core.metrics import counter, gauge, histogram
+
+# Every worker sees the same table: report the maximum rather than the sum, over the live
+# workers only (the last value of a dead worker would otherwise be reported forever)
+OUTBOX_PENDING_EVENTS = gauge("outbox_pending_events", "Events waiting to be dispatched.", multiprocess_mode="livemax")
+OUTBOX_OLDEST_PENDING_AGE = gauge(
+    "outbox_oldest_pending_age_seconds", "Age of the oldest pending event (queue lag).", multiprocess_mode="livemax"
+)
+OUTBOX_PROCESSED_EVENTS = counter("outbox_processed_events_total", "Dispatched events, by outcome.", ["status"])
+OUTBOX_PROCESSING_LAG = histogram(
+    "outbox_processing_lag_seconds",
+    "Time from event creation to its successful dispatch.",
+    buckets=(0.5, 1, 2.5, 5, 10, 15, 30, 60, 120, 300, 600),
+)
+
+
+def _age(created_at: datetime.datetime) -> float:
+    if created_at.tzinfo is None:  # SQLite returns naive datetimes
+        created_at = created_at.replace(tzinfo=datetime.timezone.utc)
+    return max((datetime.datetime.now(datetime.timezone.utc) - created_at).total_seconds(), 0.0)
+
+
+def observe_processed_event(created_at: datetime.datetime, succeeded: bool, dead_lettered: bool = False) -> None:
+    OUTBOX_PROCESSED_EVENTS.labels("completed" if succeeded else "dead_letter" if dead_lettered else "failed").inc()
+    if succeeded:
+        OUTBOX_PROCESSING_LAG.observe(_age(created_at))
+
+
+async def collect_outbox_metrics() -> None:
+    """Metrics collector: refresh the outbox queue depth and lag gauges."""
+    async with AsyncTransaction() as session:
+        count, oldest = await OutboxRepository().get_pending_stats(session)
+    OUTBOX_PENDING_EVENTS.set(count)
+    OUTBOX_OLDEST_PENDING_AGE.set(_age(oldest) if oldest is not None else 0.0)
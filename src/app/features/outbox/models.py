@@ -2,7 +2,7 @@ import datetime
 import enum
 from typing import Any, Optional
 
-from sqlalchemy import JSON, DateTime, String
+from sqlalchemy import JSON, DateTime, Index, String, Text, func
 from sqlalchemy import Enum as EnumColumn
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,15 +10,28 @@ from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
 
 
 class EventStatus(str, enum.Enum):
-    PENDING = "PENDING"
-    PROCESSING = "PROCESSING"
+    PENDING = "PENDING"  # due at next_attempt_at (first attempt or retry)
+    PROCESSING = "PROCESSING"  # leased to locked_by until locked_until, then pending again
     COMPLETED = "COMPLETED"
-    FAILED = "FAILED"
+    FAILED = "FAILED"  # failed before retries were scheduled; replayable
+    DEAD_LETTER = "DEAD_LETTER"  # out of attempts or not retriable; replayable
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
 
 
 class Outbox(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "outbox"
+    __table_args__ = (
+        # Selection of due events: status = PENDING AND next_attempt_at <= now ORDER BY next_attempt_at
+        Index("ix_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
 
+    # Set by the app, to the microsecond: the events of one transaction keep their order
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
+    )
     aggregate_type: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     aggregate_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     event_type: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -28,4 +41,8 @@ class Outbox(Base, UUIDMixin, TimestampMixin):
     )
 
     retry_count: Mapped[int] = mapped_column(default=0)
+    next_attempt_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    locked_until: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     processed_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
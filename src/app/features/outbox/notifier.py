@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from contextlib import suppress
+from functools import lru_cache
+from typing import Optional
+
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app_base.config import get_app_settings, get_outbox_settings
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxNotifier:
+    """
+    Wakes the outbox scheduler up as soon as events are committed, instead of at its next poll.
+
+    In process: the commits of this process signal its own scheduler, which covers SQLite
+    (a single process owns the database file) and events dispatched where they are written.
+    """
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a notification, at most `timeout` seconds; return whether one came."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresOutboxNotifier(OutboxNotifier):
+    """
+    Also LISTENs, on a dedicated connection outside the pool, to the NOTIFY sent with the
+    commit of every outbox insert: events written by any process wake this one up.
+
+    The connection is reopened after a loss (and the scheduler woken up, as notifications
+    may have been missed in between); the polling fallback covers the outage itself.
+    """
+
+    def __init__(self, dsn: str, channel: str, reconnect_interval: float) -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_interval = reconnect_interval
+        self._task: Optional[asyncio.Task] = None
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        self.notify()
+
+    async def _listen_once(self) -> None:
+        """Listen until the connection is lost."""
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            await connection.add_listener(self.channel, self._on_notification)
+            logger.info("Listening to outbox notifications on channel '%s'.", self.channel)
+            self.notify()
+            await closed.wait()
+        finally:
+            with suppress(Exception):
+                await connection.close(timeout=1)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+                logger.warning("Outbox notification connection lost.")
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("Could not listen to outbox notifications: %s", exc)
+            await asyncio.sleep(self.reconnect_interval)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="outbox-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+def get_postgres_dsn() -> Optional[str]:
+    """asyncpg DSN of DATABASE_URL, for connections outside the pool; None if not Postgres."""
+    url = make_url(get_app_settings().DATABASE_URL)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_outbox_notifier() -> OutboxNotifier:
+    settings = get_outbox_settings()
+    if settings.OUTBOX_NOTIFY_ENABLED and (dsn := get_postgres_dsn()) is not None:
+        return PostgresOutboxNotifier(
+            dsn=dsn,
+            channel=settings.OUTBOX_NOTIFY_CHANNEL,
+            reconnect_interval=settings.OUTBOX_LISTEN_RECONNECT_INTERVAL,
+        )
+    return OutboxNotifier()
+
+
+async def notify_outbox_insert(session: AsyncSession) -> None:
+    """
+    Signal an outbox insert, delivered when the session commits (never on rollback): a
+    NOTIFY in the transaction on Postgres, plus the in-process notifier.
+    """
+    settings = get_outbox_settings()
+    if not settings.OUTBOX_NOTIFY_ENABLED:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(select(func.pg_notify(settings.OUTBOX_NOTIFY_CHANNEL, "")))
+    notifier = get_outbox_notifier()
+    event.listen(session.sync_session, "after_commit", lambda _: notifier.notify(), once=True)
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Any, Callable, Coroutine, Dict
 
 from app_base.base.schemas.event import DomainEvent
+from app_base.core.tracing import start_span
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ def register_event_handler(event_type: str | Enum):
         if event_type_str in EVENT_HANDLER_REGISTRY:
             # Raise an error if a handler for the same event type is already registered
             raise ValueError(f"Handler for event type '{event_type_str}' is already registered.")
-        logger.info(f"Registering handler for event type '{event_type_str}'.")
+        logger.info("Registering handler for event type '%s'.", event_type_str)
         EVENT_HANDLER_REGISTRY[event_type_str] = func
         return func
 
@@ -35,8 +36,10 @@ async def dispatch_event(event_type: str | Enum, event: DomainEvent):
     event_type_str = event_type.value if isinstance(event_type, Enum) else event_type
     handler = EVENT_HANDLER_REGISTRY.get(event_type_str)
     if handler:
-        logger.info(f"Dispatching event '{event_type_str}' to handler {handler.__name__}.")
+        logger.debug("Dispatching event '%s' to handler %s.", event_type_str, handler.__name__)
         # The handler is responsible for creating its own dependencies since it runs outside the DI container
-        await handler(event)
+        attributes = {"event.type": event_type_str, "event.id": str(event.id), "event.handler": handler.__name__}
+        with start_span("outbox.dispatch", attributes=attributes):
+            await handler(event)
     else:
-        logger.warning(f"No handler registered for event type '{event_type_str}'.")
+        logger.warning("No handler registered for event type '%s'.", event_type_str)
@@ -1,9 +1,13 @@
-from typing import Sequence
+import datetime
+import uuid
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.features.outbox.models import EventStatus, Outbox
+from app.features.outbox.notifier import notify_outbox_insert
 from app.features.outbox.schemas import OutboxCreate, OutboxUpdate
 from app_base.base.repos.base import BaseRepository
 
@@ -11,17 +15,120 @@ from app_base.base.repos.base import BaseRepository
 class OutboxRepository(BaseRepository[Outbox, OutboxCreate, OutboxUpdate]):
     model = Outbox
 
+    async def create(self, session: AsyncSession, obj_in: OutboxCreate, **update_fields: Any) -> Outbox:
+        """Insert an event; the outbox scheduler is woken up when the transaction commits."""
+        event = await super().create(session, obj_in, **update_fields)
+        await notify_outbox_insert(session)
+        return event
+
     async def get_and_lock_pending_events(self, session: AsyncSession, limit: int = 100) -> Sequence[Outbox]:
         """
-        Retrieves and locks a batch of pending outbox events to prevent race conditions
-        from multiple publisher instances.
+        Retrieves and locks a batch of due events, to prevent race conditions from multiple
+        publisher instances: pending events whose next_attempt_at is reached, and processing
+        events whose lease expired (their worker died or got stuck).
+
+        Events are skipped while an older event of their aggregate is still pending (waiting
+        for a retry, or due but beyond the limit or locked by another worker) or processing,
+        so that the events of an aggregate are dispatched in order: one event per aggregate
+        and batch.
         """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        older = aliased(Outbox)
+        blocked_by_older = (
+            select(older.id)
+            .where(
+                older.aggregate_id == self.model.aggregate_id,
+                older.aggregate_type == self.model.aggregate_type,
+                older.created_at < self.model.created_at,
+                # Due or not, claimable in this batch or not: only its head goes out
+                older.status.in_([EventStatus.PENDING, EventStatus.PROCESSING]),
+            )
+            .exists()
+        )
+        due = or_(
+            and_(self.model.status == EventStatus.PENDING, self.model.next_attempt_at <= now),
+            # Expired lease, or claimed before leases existed
+            and_(
+                self.model.status == EventStatus.PROCESSING,
+                or_(self.model.locked_until.is_(None), self.model.locked_until <= now),
+            ),
+        )
         stmt = (
             select(self.model)
-            .where(self.model.status == EventStatus.PENDING)
-            .order_by(self.model.created_at)
+            .where(due, ~blocked_by_older)
+            .order_by(self.model.next_attempt_at)
             .limit(limit)
             .with_for_update(skip_locked=True)
         )
         result = await session.execute(stmt)
         return result.scalars().all()
+
+    async def renew_leases(
+        self,
+        session: AsyncSession,
+        event_ids: Sequence[uuid.UUID],
+        worker_id: str,
+        locked_until: datetime.datetime,
+    ) -> set[uuid.UUID]:
+        """Extend the lease of the events still leased to `worker_id`; return their ids."""
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id.in_(event_ids),
+                self.model.status == EventStatus.PROCESSING,
+                self.model.locked_by == worker_id,
+            )
+            .values(locked_until=locked_until)
+            .returning(self.model.id)
+        )
+        result = await session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def save_leased_outcome(self, session: AsyncSession, event: Outbox, worker_id: str) -> bool:
+        """
+        Write the outcome of a dispatched event and release its lease, only if the event is
+        still leased to `worker_id`; return whether it was. A lost lease (expired, and the
+        event claimed by another worker) leaves the row to its new owner.
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == event.id,
+                self.model.status == EventStatus.PROCESSING,
+                self.model.locked_by == worker_id,
+            )
+            .values(
+                status=event.status,
+                retry_count=event.retry_count,
+                last_error=event.last_error,
+                next_attempt_at=event.next_attempt_at,
+                processed_at=event.processed_at,
+                locked_by=None,
+                locked_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return result.rowcount == 1
+
+    async def replay(
+        self, session: AsyncSession, statuses: Sequence[EventStatus], event_ids: Optional[Sequence[uuid.UUID]] = None
+    ) -> int:
+        """Make events of the given statuses (all, or only `event_ids`) due again, with fresh attempts."""
+        stmt = update(self.model).where(self.model.status.in_(statuses))
+        if event_ids is not None:
+            stmt = stmt.where(self.model.id.in_(event_ids))
+        stmt = stmt.values(
+            status=EventStatus.PENDING,
+            retry_count=0,
+            last_error=None,
+            next_attempt_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+        result = await session.execute(stmt)
+        return result.rowcount
+
+    async def get_pending_stats(self, session: AsyncSession) -> tuple[int, Optional[datetime.datetime]]:
+        """Number of pending events and creation time of the oldest one."""
+        stmt = select(func.count(), func.min(self.model.created_at)).where(self.model.status == EventStatus.PENDING)
+        count, oldest = (await session.execute(stmt)).one()
+        return count, oldest
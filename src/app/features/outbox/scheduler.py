@@ -1,91 +1,235 @@
+import asyncio
 import datetime
 import logging
-from contextlib import asynccontextmanager
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Optional, Sequence
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 
 import app.features.memos.consumers.event_handlers  # noqa: F401
+from app.features.outbox.dispatcher import RetryPolicy, dispatch_outbox_batch
+from app.features.outbox.leader import OutboxLeaderLock, create_outbox_leader_lock
 from app.features.outbox.models import EventStatus
-from app.features.outbox.registry import dispatch_event
+from app.features.outbox.notifier import OutboxNotifier, get_outbox_notifier
 from app.features.outbox.repos import OutboxRepository
-from app_base.base.schemas.event import DomainEvent
+from app_base.config import get_outbox_settings
 from app_base.core.database.transaction import AsyncTransaction
+from app_base.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
-async def process_outbox_events_job():
+def outbox_worker_id() -> str:
+    """Identifies this process as the holder of outbox leases."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@asynccontextmanager
+async def keep_leases(event_ids: Sequence[uuid.UUID], worker_id: str, duration: float) -> AsyncIterator[None]:
+    """Renew the lease of the claimed events every third of its duration while the block runs."""
+    repo = OutboxRepository()
+    stopping = asyncio.Event()
+
+    async def renew() -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stopping.wait(), duration / 3)
+                return
+            locked_until = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=duration)
+            try:
+                async with AsyncTransaction() as session:
+                    held = await repo.renew_leases(session, event_ids, worker_id, locked_until)
+            except Exception as e:
+                logger.warning("Could not renew the lease of outbox events: %s", e)
+                continue
+            if len(held) < len(event_ids):
+                logger.warning("Lease of %d outbox event(s) lost during dispatch.", len(event_ids) - len(held))
+
+    task = asyncio.create_task(renew(), name="outbox-lease")
+    try:
+        yield
+    finally:
+        stopping.set()
+        await task
+
+
+@traced("outbox.process_batch")
+async def process_outbox_events_job() -> int:
     """
     A job function to be run by the scheduler.
 
     Simply processes pending outbox events. (Not ideal for production use. Just a demo.)
+    Returns the number of events dispatched (successfully or not).
+
+    Up to OUTBOX_BATCH_SIZE events are dispatched per run, OUTBOX_DISPATCH_CONCURRENCY at
+    a time; failures are retried with backoff, then dead-lettered (see
+    dispatch_outbox_batch). A batch claims one event per aggregate, the oldest, so the
+    events of an aggregate go out in order, one batch after the other.
 
-    TODO: more sophisticated scheduling, backoff, batching, exception handling, etc.
+    The batch is leased to this process for OUTBOX_LEASE_DURATION, renewed while it runs.
+    If the process dies, the lease expires and another run claims the events again: that
+    counts as a failed attempt, so an event crashing its workers ends dead-lettered. The
+    outcome of an event is only written while its lease is still held by this process.
     """
-    logger.info("Running outbox processor job...")
+    logger.debug("Running outbox processor job...")
+    settings = get_outbox_settings()
+    retry_policy = RetryPolicy.from_settings(settings)
+    worker_id = outbox_worker_id()
 
     async with AsyncTransaction() as session:
         try:
             repo = OutboxRepository()
 
-            events_to_process = await repo.get_and_lock_pending_events(session, limit=10)
+            events_to_process = await repo.get_and_lock_pending_events(session, limit=settings.OUTBOX_BATCH_SIZE)
 
             if not events_to_process:
-                logger.info("No pending outbox events found.")
-                return
+                logger.debug("No pending outbox events found.")
+                return 0
 
-            logger.info(f"Found {len(events_to_process)} events to process.")
+            logger.info("Found %d events to process.", len(events_to_process))
 
-            # Mark as processing
+            # Mark as processing, leased to this worker
+            locked_until = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+                seconds=settings.OUTBOX_LEASE_DURATION
+            )
+            to_dispatch = []
             for event in events_to_process:
+                if event.status == EventStatus.PROCESSING:
+                    logger.warning("Lease of event %s by %s expired: claimed again.", event.id, event.locked_by)
+                    event.retry_count += 1
+                    event.last_error = f"Lease of {event.locked_by} expired"
+                    if event.retry_count >= retry_policy.max_attempts:
+                        event.status = EventStatus.DEAD_LETTER
+                        event.locked_by = event.locked_until = None
+                        continue
                 event.status = EventStatus.PROCESSING
+                event.locked_by = worker_id
+                event.locked_until = locked_until
+                to_dispatch.append(event)
             await session.commit()
 
-            # Process each event
-            for event in events_to_process:
-                try:
-                    await dispatch_event(
-                        event.event_type,
-                        DomainEvent(
-                            id=event.id,
-                            event_type=event.event_type,
-                            payload=event.payload,
-                            meta={
-                                "aggregate_type": event.aggregate_type,
-                                "aggregate_id": event.aggregate_id,
-                                "event_id": str(event.id),
-                            },
-                        ),
-                    )
-                    event.status = EventStatus.COMPLETED
-                    event.processed_at = datetime.datetime.now(datetime.timezone.utc)
-                except Exception as e:
-                    logger.error(f"Failed to process event {event.id}: {e}")
-                    event.status = EventStatus.FAILED
-                    event.retry_count += 1
-                session.add(event)
+            event_ids = [event.id for event in to_dispatch]
+            async with keep_leases(event_ids, worker_id, settings.OUTBOX_LEASE_DURATION):
+                await dispatch_outbox_batch(
+                    to_dispatch,
+                    concurrency=settings.OUTBOX_DISPATCH_CONCURRENCY,
+                    retry_policy=retry_policy,
+                )
+            # Outcomes are written only where the lease is still ours, never flushed blindly
+            for event in to_dispatch:
+                session.expunge(event)
+            for event in to_dispatch:
+                if not await repo.save_leased_outcome(session, event, worker_id):
+                    # The lease expired and another worker claimed the event: leave it to that worker
+                    logger.warning("Lease of event %s lost during dispatch: outcome dropped.", event.id)
 
             await session.commit()
-            logger.info("Outbox processor job finished.")
+            logger.debug("Outbox processor job finished.")
+            return len(events_to_process)
 
         except Exception as e:
-            logger.error(f"Error during outbox processing job: {e}")
+            logger.error("Error during outbox processing job: %s", e)
             await session.rollback()
+            return 0
+
+
+class OutboxScheduler:
+    """
+    Runs process_outbox_events_job as soon as events are committed (see OutboxNotifier),
+    and again right away while batches come back non-empty.
+
+    Polling stays as a fallback for missed notifications: the interval starts at
+    `min_interval` and doubles while the outbox is idle, up to `max_interval`, so an idle
+    database is barely polled.
+
+    With a `leader` lock, batches only run while this process holds it; otherwise the lock
+    is tried again every `leader_retry_interval`.
+
+    `stop` lets the batch in progress finish, instead of cancelling it mid-dispatch.
+    """
+
+    def __init__(
+        self,
+        notifier: OutboxNotifier,
+        min_interval: float,
+        max_interval: float,
+        leader: Optional[OutboxLeaderLock] = None,
+        leader_retry_interval: float = 5.0,
+    ):
+        self.notifier = notifier
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.leader = leader
+        self.leader_retry_interval = leader_retry_interval
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        interval = self.min_interval
+        while not self._stopping.is_set():
+            try:
+                interval = await self._run_once(interval)
+            except Exception:
+                # A failed commit or rollback, or a notifier error: keep running, as this
+                # process may hold the leadership and no other would take over
+                logger.exception("Outbox scheduler iteration failed; retrying in %.1f s.", interval)
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), interval)
+                interval = min(interval * 2, self.max_interval)
+
+    async def _run_once(self, interval: float) -> float:
+        """Run a batch, or wait for events; return the next polling interval."""
+        if self.leader is not None and not await self.leader.acquire():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self.leader_retry_interval)
+            return interval
+        if await process_outbox_events_job():
+            return self.min_interval
+        if self._stopping.is_set():
+            return interval
+        if await self.notifier.wait(interval):
+            return self.min_interval
+        return min(interval * 2, self.max_interval)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self.notifier.notify()
 
 
 @asynccontextmanager
 async def scheduler_lifespan(app: FastAPI):
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(
-        process_outbox_events_job,
-        "interval",
-        seconds=10,
-        id="process_outbox",
-        max_instances=1,
+    """
+    Run the outbox scheduler in the app, in the one process elected among its workers
+    (see OutboxLeaderLock); nothing when OUTBOX_IN_APP_SCHEDULER_ENABLED is off, as the
+    outbox worker dispatches then.
+    """
+    settings = get_outbox_settings()
+    if not settings.OUTBOX_IN_APP_SCHEDULER_ENABLED:
+        logger.info("In-app scheduler disabled: outbox events are dispatched by the outbox worker.")
+        yield
+        return
+    notifier = get_outbox_notifier()
+    leader = create_outbox_leader_lock()
+    scheduler = OutboxScheduler(
+        notifier,
+        settings.OUTBOX_POLL_MIN_INTERVAL,
+        settings.OUTBOX_POLL_MAX_INTERVAL,
+        leader=leader,
+        leader_retry_interval=settings.OUTBOX_LEADER_RETRY_INTERVAL,
     )
-    scheduler.start()
+    await notifier.start()
+    task = asyncio.create_task(scheduler.run(), name="outbox-scheduler")
     logger.info("Scheduler started.")
-    yield
-    scheduler.shutdown()
-    logger.info("Scheduler shut down.")
+    try:
+        yield
+    finally:
+        scheduler.stop()
+        try:
+            await asyncio.wait_for(task, timeout=settings.OUTBOX_SHUTDOWN_TIMEOUT)
+        except TimeoutError:
+            logger.warning("Outbox batch still running at shutdown: cancelled.")
+        await leader.release()
+        await notifier.stop()
+        logger.info("Scheduler shut down.")
@@ -1,7 +1,8 @@
 import datetime
-from typing import Any, TypedDict
+from typing import Any, Optional, TypedDict
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.features.outbox.models import EventStatus
 from app_base.base.schemas.mixin import TimestampSchemaMixin, UUIDSchemaMixin
@@ -33,6 +34,31 @@ class OutboxRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
     payload: dict[str, Any]
     status: EventStatus
     retry_count: int
+    next_attempt_at: datetime.datetime
+    last_error: str | None = None
+    locked_by: str | None = None
+    locked_until: datetime.datetime | None = None
     processed_at: datetime.datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class OutboxReplay(BaseModel):
+    statuses: list[EventStatus] = Field(
+        default=[EventStatus.DEAD_LETTER, EventStatus.FAILED],
+        min_length=1,
+        description="Replay the events of these statuses.",
+    )
+    event_ids: Optional[list[UUID]] = Field(default=None, description="Only these events (default: all of them).")
+
+    @field_validator("statuses")
+    @classmethod
+    def only_finished_statuses(cls, statuses: list[EventStatus]) -> list[EventStatus]:
+        # Pending events are queued already and processing ones may be dispatched twice
+        if in_flight := {EventStatus.PENDING, EventStatus.PROCESSING} & set(statuses):
+            raise ValueError(f"Can not replay {', '.join(sorted(in_flight))} events.")
+        return statuses
+
+
+class OutboxReplayed(BaseModel):
+    replayed: int = Field(..., description="Number of events put back in the queue.")
@@ -1,13 +1,15 @@
 import datetime
-from typing import Annotated
+from typing import Annotated, Optional, Sequence
 from uuid import UUID
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.outbox.models import EventStatus, Outbox
+from app.features.outbox.notifier import notify_outbox_insert
 from app.features.outbox.repos import OutboxRepository
 from app.features.outbox.schemas import OutboxCreate, OutboxUpdate
+from app_base.base.schemas.paginated import PaginatedList
 
 
 class OutboxService:
@@ -48,3 +50,27 @@ class OutboxService:
             update_data.retry_count = retry_count
 
         return await self.repo.update_by_pk(session, pk=event_id, obj_in=update_data)
+
+    async def get_events(
+        self, session: AsyncSession, status: Optional[EventStatus] = None, offset: int = 0, limit: int = 100
+    ) -> PaginatedList:
+        """Events, oldest first, optionally only those of one status (e.g. the dead letters)."""
+        where = [Outbox.status == status] if status is not None else []
+        return await self.repo.get_multi(
+            session, offset=offset, limit=limit, where=where, order_by=[Outbox.created_at.asc()]
+        )
+
+    async def replay_events(
+        self,
+        session: AsyncSession,
+        statuses: Sequence[EventStatus],
+        event_ids: Optional[Sequence[UUID]] = None,
+    ) -> int:
+        """
+        Put failed or dead-lettered events back in the queue with fresh attempts; return how
+        many. The outbox scheduler is woken up when the transaction commits.
+        """
+        replayed = await self.repo.replay(session, statuses, event_ids)
+        if replayed:
+            await notify_outbox_insert(session)
+        return replayed
@@ -0,0 +1,38 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from app.features.outbox.models import EventStatus
+from app.features.outbox.schemas import OutboxReplay, OutboxReplayed
+from app.features.outbox.services import OutboxService
+from app_base.base.schemas.paginated import PaginatedList
+from app_base.base.services.base import TContextKwargs
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+
+
+class GetOutboxEventsUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[OutboxService, Depends()]):
+        self.service = service
+
+    async def execute(
+        self,
+        status: Optional[EventStatus],
+        offset: int,
+        limit: int,
+        context: Optional[TContextKwargs] = None,
+    ) -> PaginatedList:
+        async with AsyncTransaction() as session:
+            return await self.service.get_events(session, status=status, offset=offset, limit=limit)
+
+
+class ReplayOutboxEventsUseCase(BaseUseCase):
+    """Queue failed or dead-lettered events again, e.g. once the handler is fixed."""
+
+    def __init__(self, service: Annotated[OutboxService, Depends()]):
+        self.service = service
+
+    async def execute(self, body: OutboxReplay, context: Optional[TContextKwargs] = None) -> OutboxReplayed:
+        async with AsyncTransaction() as session:
+            replayed = await self.service.replay_events(session, body.statuses, body.event_ids)
+        return OutboxReplayed(replayed=replayed)
@@ -0,0 +1,55 @@
+"""
+Standalone outbox worker: dispatches outbox events out of the web app, scaled on its own.
+
+    python -m app.features.outbox.worker
+
+Run it with OUTBOX_IN_APP_SCHEDULER_ENABLED=false on the app. On Postgres, any number of
+workers share the outbox (rows are claimed with SKIP LOCKED); on other databases, only one
+worker per host dispatches at a time (see FileOutboxLeaderLock). SIGTERM or SIGINT stops
+the worker once its batch in progress is done.
+"""
+
+import asyncio
+import signal
+
+import app.main  # noqa: F401  (registers every model)
+from app.features.outbox.leader import create_outbox_leader_lock
+from app.features.outbox.notifier import get_outbox_notifier, get_postgres_dsn
+from app.features.outbox.scheduler import OutboxScheduler
+from app_base.config import get_outbox_settings
+from app_base.core.log import logger
+
+STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+async def run_worker() -> None:
+    settings = get_outbox_settings()
+    notifier = get_outbox_notifier()
+    leader = None if get_postgres_dsn() is not None else create_outbox_leader_lock()
+    scheduler = OutboxScheduler(
+        notifier,
+        settings.OUTBOX_POLL_MIN_INTERVAL,
+        settings.OUTBOX_POLL_MAX_INTERVAL,
+        leader=leader,
+        leader_retry_interval=settings.OUTBOX_LEADER_RETRY_INTERVAL,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in STOP_SIGNALS:
+        loop.add_signal_handler(signum, scheduler.stop)
+    await notifier.start()
+    logger.info("Outbox worker started.")
+    try:
+        await scheduler.run()
+    finally:
+        for signum in STOP_SIGNALS:
+            loop.remove_signal_handler(signum)
+        if leader is not None:
+            await leader.release()
+        await notifier.stop()
+        logger.info("Outbox worker stopped.")
+        # Wait for the records still queued to the background writer (LOG_ENQUEUE)
+        await logger.complete()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
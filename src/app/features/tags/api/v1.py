@@ -9,6 +9,7 @@ from app.features.tags.usecases.crud import (
     GetMultiTagUseCase,
     GetTagUseCase,
 )
+from app_base.base.deps.conditional import ConditionalRequestParam, make_etag, make_page_etag
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.paginated import PaginatedList
@@ -25,8 +26,10 @@ async def get_tags(
     use_case: Annotated[GetMultiTagUseCase, Depends()],
     workspace_id: uuid.UUID,
     pagination: PaginationParam,
+    conditional: ConditionalRequestParam,
 ):
-    return await use_case.execute(**pagination, context={"parent_id": workspace_id})
+    tags = await use_case.execute(**pagination, context={"parent_id": workspace_id})
+    return conditional.not_modified(make_page_etag(tags)) or tags
 
 
 @router.get("/{tag_id}", response_model=TagRead)
@@ -34,8 +37,12 @@ async def get_tag(
     use_case: Annotated[GetTagUseCase, Depends()],
     workspace_id: uuid.UUID,
     tag_id: uuid.UUID,
+    conditional: ConditionalRequestParam,
 ):
-    tag = await use_case.execute(tag_id, context={"parent_id": workspace_id})
+    context = {"parent_id": workspace_id}
+    if not_modified := await conditional.check_version(lambda: use_case.get_version(tag_id, context=context)):
+        return not_modified
+    tag = await use_case.execute(tag_id, context=context)
     if not tag:
         raise NotFoundException()
-    return tag
+    return conditional.not_modified(make_etag(tag.updated_at)) or tag
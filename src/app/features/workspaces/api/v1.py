@@ -17,6 +17,7 @@ from app.features.workspaces.usecases.crud import (
     GetWorkspaceUseCase,
     UpdateWorkspaceUseCase,
 )
+from app_base.base.deps.conditional import ConditionalRequestParam, make_etag, make_page_etag
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
@@ -39,8 +40,10 @@ async def get_workspaces(
     use_case: Annotated[GetMultiWorkspaceUseCase, Depends()],
     current_user: Annotated[User, Depends(get_current_user)],
     pagination: PaginationParam,
+    conditional: ConditionalRequestParam,
 ):
-    return await use_case.execute(**pagination, context={"user_id": current_user.id})
+    workspaces = await use_case.execute(**pagination, context={"user_id": current_user.id})
+    return conditional.not_modified(make_page_etag(workspaces)) or workspaces
 
 
 @router.get("/{workspace_id}", response_model=WorkspaceRead)
@@ -48,11 +51,15 @@ async def get_workspace(
     use_case: Annotated[GetWorkspaceUseCase, Depends()],
     current_user: Annotated[User, Depends(get_current_user)],
     workspace_id: uuid.UUID,
+    conditional: ConditionalRequestParam,
 ):
-    workspace = await use_case.execute(workspace_id, context={"user_id": current_user.id})
+    context = {"user_id": current_user.id}
+    if not_modified := await conditional.check_version(lambda: use_case.get_version(workspace_id, context=context)):
+        return not_modified
+    workspace = await use_case.execute(workspace_id, context=context)
     if not workspace:
         raise NotFoundException()
-    return workspace
+    return conditional.not_modified(make_etag(workspace.updated_at)) or workspace
 
 
 @router.put("/{workspace_id}", response_model=WorkspaceRead)
@@ -2,22 +2,39 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
-from starlette.responses import RedirectResponse
+from starlette.responses import RedirectResponse, Response
 
+from app.features.auth.deps import is_superuser_request
+from app.features.auth.passwords import password_hasher_lifespan
+from app.features.outbox.metrics import collect_outbox_metrics
 from app.features.outbox.scheduler import scheduler_lifespan
 from app.router import router
+from app_base.adapter.rate_limit import lifespan_rate_limit
 from app_base.base.exceptions.handler import set_exception_handler
+from app_base.config import get_observability_settings
 from app_base.core import middlewares
 from app_base.core.log import logger
+from app_base.core.loop_monitor import loop_monitor_lifespan
+from app_base.core.metrics import metrics_available, metrics_lifespan, register_metrics_collector, render_metrics
+from app_base.core.tracing import tracing_lifespan
 
 
 def get_lifespan():
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("Starting app lifespan")
-        async with scheduler_lifespan(app):
+        async with (
+            tracing_lifespan(app),
+            loop_monitor_lifespan(app),
+            scheduler_lifespan(app),
+            lifespan_rate_limit(app),
+            metrics_lifespan(app),
+            password_hasher_lifespan(app),
+        ):
             yield
         logger.info("End of app lifespan")
+        # Wait for the records still queued to the background writer (LOG_ENQUEUE)
+        await logger.complete()
 
     return lifespan
 
@@ -41,6 +58,20 @@ def create_app():
     async def root():
         return RedirectResponse(url="/docs")
 
+    if get_observability_settings().METRICS_ENABLED and metrics_available():
+        register_metrics_collector(collect_outbox_metrics)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            body, content_type = render_metrics()
+            return Response(body, media_type=content_type)
+
+    # Load shedding (innermost, so shed responses still get the headers of the middlewares below)
+    middlewares.concurrency_limit.add_middleware(app)
+    # Root span of the request (inside the request ID middleware, which the trace id derives from)
+    middlewares.tracing.add_middleware(app)
+    # On-demand profiling of admin requests (X-Profile header), saved under the request ID
+    middlewares.profiler.add_middleware(app, authorize=is_superuser_request)
     # Request ID middleware
     middlewares.request_id_middleware.add_middleware(app)
     # Security middleware
@@ -48,7 +79,10 @@ def create_app():
     middlewares.security_header.add_middleware(app)
     # Others
     middlewares.timeout_middleware.add_middleware(app)
+    middlewares.server_timing.add_middleware(app)
+    middlewares.metrics.add_middleware(app)
     middlewares.query_counter.add_middleware(app)
+    middlewares.compression.add_middleware(app)
 
     app.include_router(router)
 
@@ -5,9 +5,13 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.api import v1_admin_router, v1_login_router, v1_users_router
+from app.features.auth.deps import rate_limit
+from app.features.diagnostics.api import v1_diagnostics_router
 from app.features.memos.api.v1 import router as v1_memos_router
+from app.features.outbox.api import v1_outbox_router
 from app.features.tags.api.v1 import router as v1_tags_router
 from app.features.workspaces.api.v1 import router as v1_workspaces_router
+from app_base.base.deps.timeout import request_timeout
 from app_base.core.database.deps import get_session
 
 router = APIRouter(prefix="/api")
@@ -19,7 +23,7 @@ async def health():
     return Response(status_code=204)
 
 
-@router.get("/health/deep", status_code=status.HTTP_200_OK)
+@router.get("/health/deep", status_code=status.HTTP_200_OK, dependencies=[Depends(request_timeout(5))])
 async def deep_health_check(session: Annotated[AsyncSession, Depends(get_session)]):
     try:
         await session.execute(text("SELECT 1"))
@@ -31,12 +35,14 @@ async def deep_health_check(session: Annotated[AsyncSession, Depends(get_session
         )
 
 
-# Feature routers
+# Feature routers (rate limits: requests per user and minute)
 v1_router.include_router(v1_admin_router)
 v1_router.include_router(v1_users_router)
 v1_router.include_router(v1_login_router)
-v1_router.include_router(v1_workspaces_router)
-v1_router.include_router(v1_memos_router)
-v1_router.include_router(v1_tags_router)
+v1_router.include_router(v1_workspaces_router, dependencies=[Depends(rate_limit(600, name="workspaces"))])
+v1_router.include_router(v1_memos_router, dependencies=[Depends(rate_limit(300, per_workspace=True, name="memos"))])
+v1_router.include_router(v1_tags_router, dependencies=[Depends(rate_limit(600, name="tags"))])
+v1_router.include_router(v1_diagnostics_router)
+v1_router.include_router(v1_outbox_router)
 
 router.include_router(v1_router)
@@ -0,0 +1,11 @@
+from app_base.adapter.rate_limit.factory import RateLimitBackendFactory, get_rate_limit_backend
+from app_base.adapter.rate_limit.interface import RateLimitBackend, RateLimitResult
+from app_base.adapter.rate_limit.lifespan import lifespan_rate_limit
+
+__all__ = [
+    "RateLimitBackend",
+    "RateLimitBackendFactory",
+    "RateLimitResult",
+    "get_rate_limit_backend",
+    "lifespan_rate_limit",
+]
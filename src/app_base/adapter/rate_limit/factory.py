@@ -0,0 +1,30 @@
+import functools
+
+from app_base.adapter.rate_limit.interface import RateLimitBackend
+from app_base.adapter.rate_limit.providers import MemoryRateLimitBackend, RedisRateLimitBackend
+from app_base.config import RateLimitSettings, get_rate_limit_settings
+
+
+class RateLimitBackendFactory:
+    _providers: dict[str, type[RateLimitBackend]] = {
+        "memory": MemoryRateLimitBackend,
+        "redis": RedisRateLimitBackend,
+    }
+
+    @classmethod
+    def register(cls, name: str, provider_class: type[RateLimitBackend]) -> None:
+        """Plug in another shared backend (e.g. a database table)."""
+        cls._providers[name] = provider_class
+
+    @classmethod
+    def create_backend(cls, config: RateLimitSettings) -> RateLimitBackend:
+        provider_name = config.RATE_LIMIT_BACKEND
+        if provider_name not in cls._providers:
+            raise ValueError(f"Unsupported rate limit backend: {provider_name}")
+        return cls._providers[provider_name].from_config(config)
+
+
+@functools.lru_cache
+def get_rate_limit_backend() -> RateLimitBackend:
+    """The process-wide rate limit backend, created on first use."""
+    return RateLimitBackendFactory.create_backend(get_rate_limit_settings())
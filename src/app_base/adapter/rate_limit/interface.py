@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+from app_base.config import RateLimitSettings
+
+
+class RateLimitResult:
+    """Outcome of one hit on a rate limit bucket."""
+
+    def __init__(self, allowed: bool, limit: int, remaining: int, reset_after: float, retry_after: float):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.reset_after = reset_after  # seconds until the bucket is full again
+        self.retry_after = retry_after  # seconds until the next request is allowed (0 if allowed)
+
+
+def gcra(tat: float, now: float, limit: int, period: float) -> tuple[float, RateLimitResult]:
+    """
+    Generic Cell Rate Algorithm: a token bucket of `limit` requests refilled over `period`
+    seconds, stored as a single "theoretical arrival time" (TAT) per key.
+
+    Return the new TAT (unchanged when denied) and the result of the hit.
+    """
+    emission_interval = period / limit
+    tat = max(tat, now)
+    new_tat = tat + emission_interval
+    allow_at = new_tat - period
+    if now < allow_at:
+        return tat, RateLimitResult(False, limit, 0, tat - now, allow_at - now)
+    remaining = int((now - allow_at) / emission_interval + 1e-9)
+    return new_tat, RateLimitResult(True, limit, remaining, new_tat - now, 0.0)
+
+
+class RateLimitBackend(ABC):
+    @classmethod
+    @abstractmethod
+    def from_config(cls, settings: RateLimitSettings) -> "RateLimitBackend":
+        """Create a rate limit backend from configuration."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources of the backend."""
+        pass
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult:
+        """Count one request against the bucket `key` (`limit` requests per `period` seconds)."""
+        pass
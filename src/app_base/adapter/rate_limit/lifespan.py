@@ -0,0 +1,20 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app_base.adapter.rate_limit.factory import get_rate_limit_backend
+from app_base.config import get_rate_limit_settings
+from app_base.core.log import logger
+
+
+@asynccontextmanager
+async def lifespan_rate_limit(app: FastAPI):
+    settings = get_rate_limit_settings()
+    logger.info(f"Initializing rate limit backend: {settings.RATE_LIMIT_BACKEND}")
+    backend = get_rate_limit_backend()
+
+    yield
+
+    # Cleanup on shutdown
+    await backend.close()
+    get_rate_limit_backend.cache_clear()
@@ -0,0 +1,4 @@
+from .memory import MemoryRateLimitBackend
+from .redis import RedisRateLimitBackend
+
+__all__ = ["MemoryRateLimitBackend", "RedisRateLimitBackend"]
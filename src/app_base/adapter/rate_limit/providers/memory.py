@@ -0,0 +1,26 @@
+import time
+
+from cachetools import LRUCache
+
+from app_base.adapter.rate_limit.interface import RateLimitBackend, RateLimitResult, gcra
+from app_base.config import RateLimitSettings
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets kept in process: limits apply per worker."""
+
+    def __init__(self, max_keys: int):
+        self._tats: LRUCache[str, float] = LRUCache(maxsize=max_keys)
+
+    @classmethod
+    def from_config(cls, settings: RateLimitSettings) -> RateLimitBackend:
+        return cls(max_keys=settings.RATE_LIMIT_MEMORY_MAX_KEYS)
+
+    async def close(self) -> None:
+        self._tats.clear()
+
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult:
+        now = time.monotonic()
+        tat, result = gcra(self._tats.get(key, now), now, limit, period)
+        self._tats[key] = tat
+        return result
@@ -0,0 +1,52 @@
+from app_base.adapter.rate_limit.interface import RateLimitBackend, RateLimitResult
+from app_base.config import RateLimitSettings
+
+try:  # optional: pip install '.[ratelimit]'
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover
+    aioredis = None
+
+# GCRA evaluated atomically in Redis, with the Redis clock (same clock for every worker).
+# KEYS[1]: bucket key; ARGV: limit, period (seconds). Returns {allowed, remaining, reset_after, retry_after}.
+_GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local emission_interval = period / limit
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local tat = tonumber(redis.call("GET", KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + emission_interval
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, 0, tostring(tat - now), tostring(allow_at - now)}
+end
+redis.call("SET", KEYS[1], tostring(new_tat), "PX", math.ceil((new_tat - now) * 1000))
+local remaining = math.floor((now - allow_at) / emission_interval + 1e-9)
+return {1, remaining, tostring(new_tat - now), "0"}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets kept in Redis: limits hold across workers and hosts."""
+
+    def __init__(self, client, key_prefix: str):
+        self.client = client
+        self.key_prefix = key_prefix
+        self._script = client.register_script(_GCRA_SCRIPT)
+
+    @classmethod
+    def from_config(cls, settings: RateLimitSettings) -> RateLimitBackend:
+        if aioredis is None:
+            raise ImportError("The 'redis' rate limit backend requires the 'ratelimit' extra (redis).")
+        client = aioredis.from_url(settings.RATE_LIMIT_REDIS_URL)
+        return cls(client, key_prefix=settings.RATE_LIMIT_KEY_PREFIX)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult:
+        allowed, remaining, reset_after, retry_after = await self._script(
+            keys=[self.key_prefix + key], args=[limit, period]
+        )
+        return RateLimitResult(bool(allowed), limit, int(remaining), float(reset_after), float(retry_after))
@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, TypeVar, Union
+
+import orjson
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from app_base.base.exceptions.basic import BadRequestException
+from app_base.base.schemas.bulk import BulkRowError
+
+T = TypeVar("T", bound=BaseModel)
+
+NDJSON_MEDIA_TYPES = frozenset({"application/x-ndjson", "application/ndjson", "application/jsonl"})
+
+
+@dataclass
+class BulkRows(Generic[T]):
+    """The valid rows of a bulk request by position, and the rejected ones."""
+
+    rows: dict[int, T] = field(default_factory=dict)
+    errors: list[BulkRowError] = field(default_factory=list)
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}" for error in exc.errors())
+
+
+def bulk_body(schema: type[T], max_rows: Union[int, Callable[[], int]]) -> Callable[[Request], Awaitable[BulkRows[T]]]:
+    """
+    Dependency parsing a bulk request body into `schema` rows: a JSON list, or NDJSON
+    (one object per line, `Content-Type: application/x-ndjson`).
+
+    Each row is validated on its own: an invalid row is reported by position in
+    `errors` instead of failing the whole request.
+
+    `max_rows` may be a callable, read per request: settings are then not loaded at import.
+
+    Usage:
+        async def import_items(body: Annotated[BulkRows[ItemCreate], Depends(bulk_body(ItemCreate, 1000))]):
+    """
+
+    async def parse_bulk_body(request: Request) -> BulkRows[T]:
+        body = await request.body()
+        content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+        result: BulkRows[T] = BulkRows()
+        items: list = []
+        if content_type in NDJSON_MEDIA_TYPES:
+            for index, line in enumerate(line for line in body.splitlines() if line.strip()):
+                try:
+                    items.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    items.append(None)
+                    result.errors.append(BulkRowError(index=index, message="Invalid JSON"))
+        else:
+            try:
+                items = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                raise BadRequestException("Invalid JSON body") from None
+            if not isinstance(items, list):
+                raise BadRequestException("Expected a JSON list of rows")
+        limit = max_rows() if callable(max_rows) else max_rows
+        if len(items) > limit:
+            raise BadRequestException(f"Too many rows: at most {limit} per request")
+
+        rejected = {error.index for error in result.errors}
+        for index, item in enumerate(items):
+            if index in rejected:
+                continue
+            try:
+                result.rows[index] = schema.model_validate(item)
+            except ValidationError as exc:
+                result.errors.append(BulkRowError(index=index, message=_validation_message(exc)))
+        return result
+
+    return parse_bulk_body
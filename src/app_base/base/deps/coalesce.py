@@ -0,0 +1,137 @@
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app_base.config import get_http_settings
+from app_base.core.middlewares.utils import get_route_name
+from app_base.core.singleflight import get_request_singleflight
+
+# Request headers that change the representation produced by the endpoint
+_VARYING_HEADERS = ("if-none-match", "accept")
+
+_REQUEST_PARAM = "_coalesce_request"
+_RESPONSE_PARAM = "_coalesce_response"
+
+AuthorizationScope = Callable[[dict[str, Any]], Hashable]
+
+
+def role_scope(kwargs: dict[str, Any]) -> Hashable:
+    """Default authorization scope: the role of the `current_user` argument, if any."""
+    return getattr(kwargs.get("current_user"), "role", None)
+
+
+class SharedResponse:
+    """A serialized response produced once and replayed to every coalesced request."""
+
+    def __init__(self, status_code: int, body: bytes, raw_headers: list[tuple[bytes, bytes]]):
+        self.status_code = status_code
+        self.body = body
+        self.raw_headers = raw_headers
+
+    def to_response(self) -> Response:
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+def _find_parameter(signature: inspect.Signature, annotation: type) -> Optional[str]:
+    for parameter in signature.parameters.values():
+        if isinstance(parameter.annotation, type) and issubclass(parameter.annotation, annotation):
+            return parameter.name
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _serialize(request: Request, sub_response: Response, content: Any) -> Response:
+    """Serialize an endpoint result the way FastAPI would, for the matched route."""
+    route = request.scope.get("route")
+    response_model = getattr(route, "response_model", None)
+    if response_model is not None:
+        adapter = _get_type_adapter(response_model)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    else:
+        body = _get_type_adapter(Any).dump_json(jsonable_encoder(content))
+    status_code = sub_response.status_code or getattr(route, "status_code", None) or 200
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def coalesce_requests(
+    scope: AuthorizationScope = role_scope,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Share one execution of a GET endpoint between identical concurrent requests.
+
+    Requests are identical when they hit the same route with the same path and query
+    parameters, the same representation headers (If-None-Match, Accept) and the same
+    authorization `scope`. Dependencies, authentication included, are still resolved
+    for every request; only the endpoint body and the serialization of its result run
+    once, and the resulting bytes are replayed to every waiting request. The execution
+    uses the dependencies of the first request (its DB session), which therefore waits
+    for it to finish even when cancelled.
+
+    Only opt in endpoints whose result depends on nothing but the key: `scope` must
+    capture everything else the result depends on (by default the caller's role).
+
+    Usage:
+        @router.get("", response_model=PaginatedList[MemoRead])
+        @coalesce_requests()
+        async def get_memos(...): ...
+    """
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(endpoint)
+        # FastAPI injects Request/Response into one parameter each: reuse the endpoint's own if any
+        request_param = _find_parameter(signature, Request)
+        response_param = _find_parameter(signature, Response)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs[request_param] if request_param else kwargs.pop(_REQUEST_PARAM)
+            sub_response: Response = kwargs[response_param] if response_param else kwargs.pop(_RESPONSE_PARAM)
+            if request.method != "GET" or not get_http_settings().SINGLEFLIGHT_ENABLED:
+                return await endpoint(*args, **kwargs)
+
+            route = get_route_name(request.scope)
+            key = (
+                route,
+                request.url.path,
+                tuple(sorted(request.query_params.multi_items())),
+                tuple(request.headers.get(name) for name in _VARYING_HEADERS),
+                scope(kwargs),
+            )
+            # Headers set by this request's own dependencies (rate limits, ...)
+            own_headers = list(sub_response.headers.raw)
+
+            async def execute() -> SharedResponse:
+                result = await endpoint(*args, **kwargs)
+                if isinstance(result, Response):
+                    return SharedResponse(result.status_code, bytes(result.body), list(result.raw_headers))
+                response = _serialize(request, sub_response, result)
+                endpoint_headers = sub_response.headers.raw[len(own_headers) :]
+                return SharedResponse(response.status_code, response.body, response.raw_headers + endpoint_headers)
+
+            shared, _ = await get_request_singleflight().do(key, execute, route=route)
+            response = shared.to_response()
+            response.raw_headers.extend(own_headers)
+            return response
+
+        extra = []
+        if request_param is None:
+            extra.append(inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+        if response_param is None:
+            extra.append(inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response))
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[*signature.parameters.values(), *extra]
+        )
+        return wrapper
+
+    return decorator
@@ -0,0 +1,82 @@
+import datetime
+import hashlib
+from typing import Annotated, Any, Awaitable, Callable, Optional
+
+from fastapi import Depends, Header, Response, status
+
+from app_base.base.schemas.paginated import PaginatedList
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from version parts (datetimes are rendered in ISO format)."""
+    raw = "|".join(part.isoformat() if isinstance(part, datetime.datetime) else str(part) for part in parts)
+    return f'W/"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def make_page_etag(page: PaginatedList, version_attr: str = "updated_at") -> str:
+    """
+    Build an ETag for a page from the identity and version of its items and the page window.
+
+    Cheaper than hashing the serialized body and equivalent as long as every change to an
+    item bumps its version column.
+    """
+    parts: list[Any] = [page.total_count, page.offset, page.limit]
+    for item in page.items:
+        parts.append(getattr(item, "id", None))
+        parts.append(getattr(item, version_attr, None))
+    return make_etag(*parts)
+
+
+class ConditionalRequest:
+    """
+    If-None-Match handling for GET endpoints.
+
+    Usage:
+        @router.get("/{obj_id}")
+        async def get_obj(use_case: ..., conditional: ConditionalRequestParam, obj_id: uuid.UUID):
+            if not_modified := await conditional.check_version(lambda: use_case.get_version(obj_id)):
+                return not_modified
+            obj = await use_case.execute(obj_id)
+            return conditional.not_modified(make_etag(obj.updated_at)) or obj
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        if_none_match: Annotated[Optional[str], Header(description="ETag(s) of the cached representation")] = None,
+    ):
+        self.response = response
+        self.if_none_match = if_none_match
+
+    def matches(self, etag: str) -> bool:
+        """Weak comparison (RFC 9110 13.1.2) of `etag` with the If-None-Match header."""
+        if not self.if_none_match:
+            return False
+        if self.if_none_match.strip() == "*":
+            return True
+        opaque = etag.removeprefix("W/")
+        return any(candidate.strip().removeprefix("W/") == opaque for candidate in self.if_none_match.split(","))
+
+    def not_modified(self, etag: str) -> Optional[Response]:
+        """Set the ETag of the response; return a 304 response if the client's copy is current."""
+        self.response.headers["ETag"] = etag
+        if self.matches(etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return None
+
+    async def check_version(self, get_version: Callable[[], Awaitable[Any]]) -> Optional[Response]:
+        """
+        Answer 304 from a cheap version probe, before the resource itself is loaded.
+
+        The probe only runs when the client sent If-None-Match. A None version
+        (unknown, not found, out of scope) never short-circuits the request.
+        """
+        if not self.if_none_match:
+            return None
+        version = await get_version()
+        if version is None:
+            return None
+        return self.not_modified(make_etag(version))
+
+
+ConditionalRequestParam = Annotated[ConditionalRequest, Depends()]
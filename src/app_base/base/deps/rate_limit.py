@@ -0,0 +1,48 @@
+import math
+from typing import Any
+
+from fastapi import Response
+
+from app_base.adapter.rate_limit import get_rate_limit_backend
+from app_base.base.exceptions.basic import TooManyRequestsException
+from app_base.config import get_rate_limit_settings
+
+
+class RateLimiter:
+    """
+    Token bucket of `limit` requests per `period` seconds, per key.
+
+    The key is built by the caller (e.g. from the current user and workspace), so that
+    app_base does not depend on how users are authenticated.
+
+    Usage:
+        limiter = RateLimiter(limit=100, period=60, name="memos")
+
+        async def rate_limit_memos(response: Response, user: Annotated[User, Depends(get_current_user)]):
+            await limiter.check(response, user.id)
+    """
+
+    def __init__(self, limit: int, period: float = 60.0, name: str = "default"):
+        if limit < 1 or period <= 0:
+            raise ValueError("Rate limit requires limit >= 1 and period > 0.")
+        self.limit = limit
+        self.period = period
+        self.name = name
+
+    def make_key(self, *parts: Any) -> str:
+        return ":".join([self.name, *(str(part) for part in parts)])
+
+    async def check(self, response: Response, *key_parts: Any) -> None:
+        """Count one request; set X-RateLimit-* headers, or raise 429 with Retry-After."""
+        if not get_rate_limit_settings().RATE_LIMIT_ENABLED:
+            return
+        result = await get_rate_limit_backend().hit(self.make_key(*key_parts), self.limit, self.period)
+        headers = {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(math.ceil(result.reset_after)),
+        }
+        if not result.allowed:
+            headers["Retry-After"] = str(math.ceil(result.retry_after))
+            raise TooManyRequestsException(message="Rate limit exceeded", headers=headers)
+        response.headers.update(headers)
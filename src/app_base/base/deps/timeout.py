@@ -0,0 +1,25 @@
+from typing import Awaitable, Callable, Optional, Union
+
+from app_base.core.database.deadline import request_deadline_ctx
+
+
+def request_timeout(
+    seconds: Union[Optional[float], Callable[[], Optional[float]]],
+) -> Callable[[], Awaitable[None]]:
+    """
+    Dependency overriding the request timeout of a route or router.
+
+    The timeout counts from the start of the request; None disables it. A callable is
+    called per request (e.g. to read a setting).
+
+    Usage:
+        @router.get("/export", dependencies=[Depends(request_timeout(300))])
+    """
+
+    # async so that it runs in the request task, which owns the deadline
+    async def set_request_timeout() -> None:
+        deadline = request_deadline_ctx.get()
+        if deadline is not None:
+            deadline.set_timeout(seconds() if callable(seconds) else seconds)
+
+    return set_request_timeout
@@ -9,6 +9,7 @@ class CustomException(Exception):
     message = "Internal Server Error"
     log_message = None
     trace = True
+    headers: Optional[dict[str, str]] = None
 
     def __init__(
         self,
@@ -17,6 +18,7 @@ class CustomException(Exception):
         status_code: Optional[int] = None,
         title: Optional[str] = None,
         trace: Optional[bool] = None,
+        headers: Optional[dict[str, str]] = None,
     ):
         if message is not None:
             self.message = message
@@ -28,6 +30,8 @@ class CustomException(Exception):
             self.title = title
         if trace is not None:
             self.trace = trace
+        if headers is not None:
+            self.headers = headers
 
         if log_message is None:
             self.log_message = self.message
@@ -26,3 +26,10 @@ class ConflictException(CustomException):
     status_code = status.HTTP_409_CONFLICT
     title = "Conflict"
     message = "Conflict"
+
+
+class TooManyRequestsException(CustomException):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    title = "Too Many Requests"
+    message = "Too Many Requests"
+    trace = False
@@ -36,6 +36,29 @@ class DatabaseException(CustomException):
     message = "An unexpected database error occurred."
 
 
+class StatementTimeoutException(CustomException):
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    title = "Statement timeout"
+    message = "The database statement was cancelled because the request ran out of time."
+
+
+class NPlusOneQueryException(CustomException):
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    title = "N+1 query detected"
+    message = "The same statement was executed repeatedly within one request."
+
+
+# SQLSTATE of statements cancelled by statement_timeout or pg_cancel_backend
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+def _dbapi_exception(e: DBAPIError) -> CustomException:
+    sqlstate = getattr(e.orig, "sqlstate", None) or getattr(e.orig, "pgcode", None)
+    if sqlstate == QUERY_CANCELED_SQLSTATE:
+        return StatementTimeoutException()
+    return DatabaseException()
+
+
 @asynccontextmanager
 async def database_exception_handler():
     try:
@@ -47,6 +70,6 @@ async def database_exception_handler():
     except DataError as e:
         raise InvalidDataException() from e
     except OperationalError as e:
-        raise DatabaseException() from e
+        raise _dbapi_exception(e) from e
     except DBAPIError as e:
-        raise DatabaseException() from e
+        raise _dbapi_exception(e) from e
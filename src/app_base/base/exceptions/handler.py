@@ -34,6 +34,7 @@ def _process_custom_exception(request: Request, exc: CustomException):
             "instance": str(request.url.path),
             "request_id": _get_request_id(request),
         },
+        headers=exc.headers,
     )
 
 
@@ -21,7 +21,8 @@ class TimestampMixin:
     updated_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        server_onupdate=func.now(),
+        # Set by the app on every UPDATE (no DB trigger); ETags are derived from this column
+        onupdate=lambda: datetime.datetime.now(datetime.timezone.utc),
         nullable=False,
     )
 
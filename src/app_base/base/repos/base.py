@@ -8,6 +8,7 @@ from sqlalchemy import (
     and_,
     delete,
     func,
+    insert,
     literal,
     or_,
     select,
@@ -19,6 +20,7 @@ from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
 from sqlalchemy.sql.selectable import Select
 
 from app_base.base.schemas.paginated import PaginatedList
+from app_base.core.tracing import trace_public_methods, traced_method
 
 ModelType = TypeVar("ModelType", bound=Any)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -41,9 +43,15 @@ class BaseRepository(
     resource_name: str
 
     default_order_by_col: Optional[str] = "updated_at"
+    version_column: Optional[str] = "updated_at"
     is_deleted_column: Optional[str] = "is_deleted"
     deleted_at_column: Optional[str] = "deleted_at"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Trace the queries added by concrete repositories as well
+        trace_public_methods(cls)
+
     def __init__(self):
         self._primary_keys = self._get_primary_keys(self.model)
 
@@ -111,6 +119,7 @@ class BaseRepository(
                     stmt = stmt.order_by(default_order_by.desc())
         return stmt
 
+    @traced_method
     async def get(
         self,
         session: AsyncSession,
@@ -123,6 +132,7 @@ class BaseRepository(
         db_row = await session.execute(stmt)
         return db_row.scalar_one_or_none()
 
+    @traced_method
     async def get_by_pk(
         self,
         session: AsyncSession,
@@ -149,6 +159,30 @@ class BaseRepository(
 
         return await session.get(self.model, ident)
 
+    @traced_method
+    async def get_version(
+        self,
+        session: AsyncSession,
+        pk: PrimaryKeyType,
+        where: WhereClause = (),
+    ) -> Optional[Any]:
+        """
+        Get only the version column (e.g. updated_at) of a row, without loading the row.
+
+        Returns None if the row does not exist, does not match `where`,
+        or the model has no version column.
+        """
+        if not self.version_column or not hasattr(self.model, self.version_column):
+            return None
+        stmt = select(getattr(self.model, self.version_column)).where(*self._get_primary_key_filters(pk))
+        if where is not None:
+            where = where if isinstance(where, Sequence) else (where,)
+            stmt = stmt.where(*where)
+
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @traced_method
     async def exists(
         self,
         session: AsyncSession,
@@ -164,6 +198,7 @@ class BaseRepository(
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    @traced_method
     async def create(
         self,
         session: AsyncSession,
@@ -178,6 +213,7 @@ class BaseRepository(
         await session.refresh(db_obj)
         return db_obj
 
+    @traced_method
     async def create_multi(
         self,
         session: AsyncSession,
@@ -201,6 +237,27 @@ class BaseRepository(
 
         return created_objs
 
+    @traced_method
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        objs_in: Sequence[CreateSchemaType],
+        **update_fields: Any,
+    ) -> Sequence[ModelType]:
+        """
+        Insert many rows with one multi-row INSERT ... RETURNING per BATCH_SIZE rows,
+        instead of a flush and a refresh per object (create_multi).
+        """
+        rows = [{**obj_in.model_dump(), **update_fields} for obj_in in objs_in]
+        created_objs: list[ModelType] = []
+        for i in range(0, len(rows), self.BATCH_SIZE):
+            result = await session.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True), rows[i : i + self.BATCH_SIZE]
+            )
+            created_objs.extend(result.all())
+        return created_objs
+
+    @traced_method
     async def get_multi(
         self,
         session: AsyncSession,
@@ -237,6 +294,7 @@ class BaseRepository(
             limit=limit,
         )
 
+    @traced_method
     async def get_all(
         self,
         session: AsyncSession,
@@ -252,6 +310,7 @@ class BaseRepository(
         )
         return res.items
 
+    @traced_method
     async def update_by_pk(
         self,
         session: AsyncSession,
@@ -284,6 +343,7 @@ class BaseRepository(
         await session.flush()
         return await self.get(session, where=filters) if return_updated_obj else None
 
+    @traced_method
     async def delete_by_pk(
         self,
         session: AsyncSession,
@@ -321,6 +381,7 @@ class BaseRepository(
             await session.flush()
         return deleted_or_updated
 
+    @traced_method
     async def delete_by_pk_multi(
         self,
         session: AsyncSession,
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class BulkRowError(BaseModel):
+    index: int = Field(..., description="Position of the row in the request.")
+    message: str = Field(..., description="Why the row was rejected.")
@@ -16,6 +16,8 @@ from app_base.base.repos.base import (
 )
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
+from app_base.core.timing import HOOKS_PHASE, timed, timed_async_context
+from app_base.core.tracing import trace_hooks, traced_method
 
 
 class BaseContextKwargs(TypedDict):
@@ -33,6 +35,12 @@ class BaseHooksInterface:
 
     repo: BaseRepository
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Trace the hooks overridden by each mixin/service (the no-op defaults below are left alone)
+        if cls.__module__ != __name__:
+            trace_hooks(cls)
+
 
 class BaseServiceMixinInterface:
     """Base Service class."""
@@ -110,6 +118,7 @@ class BaseCreateServiceMixin(
         await service.create(session, obj_data, context={})
     """
 
+    @traced_method
     async def create(
         self,
         session: AsyncSession,
@@ -117,10 +126,12 @@ class BaseCreateServiceMixin(
         context: Optional[TContextKwargs] = None,
     ) -> ModelType:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_create(session, obj_data, context=ctx):
-            extra_fields = self._prepare_create_fields(obj_data, context=ctx)
+        async with timed_async_context(HOOKS_PHASE, self._context_create(session, obj_data, context=ctx)):
+            with timed(HOOKS_PHASE):
+                extra_fields = self._prepare_create_fields(obj_data, context=ctx)
             obj = await self.repo.create(session, obj_in=obj_data, **extra_fields)
-            return await self._post_create(session, obj, context=ctx)
+            with timed(HOOKS_PHASE):
+                return await self._post_create(session, obj, context=ctx)
 
 
 # ============================================================
@@ -164,6 +175,7 @@ class BaseUpdateServiceMixin(
         await service.update(session, obj_id, obj_data, context={})
     """
 
+    @traced_method
     async def update(
         self,
         session: AsyncSession,
@@ -172,10 +184,12 @@ class BaseUpdateServiceMixin(
         context: Optional[TContextKwargs] = None,
     ) -> ModelType | None:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_update(session, obj_id, obj_data, context=ctx):
-            extra_fields = self._prepare_update_fields(obj_data, context=ctx)
+        async with timed_async_context(HOOKS_PHASE, self._context_update(session, obj_id, obj_data, context=ctx)):
+            with timed(HOOKS_PHASE):
+                extra_fields = self._prepare_update_fields(obj_data, context=ctx)
             obj = await self.repo.update_by_pk(session, pk=obj_id, obj_in=obj_data, **extra_fields)
-            return await self._post_update(session, obj, context=ctx)
+            with timed(HOOKS_PHASE):
+                return await self._post_update(session, obj, context=ctx)
 
 
 # ============================================================
@@ -215,6 +229,7 @@ class BaseDeleteServiceMixin(
         await service.delete(session, obj_id, context={})
     """
 
+    @traced_method
     async def delete(
         self,
         session: AsyncSession,
@@ -222,10 +237,11 @@ class BaseDeleteServiceMixin(
         context: Optional[TContextKwargs] = None,
     ) -> DeleteResponse:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_delete(session, obj_id, context=ctx):
+        async with timed_async_context(HOOKS_PHASE, self._context_delete(session, obj_id, context=ctx)):
             success = await self.repo.delete_by_pk(session, pk=obj_id)
             result = DeleteResponse(success=success, identity=obj_id)
-            result = await self._post_delete(session, obj_id, result, context=ctx)
+            with timed(HOOKS_PHASE):
+                result = await self._post_delete(session, obj_id, result, context=ctx)
             return result
 
 
@@ -248,6 +264,10 @@ class BaseGetHooks(BaseHooksInterface):
         """Hook executed after get (data transformation, etc.)."""
         return obj
 
+    def _prepare_get_version_filters(self, context: TContextKwargs) -> list[Any]:
+        """Hook to prepare the conditions a row must meet for its version to be readable (no row load)."""
+        return []
+
 
 class BaseGetServiceMixin(
     ABC,
@@ -262,6 +282,7 @@ class BaseGetServiceMixin(
         await service.get(session, obj_id, context={})
     """
 
+    @traced_method
     async def get(
         self,
         session: AsyncSession,
@@ -269,9 +290,28 @@ class BaseGetServiceMixin(
         context: Optional[TContextKwargs] = None,
     ) -> ModelType | None:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_get(session, obj_id, context=ctx):
+        async with timed_async_context(HOOKS_PHASE, self._context_get(session, obj_id, context=ctx)):
             obj = await self.repo.get_by_pk(session, pk=obj_id)
-            return await self._post_get(session, obj, context=ctx)
+            with timed(HOOKS_PHASE):
+                return await self._post_get(session, obj, context=ctx)
+
+    @traced_method
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: uuid.UUID,
+        context: Optional[TContextKwargs] = None,
+    ) -> Any | None:
+        """
+        Get the version (updated_at) of an object with a single cheap query, for conditional requests.
+
+        The _context_get hooks are not run; scope checks must be expressed by
+        _prepare_get_version_filters. None means "unknown" and callers fall back to get().
+        """
+        ctx = self._ensure_context(context, self.context_model)
+        with timed(HOOKS_PHASE):
+            filters = self._prepare_get_version_filters(context=ctx)
+        return await self.repo.get_version(session, pk=obj_id, where=filters)
 
 
 # ============================================================
@@ -314,6 +354,7 @@ class BaseGetMultiServiceMixin(
         await service.get_multi(session, offset=0, limit=100, context={})
     """
 
+    @traced_method
     async def get_multi(
         self,
         session: AsyncSession,
@@ -324,8 +365,9 @@ class BaseGetMultiServiceMixin(
         context: Optional[TContextKwargs] = None,
     ) -> PaginatedList[ModelType]:
         ctx = self._ensure_context(context, self.context_model)
-        async with self._context_get_multi(session, context=ctx):
-            extra_filters = self._prepare_get_multi_filters(context=ctx)
+        async with timed_async_context(HOOKS_PHASE, self._context_get_multi(session, context=ctx)):
+            with timed(HOOKS_PHASE):
+                extra_filters = self._prepare_get_multi_filters(context=ctx)
 
             # Merge where conditions
             if where is None:
@@ -336,4 +378,5 @@ class BaseGetMultiServiceMixin(
                 where = [where] + extra_filters
 
             result = await self.repo.get_multi(session, offset=offset, limit=limit, where=where, order_by=order_by)
-            return await self._post_get_multi(session, result, context=ctx)
+            with timed(HOOKS_PHASE):
+                return await self._post_get_multi(session, result, context=ctx)
@@ -120,6 +120,12 @@ class NestedResourceHooksMixin(
             await self._ensure_ownership(session, obj_id, context["parent_id"])
             yield
 
+    def _prepare_get_version_filters(self, context: TContextKwargs) -> list[Any]:
+        """Only report the version of objects that belong to the parent context."""
+        filters = super()._prepare_get_version_filters(context)
+        filters.append(getattr(self.repo.model, self.fk_name) == context["parent_id"])
+        return filters
+
     # ============================================================
     # Update Hooks
     # ============================================================
@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from app_base.core.timing import USECASE_PHASE, timed_async
+from app_base.core.tracing import trace_hooks, traced_method
+
 
 class BaseUseCase(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time every concrete `execute` as the "usecase" phase of the current request, and trace it
+        if "execute" in cls.__dict__ and not getattr(cls.execute, "__isabstractmethod__", False):
+            cls.execute = timed_async(USECASE_PHASE)(traced_method(cls.execute))
+        # Trace the hooks it defines (_context_execute, _post_execute, ...)
+        trace_hooks(cls)
+
     @abstractmethod
     async def execute(self, *args, **kwargs) -> Any:
         """Execute the use case. Must be implemented by subclasses."""
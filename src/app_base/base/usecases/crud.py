@@ -38,6 +38,11 @@ class BaseGetUseCase(BaseUseCase, Generic[TBaseGetService, ModelType, TContextKw
         async with AsyncTransaction() as session:
             return await self._execute(session, obj_id, context=context)
 
+    async def get_version(self, obj_id: UUID, context: Optional[TContextKwargs] = None) -> Optional[Any]:
+        """Cheap version probe (updated_at) used to answer conditional requests without execute()."""
+        async with AsyncTransaction() as session:
+            return await self.service.get_version(session, obj_id, context=context)
+
 
 class BaseGetMultiUseCase(BaseUseCase, Generic[TBaseGetMultiService, ModelType, TContextKwargs]):
     def __init__(self, service: TBaseGetMultiService):
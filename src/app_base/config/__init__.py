@@ -10,6 +10,22 @@ from .file_storage import (
     FileStorageSettings,
     get_file_storage_settings,
 )
+from .http import (
+    HTTPSettings,
+    get_http_settings,
+)
+from .observability import (
+    ObservabilitySettings,
+    get_observability_settings,
+)
+from .outbox import (
+    OutboxSettings,
+    get_outbox_settings,
+)
+from .rate_limit import (
+    RateLimitSettings,
+    get_rate_limit_settings,
+)
 from .util import (
     get_app_path,
     get_env_filename,
@@ -33,6 +49,14 @@ __all__ = [
     "get_vector_db_settings",
     "FileStorageSettings",
     "get_file_storage_settings",
+    "ObservabilitySettings",
+    "get_observability_settings",
+    "HTTPSettings",
+    "get_http_settings",
+    "OutboxSettings",
+    "get_outbox_settings",
+    "RateLimitSettings",
+    "get_rate_limit_settings",
     # util functions,
     "get_app_path",
     "get_repo_path",
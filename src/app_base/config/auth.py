@@ -1,4 +1,5 @@
 import functools
+from typing import Literal
 
 from pydantic import EmailStr, Field, SecretStr
 from pydantic_settings import BaseSettings
@@ -10,6 +11,32 @@ class AuthSettings(BaseSettings):
 
     SECRET_KEY: SecretStr  # openssl rand -hex 64
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=10)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=14, ge=1)
+
+    # bcrypt runs on a bounded pool, off the event loop
+    PASSWORD_HASH_ROUNDS: int = Field(default=12, ge=4, le=31, description="bcrypt cost (log2 of iterations).")
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1, description="Hashes/verifications run concurrently.")
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = Field(default="thread")
+    # Bulk provisioning hashes on a pool of its own, so that logins never wait behind a batch
+    PASSWORD_HASH_BULK_WORKERS: int = Field(default=2, ge=1, description="Workers of the bulk hashing pool.")
+    PASSWORD_HASH_BULK_EXECUTOR: Literal["thread", "process"] = Field(default="process")
+    PASSWORD_HASH_BULK_CHUNK_SIZE: int = Field(default=8, ge=1, description="Passwords per task of the bulk pool.")
+
+    # Bulk user provisioning (POST /admin/users/bulk). At the default cost (~0.25 s per hash)
+    # and workers, a full batch takes ~2 minutes, within the timeout of the route.
+    USER_BULK_MAX_ROWS: int = Field(default=1000, ge=1, le=2000)
+    USER_BULK_TIMEOUT: float = Field(default=300.0, gt=0.0, description="Request timeout of the bulk route (s).")
+
+    # Authenticated-user cache (per process), invalidated by UserService updates and deletes
+    USER_CACHE_ENABLED: bool = Field(default=True)
+    USER_CACHE_TTL: float = Field(default=30.0, gt=0.0, description="Max staleness across workers (s).")
+    USER_CACHE_MAX_SIZE: int = Field(default=10000, ge=1)
+    # Token versions (revoked access tokens) checked by claim-only authorization, per process
+    TOKEN_VERSION_CACHE_TTL: float = Field(
+        default=5.0, gt=0.0, description="Max delay of a revocation on other workers (s)."
+    )
+    # Trust the user claims of the access token until it expires, without any lookup
+    STATELESS_AUTH: bool = Field(default=False)
 
 
 @functools.lru_cache
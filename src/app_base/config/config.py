@@ -13,6 +13,18 @@ class AppSettings(BaseSettings):
     LOG_PATH: str = Field(default=os.path.join(get_repo_path(), "logs/app.log"))
     LOG_JSON_FORMAT: bool = Field(default=False)
     LOG_LEVEL: str = Field(default="INFO")
+    LOG_ENQUEUE: bool = Field(
+        default=False, description="Write records from a background thread, so sinks never block the event loop."
+    )
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1, description="Records queued per sink before dropping.")
+    LOG_SAMPLE_RATES: dict[str, float] = Field(
+        default={}, description="Share of records below WARNING kept, by logger name prefix ('app.features.outbox')."
+    )
+    LOG_RATE_LIMIT: int = Field(default=0, ge=0, description="Max records below WARNING per call site and period.")
+    LOG_RATE_LIMIT_PERIOD: float = Field(default=10.0, gt=0.0, description="Rate limit window (s).")
+    LOG_STD_LOGGERS: list[str] = Field(
+        default=["app"], description="Standard library loggers routed to the loguru sinks (with sampling)."
+    )
 
 
 @functools.lru_cache
@@ -0,0 +1,72 @@
+import functools
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class HTTPSettings(BaseSettings):
+    # Response compression (zstd / brotli need the optional "compression" extra)
+    COMPRESSION_ENABLED: bool = Field(default=True)
+    COMPRESSION_ENCODINGS: list[str] = Field(
+        default=["zstd", "br", "gzip"], description="Supported encodings, in server preference order."
+    )
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, ge=0, description="Smaller bodies are sent as is (bytes).")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11)
+    COMPRESSION_ZSTD_LEVEL: int = Field(default=3, ge=1, le=22)
+    COMPRESSION_EXCLUDED_CONTENT_TYPES: list[str] = Field(
+        default=[
+            # already compressed
+            "image/",
+            "video/",
+            "audio/",
+            "font/woff",
+            "application/zip",
+            "application/gzip",
+            "application/x-gzip",
+            "application/zstd",
+            "application/x-7z-compressed",
+            "application/x-rar-compressed",
+            # streaming (every event must reach the client immediately)
+            "text/event-stream",
+            "multipart/x-mixed-replace",
+        ],
+        description="Content-Type prefixes that are never compressed.",
+    )
+
+    # Request deadline (per-route overrides with the request_timeout dependency)
+    REQUEST_TIMEOUT: float = Field(default=60.0, gt=0.0, description="Seconds until a request is answered with 504.")
+    REQUEST_TIMEOUT_DB_PROPAGATION: bool = Field(
+        default=True, description="Bound Postgres statements by the remaining budget (statement_timeout)."
+    )
+
+    # Coalescing of identical concurrent GET requests (routes opt in with @coalesce_requests)
+    SINGLEFLIGHT_ENABLED: bool = Field(default=True)
+
+    # Adaptive concurrency limit (AIMD) per worker and route class, with load shedding
+    CONCURRENCY_LIMIT_ENABLED: bool = Field(default=True)
+    CONCURRENCY_LIMIT_INITIAL: int = Field(default=20, ge=1, description="Starting limit of each route class.")
+    CONCURRENCY_LIMIT_MIN: int = Field(default=2, ge=1)
+    CONCURRENCY_LIMIT_MAX: int = Field(default=200, ge=1)
+    CONCURRENCY_LIMIT_BACKOFF_RATIO: float = Field(
+        default=0.9, gt=0.0, lt=1.0, description="Multiplicative decrease applied on overload."
+    )
+    CONCURRENCY_LIMIT_LATENCY_TOLERANCE: float = Field(
+        default=2.0, gt=1.0, description="Latency above tolerance x baseline counts as overload."
+    )
+    CONCURRENCY_LIMIT_QUEUE_SIZE: int = Field(default=50, ge=0, description="Requests waiting for a slot per class.")
+    CONCURRENCY_LIMIT_QUEUE_TIMEOUT: float = Field(default=1.0, ge=0.0, description="Max wait for a slot (seconds).")
+    CONCURRENCY_LIMIT_RETRY_AFTER: int = Field(default=1, ge=0, description="Retry-After of shed requests (seconds).")
+    CONCURRENCY_LIMIT_ROUTE_CLASSES: dict[str, str] = Field(
+        default={"/api/v1/admin": "admin"},
+        description="Path prefix -> route class. Other requests are classed as 'read' or 'write' by method.",
+    )
+    CONCURRENCY_LIMIT_EXEMPT_PATHS: list[str] = Field(
+        default=["/api/health", "/metrics", "/docs", "/redoc", "/openapi.json"],
+        description="Path prefixes never limited.",
+    )
+
+
+@functools.lru_cache
+def get_http_settings():
+    return HTTPSettings()  # type: ignore
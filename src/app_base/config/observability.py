@@ -0,0 +1,63 @@
+import functools
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ObservabilitySettings(BaseSettings):
+    # Per-statement query profiling (pg_stat_statements-style, in process)
+    QUERY_STATS_ENABLED: bool = Field(default=True)
+    QUERY_STATS_MAX_ENTRIES: int = Field(default=2000, description="Max number of (route, fingerprint) entries kept.")
+    QUERY_STATS_SAMPLE_SIZE: int = Field(default=500, description="Number of recent timings kept per entry for p95.")
+
+    # N+1 detection (same statement shape repeated within one request)
+    N_PLUS_ONE_ENABLED: bool = Field(default=True)
+    N_PLUS_ONE_THRESHOLD: int = Field(default=5, description="Executions of one statement shape that trigger a report.")
+    N_PLUS_ONE_STRICT: bool = Field(default=False, description="Raise instead of logging (intended for tests).")
+
+    # Server-Timing header (auth, use case, hooks, db, serialization) and slow request logs
+    SERVER_TIMING_ENABLED: bool = Field(default=True)
+    SLOW_REQUEST_THRESHOLD_MS: float = Field(default=1000.0, description="Requests slower than this are logged.")
+    SLOW_REQUEST_LOG_SAMPLE_RATE: float = Field(default=1.0, ge=0.0, le=1.0, description="Sampled share.")
+
+    # Prometheus metrics at /metrics (needs the optional "metrics" extra)
+    METRICS_ENABLED: bool = Field(default=True)
+    METRICS_LATENCY_BUCKETS: list[float] = Field(
+        default=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+        description="Request latency histogram buckets (seconds).",
+    )
+    METRICS_LOOP_LAG_INTERVAL: float = Field(default=0.5, gt=0.0, description="Event loop lag probe interval (s).")
+    METRICS_COLLECT_INTERVAL: float = Field(default=15.0, gt=0.0, description="Pool/queue gauge refresh interval (s).")
+
+    # Event loop monitor: lag percentiles and stack samples of the code blocking the loop
+    LOOP_MONITOR_ENABLED: bool = Field(default=False)
+    LOOP_MONITOR_INTERVAL: float = Field(default=0.05, gt=0.0, description="Heartbeat interval (s).")
+    LOOP_MONITOR_BLOCK_THRESHOLD: float = Field(default=0.1, gt=0.0, description="Lag reported as a block (s).")
+    LOOP_MONITOR_SAMPLE_INTERVAL: float = Field(default=0.01, gt=0.0, description="Stack sampling interval (s).")
+    LOOP_MONITOR_WINDOW: int = Field(default=2000, ge=1, description="Recent lag samples kept for percentiles.")
+    LOOP_MONITOR_MAX_REPORTS: int = Field(default=50, ge=1, description="Recent block reports kept.")
+
+    # Tracing: spans of use cases, service hooks, repositories, SQL and outbox dispatch
+    TRACING_ENABLED: bool = Field(default=False)
+    TRACING_SAMPLE_RATE: float = Field(default=1.0, ge=0.0, le=1.0, description="Share of traces recorded.")
+    TRACING_EXPORTER: Literal["json", "otlp"] = Field(default="json")
+    TRACING_JSON_PATH: str = Field(default="logs/traces.jsonl", description="File of the 'json' exporter.")
+    TRACING_OTLP_ENDPOINT: str = Field(default="http://localhost:4318/v1/traces", description="OTLP/HTTP collector.")
+    TRACING_SERVICE_NAME: str = Field(default="app")
+    TRACING_BATCH_SIZE: int = Field(default=512, ge=1, description="Max spans per export.")
+    TRACING_MAX_QUEUE_SIZE: int = Field(default=8192, ge=1, description="Spans queued beyond this are dropped.")
+    TRACING_FLUSH_INTERVAL: float = Field(default=2.0, gt=0.0, description="Export interval (s).")
+
+    # On-demand profiling of single admin requests (needs the optional "profiling" extra)
+    PROFILING_ENABLED: bool = Field(default=True)
+    PROFILING_HEADER: str = Field(default="X-Profile", description="Header requesting a profile (html/json/...).")
+    PROFILING_QUERY_PARAM: str = Field(default="_profile", description="Query parameter requesting a profile.")
+    PROFILING_INTERVAL: float = Field(default=0.001, gt=0.0, description="Sampling interval (s).")
+    PROFILING_DIR: str = Field(default="logs/profiles", description="Directory of the stored profiles.")
+    PROFILING_MAX_STORED: int = Field(default=50, ge=1, description="Most recent stored profiles kept.")
+
+
+@functools.lru_cache
+def get_observability_settings():
+    return ObservabilitySettings()  # type: ignore
@@ -0,0 +1,41 @@
+import functools
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class OutboxSettings(BaseSettings):
+    # Run the scheduler in the app (one elected process), or only in `python -m app.features.outbox.worker`
+    OUTBOX_IN_APP_SCHEDULER_ENABLED: bool = Field(default=True)
+    OUTBOX_LEADER_LOCK_KEY: int = Field(default=0x6F7574626F78, description="Postgres advisory lock key.")
+    OUTBOX_LEADER_LOCK_FILE: Optional[str] = Field(default=None, description="Lock file (not Postgres).")
+    OUTBOX_LEADER_RETRY_INTERVAL: float = Field(default=5.0, gt=0.0, description="Followers retry every (s).")
+
+    # Wakeup on commit: NOTIFY/LISTEN on Postgres, an in-process signal otherwise
+    OUTBOX_NOTIFY_ENABLED: bool = Field(default=True)
+    OUTBOX_NOTIFY_CHANNEL: str = Field(default="outbox_events", pattern=r"^[a-z_][a-z0-9_]*$")
+    OUTBOX_LISTEN_RECONNECT_INTERVAL: float = Field(default=5.0, gt=0.0, description="Delay before reconnecting (s).")
+
+    # Polling fallback: the interval doubles while idle, from MIN up to MAX, and resets on activity
+    OUTBOX_POLL_MIN_INTERVAL: float = Field(default=0.5, gt=0.0, description="Poll interval after activity (s).")
+    OUTBOX_POLL_MAX_INTERVAL: float = Field(default=30.0, gt=0.0, description="Poll interval when idle (s).")
+
+    # Dispatch: events per batch, handlers running at once (in order within an aggregate)
+    OUTBOX_BATCH_SIZE: int = Field(default=100, ge=1)
+    OUTBOX_DISPATCH_CONCURRENCY: int = Field(default=10, ge=1)
+
+    # Lease of a claimed batch, renewed every third of it: a crashed worker's events are pending again once it expires
+    OUTBOX_LEASE_DURATION: float = Field(default=60.0, gt=0.0, description="Lease of the processing events (s).")
+
+    # Retries: exponential backoff with jitter, then dead-lettering (replayed from the admin API)
+    OUTBOX_MAX_ATTEMPTS: int = Field(default=8, ge=1, description="Attempts before dead-lettering.")
+    OUTBOX_RETRY_BASE_DELAY: float = Field(default=1.0, gt=0.0, description="Delay before the first retry (s).")
+    OUTBOX_RETRY_MAX_DELAY: float = Field(default=600.0, gt=0.0, description="Cap of the retry delay (s).")
+
+    OUTBOX_SHUTDOWN_TIMEOUT: float = Field(default=10.0, gt=0.0, description="Wait for the batch in progress (s).")
+
+
+@functools.lru_cache
+def get_outbox_settings():
+    return OutboxSettings()  # type: ignore
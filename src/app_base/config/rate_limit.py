@@ -0,0 +1,22 @@
+import functools
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+RateLimitBackendType = Literal["memory", "redis"]
+
+
+class RateLimitSettings(BaseSettings):
+    RATE_LIMIT_ENABLED: bool = Field(default=True)
+    RATE_LIMIT_BACKEND: RateLimitBackendType = Field(
+        default="memory", description="'memory' limits per worker; 'redis' shares limits across workers."
+    )
+    RATE_LIMIT_REDIS_URL: str = Field(default="redis://localhost:6379/0")
+    RATE_LIMIT_KEY_PREFIX: str = Field(default="ratelimit:")
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = Field(default=100_000, ge=1, description="Buckets kept by the memory backend.")
+
+
+@functools.lru_cache
+def get_rate_limit_settings():
+    return RateLimitSettings()  # type: ignore
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from app_base.core.metrics import get_app_metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-process cache: entries expire `ttl` seconds after being set, and the least
+    recently used ones are evicted beyond `maxsize`.
+
+    Invalidations bump `version`: a value loaded while an invalidation happened (read
+    the version before loading, pass it to `set`) is not stored, so a stale row read
+    concurrently with an update can not overwrite the invalidation.
+
+    Lookups are counted by the `cache_requests_total{cache, result}` metric.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        requests = get_app_metrics().cache_requests
+        self._hit_metric = requests.labels(name, "hit")
+        self._miss_metric = requests.labels(name, "miss")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self.clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._hit_metric.inc()
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        self._miss_metric.inc()
+        return None
+
+    def set(self, key: K, value: V, version: Optional[int] = None) -> bool:
+        """Store `value`, unless something was invalidated since `version`; return whether it was stored."""
+        if version is not None and version != self.version:
+            return False
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, key: K) -> None:
+        self.version += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
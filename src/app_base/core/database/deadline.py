@@ -0,0 +1,68 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class RequestDeadline:
+    """
+    Time budget of the current request, shared with the database layer.
+
+    Wraps the `asyncio.Timeout` of the request. Transactions begun while the deadline
+    is running get a Postgres `statement_timeout` of the remaining budget, so that the
+    server stops statements that outlive the request on its own. When the deadline
+    expires mid-statement, the cancelled request task makes asyncpg cancel the query as
+    well; its connection is rolled back before it goes back to the pool.
+    """
+
+    def __init__(self, timeout: Optional[float]):
+        self.loop = asyncio.get_running_loop()
+        self.started_at = self.loop.time()
+        self.when = None if timeout is None else self.started_at + timeout
+        self.timeout = asyncio.timeout_at(self.when)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None without a deadline."""
+        if self.when is None:
+            return None
+        return max(self.when - self.loop.time(), 0.0)
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """Replace the budget of the request (counted from its start); None lifts it."""
+        self.when = None if timeout is None else self.started_at + timeout
+        if not self.timeout.expired():
+            self.timeout.reschedule(self.when)
+
+
+request_deadline_ctx: ContextVar[Optional[RequestDeadline]] = ContextVar("request_deadline", default=None)
+
+
+def get_remaining_time() -> Optional[float]:
+    """Seconds left in the budget of the current request (None outside a request or without deadline)."""
+    deadline = request_deadline_ctx.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+# ============================================================
+# SQLAlchemy event listeners
+# ============================================================
+
+
+def _after_begin(session, transaction, connection):
+    """Session listener: bound the statements of the transaction by the remaining request budget."""
+    deadline = request_deadline_ctx.get()
+    if deadline is None or connection.dialect.name != "postgresql":
+        return
+    remaining = deadline.remaining()
+    if remaining is None:
+        return
+    # SET does not take bind parameters; the value is an integer computed here
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(int(remaining * 1000), 1)}")
+
+
+def install_deadline_listeners() -> None:
+    """Register the deadline listener on every session (idempotent)."""
+    if not event.contains(Session, "after_begin", _after_begin):
+        event.listen(Session, "after_begin", _after_begin)
@@ -0,0 +1,85 @@
+import sys
+from types import FrameType
+from typing import Optional
+
+import greenlet
+
+from app_base.base.exceptions.db import NPlusOneQueryException
+from app_base.core.database.profiling import fingerprint_sql
+
+# Only frames from these modules are reported (repositories, services, hooks, use cases, endpoints).
+APP_MODULE_PREFIXES = ("app.", "app_base.base.")
+
+
+def _iter_frames(frame: Optional[FrameType]):
+    """Walk the stack, continuing into the parent greenlet (SQLAlchemy's async bridge)."""
+    current = greenlet.getcurrent()
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+        if frame is None and current is not None and current.parent is not None:
+            current = current.parent
+            frame = current.gr_frame
+
+
+def capture_app_frames(limit: int = 8) -> list[str]:
+    """Capture the innermost application frames as 'module:function:lineno'."""
+    frames = []
+    for frame in _iter_frames(sys._getframe(1)):
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(APP_MODULE_PREFIXES):
+            frames.append(f"{module}:{frame.f_code.co_name}:{frame.f_lineno}")
+            if len(frames) >= limit:
+                break
+    return frames
+
+
+class RepeatedQuery:
+    """A statement shape executed repeatedly within one request."""
+
+    def __init__(self, query_id: str, query: str, count: int, frames: list[str]):
+        self.query_id = query_id
+        self.query = query
+        self.count = count
+        self.frames = frames
+
+    def describe(self) -> str:
+        callers = " <- ".join(self.frames) or "unknown caller"
+        return f"{self.count}x [{self.query_id}] {self.query} (at {callers})"
+
+
+class NPlusOneDetector:
+    """
+    Tracks statement fingerprints within one request and reports repeated shapes.
+
+    The calling frames are captured once, when a shape reaches the threshold. In strict
+    mode an NPlusOneQueryException is raised at that point so the offending call site
+    shows up in the traceback.
+    """
+
+    def __init__(self, threshold: int, strict: bool = False):
+        self.threshold = threshold
+        self.strict = strict
+        self._counts: dict[str, int] = {}
+        self._repeated: dict[str, RepeatedQuery] = {}
+
+    @property
+    def repeated_queries(self) -> list[RepeatedQuery]:
+        return list(self._repeated.values())
+
+    def observe(self, statement: str) -> None:
+        query_id, query = fingerprint_sql(statement)
+        count = self._counts.get(query_id, 0) + 1
+        self._counts[query_id] = count
+        if count < self.threshold:
+            return
+
+        repeated = self._repeated.get(query_id)
+        if repeated is not None:
+            repeated.count = count
+            return
+
+        repeated = RepeatedQuery(query_id, query, count, capture_app_frames())
+        self._repeated[query_id] = repeated
+        if self.strict:
+            raise NPlusOneQueryException(log_message=f"N+1 query detected: {repeated.describe()}")
@@ -0,0 +1,268 @@
+import hashlib
+import math
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app_base.config import get_observability_settings
+from app_base.core import tracing
+
+if TYPE_CHECKING:
+    from app_base.core.database.n_plus_one import NPlusOneDetector
+
+BACKGROUND_ROUTE = "<background>"
+
+QueryStatsOrderBy = Literal["total_time", "calls", "mean_time", "p95_time", "max_time"]
+
+# ============================================================
+# SQL Fingerprinting
+# ============================================================
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/|--[^\n]*", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+# asyncpg ($1), psycopg (%(name)s / %s), named (:name) and qmark (?) placeholders
+_PLACEHOLDER_RE = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_CAST_RE = re.compile(r"\?::\w+(?:\[\])?")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_sql(statement: str) -> tuple[str, str]:
+    """
+    Normalize a SQL statement into its "shape" and return ``(query_id, normalized_sql)``.
+
+    Literals and bind placeholders are replaced by ``?``, IN-lists and multi-row VALUES
+    are collapsed to ``(...)`` so that statements differing only in their parameters
+    share a single fingerprint (similar to ``pg_stat_statements.queryid``).
+    """
+    normalized = _COMMENT_RE.sub(" ", statement)
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _PLACEHOLDER_RE.sub("?", normalized)
+    normalized = _CAST_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _LIST_RE.sub("(...)", normalized)
+    normalized = _VALUES_RE.sub("(...)", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
+    query_id = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    return query_id, normalized
+
+
+# ============================================================
+# Per-request query log
+# ============================================================
+
+
+class RequestQueryLog:
+    """Statements executed while handling a single request."""
+
+    def __init__(self, n_plus_one_detector: Optional["NPlusOneDetector"] = None):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: list[tuple[str, float]] = []
+        self.n_plus_one_detector = n_plus_one_detector
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.statements.append((statement, duration))
+        if self.n_plus_one_detector is not None:
+            self.n_plus_one_detector.observe(statement)
+
+
+# Holds a mutable log so that queries executed in child tasks are visible to the middleware.
+request_query_log_ctx: ContextVar[Optional[RequestQueryLog]] = ContextVar("request_query_log", default=None)
+
+
+@contextmanager
+def track_queries(n_plus_one_detector: Optional["NPlusOneDetector"] = None) -> Iterator[RequestQueryLog]:
+    """
+    Record the statements executed within the block into a fresh RequestQueryLog.
+
+    Usage:
+        with track_queries(NPlusOneDetector(threshold=5, strict=True)) as query_log:
+            await use_case.execute(...)
+        assert query_log.count <= 3
+    """
+    query_log = RequestQueryLog(n_plus_one_detector)
+    token = request_query_log_ctx.set(query_log)
+    try:
+        yield query_log
+    finally:
+        request_query_log_ctx.reset(token)
+
+
+def get_query_count() -> int:
+    """Get the number of queries executed so far in the current request."""
+    query_log = request_query_log_ctx.get()
+    return query_log.count if query_log is not None else 0
+
+
+# ============================================================
+# Aggregated statistics
+# ============================================================
+
+
+class QueryStatEntry:
+    """Aggregated timings of one statement fingerprint within one route."""
+
+    def __init__(self, route: str, query_id: str, query: str, sample_size: int):
+        self.route = route
+        self.query_id = query_id
+        self.query = query
+        self.calls = 0
+        self.total_time = 0.0
+        self.min_time = math.inf
+        self.max_time = 0.0
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def add(self, duration: float) -> None:
+        self.calls += 1
+        self.total_time += duration
+        self.min_time = min(self.min_time, duration)
+        self.max_time = max(self.max_time, duration)
+        self._samples.append(duration)
+
+    def percentile(self, q: float) -> float:
+        """Percentile over the most recent samples (nearest-rank)."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+        return ordered[rank]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "route": self.route,
+            "query_id": self.query_id,
+            "query": self.query,
+            "calls": self.calls,
+            "total_time_ms": self.total_time * 1000,
+            "mean_time_ms": self.total_time / self.calls * 1000 if self.calls else 0.0,
+            "min_time_ms": self.min_time * 1000 if self.calls else 0.0,
+            "max_time_ms": self.max_time * 1000,
+            "p95_time_ms": self.percentile(95) * 1000,
+        }
+
+
+class QueryStatsRegistry:
+    """In-process statement statistics keyed by (route, fingerprint)."""
+
+    def __init__(self, max_entries: int, sample_size: int):
+        self.max_entries = max_entries
+        self.sample_size = sample_size
+        self.dropped = 0
+        self._entries: dict[tuple[str, str], QueryStatEntry] = {}
+        self._lock = Lock()
+
+    def _record(self, route: str, statement: str, duration: float) -> None:
+        query_id, query = fingerprint_sql(statement)
+        entry = self._entries.get((route, query_id))
+        if entry is None:
+            if len(self._entries) >= self.max_entries:
+                self.dropped += 1
+                return
+            entry = QueryStatEntry(route, query_id, query, self.sample_size)
+            self._entries[(route, query_id)] = entry
+        entry.add(duration)
+
+    def record(self, route: str, statement: str, duration: float) -> None:
+        with self._lock:
+            self._record(route, statement, duration)
+
+    def record_request(self, route: str, query_log: RequestQueryLog) -> None:
+        with self._lock:
+            for statement, duration in query_log.statements:
+                self._record(route, statement, duration)
+
+    def snapshot(
+        self,
+        route: Optional[str] = None,
+        order_by: QueryStatsOrderBy = "total_time",
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = [entry.snapshot() for entry in self._entries.values() if route is None or entry.route == route]
+        sort_key = "calls" if order_by == "calls" else f"{order_by}_ms"
+        rows.sort(key=lambda row: row[sort_key], reverse=True)
+        return rows[:limit] if limit is not None else rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.dropped = 0
+
+
+@lru_cache
+def get_query_stats_registry() -> QueryStatsRegistry:
+    settings = get_observability_settings()
+    return QueryStatsRegistry(
+        max_entries=settings.QUERY_STATS_MAX_ENTRIES,
+        sample_size=settings.QUERY_STATS_SAMPLE_SIZE,
+    )
+
+
+# ============================================================
+# SQLAlchemy event listeners
+# ============================================================
+
+_START_TIMES_KEY = "query_profiling_start_times"
+
+
+def _record_statement(statement: str, duration: float) -> None:
+    tracer = tracing.get_tracer()
+    if tracer.enabled:
+        tracer.record_span("db.query", duration, {"db.statement": fingerprint_sql(statement)[1]})
+    query_log = request_query_log_ctx.get()
+    if query_log is not None:
+        query_log.add(statement, duration)
+    elif get_observability_settings().QUERY_STATS_ENABLED:
+        get_query_stats_registry().record(BACKGROUND_ROUTE, statement, duration)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """SQLAlchemy event listener: called right before a query is executed."""
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """SQLAlchemy event listener: called right after a query is executed."""
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    _record_statement(statement, time.perf_counter() - start_times.pop())
+
+
+def _handle_error(exception_context):
+    """SQLAlchemy event listener: failed statements are recorded as well."""
+    conn = exception_context.connection
+    if conn is None or exception_context.statement is None:
+        return
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    _record_statement(exception_context.statement, time.perf_counter() - start_times.pop())
+
+
+_LISTENERS = (
+    ("before_cursor_execute", _before_cursor_execute),
+    ("after_cursor_execute", _after_cursor_execute),
+    ("handle_error", _handle_error),
+)
+
+
+def install_query_listeners() -> None:
+    """Register the profiling listeners on every engine (idempotent)."""
+    for identifier, listener in _LISTENERS:
+        if not event.contains(Engine, identifier, listener):
+            event.listen(Engine, identifier, listener)
@@ -1,6 +1,13 @@
+import asyncio
+import logging
 import os.path
+import queue
+import random
 import sys
+import threading
+import time
 from contextvars import ContextVar
+from typing import Callable
 
 from loguru import logger
 
@@ -30,6 +37,176 @@ def format_record(record):
     return record
 
 
+class LogSampler:
+    """
+    Sink filter dropping part of the records below WARNING.
+
+    - Sampling: only a share of the records of a logger are kept (`sample_rates`, by
+      logger name prefix, longest prefix wins).
+    - Rate limiting: a call site (logger, function, line) emits at most `rate_limit`
+      records per `period`; the first record kept afterwards tells how many were dropped.
+
+    The decision is taken once per record and shared by all the sinks.
+    """
+
+    _DECISION_KEY = "_log_sampler_keep"
+
+    def __init__(
+        self,
+        sample_rates: dict[str, float],
+        rate_limit: int = 0,
+        period: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ):
+        self.sample_rates = sorted(sample_rates.items(), key=lambda item: -len(item[0]))
+        self.rate_limit = rate_limit
+        self.period = period
+        self.clock = clock
+        self.rand = rand
+        self._rates_by_name: dict[str, float] = {}
+        # call site -> [window start, records kept, records suppressed]
+        self._windows: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sample_rates) or self.rate_limit > 0
+
+    def sample_rate(self, name: str) -> float:
+        rate = self._rates_by_name.get(name)
+        if rate is None:
+            rate = next(
+                (rate for prefix, rate in self.sample_rates if name == prefix or name.startswith(prefix + ".")),
+                1.0,
+            )
+            self._rates_by_name[name] = rate
+        return rate
+
+    def __call__(self, record) -> bool:
+        keep = record.get(self._DECISION_KEY)
+        if keep is None:
+            keep = record[self._DECISION_KEY] = self._decide(record)
+        return keep
+
+    def _decide(self, record) -> bool:
+        if record["level"].no >= logging.WARNING:
+            return True
+        name = record["name"] or ""
+        rate = self.sample_rate(name)
+        if rate < 1.0 and self.rand() >= rate:
+            return False
+        if not self.rate_limit:
+            return True
+
+        site = (name, record["function"], record["line"])
+        now = self.clock()
+        with self._lock:
+            window = self._windows.get(site)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window is not None else 0
+                self._windows[site] = [now, 1, 0]
+            elif window[1] < self.rate_limit:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record["message"] += f" ({suppressed} similar messages suppressed)"
+        return True
+
+
+class BackgroundSink:
+    """
+    Sink writing from a daemon thread.
+
+    Logging only appends the formatted message to a bounded queue, so that slow
+    writes, flushes and log file rotation (zip compression included) never block the
+    event loop. When the writer cannot keep up, messages are dropped rather than
+    blocking the caller, and the number dropped is reported on stderr.
+
+    `target` is a stream (sys.stdout) or a callable taking the message.
+    """
+
+    def __init__(self, target, max_queue_size: int = 10000):
+        self.target = target
+        self._write = target.write if hasattr(target, "write") else target
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                if message is None:
+                    return
+                self._write(message)
+                if self._queue.empty():
+                    self._flush()
+            except Exception as e:
+                sys.stderr.write(f"Log writer failed: {e!r}\n")
+            finally:
+                self._queue.task_done()
+
+    def _flush(self) -> None:
+        if hasattr(self.target, "flush"):
+            self.target.flush()
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            sys.stderr.write(f"Log queue full: {dropped} messages dropped\n")
+
+    async def complete(self) -> None:
+        """Wait until the queued messages are written (awaited by `logger.complete()`)."""
+        await asyncio.to_thread(self._queue.join)
+
+    def stop(self) -> None:
+        """Write the queued messages and stop the thread (called by `logger.remove()`)."""
+        self._queue.put(None)
+        self._thread.join()
+        if hasattr(self.target, "stop"):
+            self.target.stop()
+
+
+class InterceptHandler(logging.Handler):
+    """Standard library handler forwarding records to loguru (and thus to its sinks and filters)."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level: str | int = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        # Find the caller of the logging call, so that the record gets its module and line
+        frame, depth = logging.currentframe(), 0
+        while frame is not None and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+def intercept_std_loggers(names: list[str], level: str) -> None:
+    """
+    Route the given standard library loggers to loguru.
+
+    Their level is set as well, so that `logger.debug("... %s", value)` below the level
+    returns before the message is formatted.
+    """
+    handler = InterceptHandler()
+    for name in names:
+        std_logger = logging.getLogger(name)
+        std_logger.handlers = [handler]
+        std_logger.setLevel(level)
+        std_logger.propagate = False
+
+
 def setup_logger():
     """Setup the logger with console and file handlers"""
     # Remove default handler
@@ -37,24 +214,32 @@ def setup_logger():
 
     # Log settings (App settings)
     settings = get_app_settings()
+    # The request ID is added once per record (not once per sink)
+    logger.configure(patcher=format_record)
+    sampler = LogSampler(settings.LOG_SAMPLE_RATES, settings.LOG_RATE_LIMIT, settings.LOG_RATE_LIMIT_PERIOD)
+    sink_filter = sampler if sampler.enabled else None
     log_file_path = os.path.join(settings.LOG_PATH)
+    # Console writes run on the writer thread; file writes and rotation (zip compression
+    # included) on the one of loguru (enqueue), both awaited by `logger.complete()`
+    console_sink = BackgroundSink(sys.stdout, settings.LOG_QUEUE_SIZE) if settings.LOG_ENQUEUE else sys.stdout
     common_file_config = {
         "sink": log_file_path,
         "level": settings.LOG_LEVEL,
         "rotation": "1 day",
         "retention": "30 days",
         "compression": "zip",
-        "filter": format_record,
+        "enqueue": settings.LOG_ENQUEUE,
+        "filter": sink_filter,
         "diagnose": False,
     }
 
     if settings.LOG_JSON_FORMAT:
         # 1. Console (JSON)
         logger.add(
-            sys.stdout,
+            console_sink,
             level=settings.LOG_LEVEL,
             serialize=True,
-            filter=format_record,
+            filter=sink_filter,
             backtrace=True,
             diagnose=False,
         )
@@ -67,10 +252,10 @@ def setup_logger():
     else:
         # 1. Console (Text + Color)
         logger.add(
-            sys.stdout,
+            console_sink,
             format="[<yellow>{extra[request_id]}</yellow>] <green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>",
             level=settings.LOG_LEVEL,
-            filter=format_record,
+            filter=sink_filter,
             colorize=True,
             backtrace=True,
             diagnose=True,
@@ -81,6 +266,7 @@ def setup_logger():
             format="[{extra[request_id]}] {time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{line} | {message}",
             backtrace=True,
         )
+    intercept_std_loggers(settings.LOG_STD_LOGGERS, settings.LOG_LEVEL)
     return logger
 
 
@@ -0,0 +1,185 @@
+import asyncio
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Optional
+
+from app_base.config import ObservabilitySettings, get_observability_settings
+from app_base.core.log import logger
+from app_base.core.metrics import get_app_metrics
+
+# Innermost frames kept per stack sample
+_STACK_DEPTH = 12
+
+StackSample = tuple[str, ...]
+
+
+class BlockReport:
+    """One stretch of time during which the event loop did not run any other callback."""
+
+    def __init__(self, started_at: float, duration: float, samples: Counter[StackSample]):
+        self.started_at = started_at
+        self.duration = duration
+        self.sample_count = sum(samples.values())
+        # Most frequent stack first: where the loop thread spent the blocked time
+        self.stacks = samples.most_common(3)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration_ms": self.duration * 1000,
+            "samples": self.sample_count,
+            "stacks": [{"samples": count, "frames": list(stack)} for stack, count in self.stacks],
+        }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+class EventLoopMonitor:
+    """
+    Detect event loop stalls caused by synchronous code (bcrypt, sync SDK clients, file I/O).
+
+    A heartbeat coroutine wakes up every `interval` and records how late it ran (the
+    loop lag). A watchdog thread checks the heartbeat every `sample_interval`: while it
+    is more than `threshold` late, the watchdog samples the stack of the loop thread, so
+    the report logged once the loop runs again shows what was blocking it.
+    """
+
+    def __init__(self, settings: ObservabilitySettings):
+        self.interval = settings.LOOP_MONITOR_INTERVAL
+        self.threshold = settings.LOOP_MONITOR_BLOCK_THRESHOLD
+        self.sample_interval = settings.LOOP_MONITOR_SAMPLE_INTERVAL
+        self.blocks = 0
+        self.reports: deque[BlockReport] = deque(maxlen=settings.LOOP_MONITOR_MAX_REPORTS)
+        self._lags: deque[float] = deque(maxlen=settings.LOOP_MONITOR_WINDOW)
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat is not None
+
+    # ---- event loop side ----
+
+    async def _beat_forever(self) -> None:
+        while True:
+            scheduled_at = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._lags.append(max(now - scheduled_at - self.interval, 0.0))
+            self._last_beat = now
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat = asyncio.create_task(self._beat_forever(), name="loop-monitor-heartbeat")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopped.set()
+        self._heartbeat.cancel()  # type: ignore[union-attr]
+        try:
+            await self._heartbeat  # type: ignore[misc]
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat = None
+        await asyncio.to_thread(self._watchdog.join)  # type: ignore[union-attr]
+        self._watchdog = None
+
+    # ---- watchdog thread ----
+
+    def _sample_stack(self) -> Optional[StackSample]:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+        if frame is None:
+            return None
+        frames = traceback.extract_stack(frame)[-_STACK_DEPTH:]
+        return tuple(f"{f.filename}:{f.lineno} in {f.name}" for f in frames)
+
+    def _watch(self) -> None:
+        blocked_beat: Optional[float] = None
+        samples: Counter[StackSample] = Counter()
+        while not self._stopped.wait(self.sample_interval):
+            last_beat = self._last_beat
+            if blocked_beat is not None and last_beat != blocked_beat:
+                # The heartbeat ran again: the block is over
+                self._report(blocked_beat, last_beat - blocked_beat - self.interval, samples)
+                blocked_beat, samples = None, Counter()
+                continue
+            if time.monotonic() - last_beat - self.interval < self.threshold:
+                continue
+            blocked_beat = last_beat
+            stack = self._sample_stack()
+            if stack is not None:
+                samples[stack] += 1
+
+    def _report(self, beat: float, duration: float, samples: Counter[StackSample]) -> None:
+        started_at = time.time() - (time.monotonic() - beat - self.interval)
+        report = BlockReport(started_at, duration, samples)
+        self.reports.append(report)
+        self.blocks += 1
+        get_app_metrics().event_loop_blocks.inc()
+        stack = "\n    ".join(report.stacks[0][0]) if report.stacks else "<no sample>"
+        logger.warning(
+            "Event loop blocked for {:.0f} ms ({} stack samples), most frequent stack:\n    {}",
+            duration * 1000,
+            report.sample_count,
+            stack,
+        )
+
+    # ---- statistics ----
+
+    def snapshot(self) -> dict[str, Any]:
+        lags = sorted(self._lags)
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "lag_samples": len(lags),
+            "lag_p50_ms": _percentile(lags, 50) * 1000,
+            "lag_p90_ms": _percentile(lags, 90) * 1000,
+            "lag_p99_ms": _percentile(lags, 99) * 1000,
+            "lag_max_ms": (lags[-1] if lags else 0.0) * 1000,
+            "blocks": self.blocks,
+            "reports": [report.snapshot() for report in reversed(self.reports)],
+        }
+
+    def reset(self) -> None:
+        self._lags.clear()
+        self.reports.clear()
+        self.blocks = 0
+
+
+@lru_cache
+def get_event_loop_monitor() -> EventLoopMonitor:
+    return EventLoopMonitor(get_observability_settings())
+
+
+@asynccontextmanager
+async def loop_monitor_lifespan(app):
+    """Run the event loop monitor while the app is running (LOOP_MONITOR_ENABLED)."""
+    if not get_observability_settings().LOOP_MONITOR_ENABLED:
+        yield
+        return
+    monitor = get_event_loop_monitor()
+    monitor.start()
+    try:
+        yield
+    finally:
+        await monitor.stop()
@@ -0,0 +1,195 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Sequence
+
+from app_base.config import get_observability_settings
+from app_base.core.log import logger
+
+try:  # optional: pip install '.[metrics]'
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+MetricsCollector = Callable[[], Awaitable[None]]
+
+_collectors: list[MetricsCollector] = []
+
+
+# ============================================================
+# Metric factories (no-ops without prometheus_client)
+# ============================================================
+
+
+class _NoopMetric:
+    """Stands in for a metric when prometheus_client is not installed."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+def metrics_available() -> bool:
+    return prometheus_client is not None
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return prometheus_client.Counter(name, documentation, labelnames)
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = (), multiprocess_mode: str = "livesum"):
+    """
+    A gauge; `multiprocess_mode` says how the values of the workers are combined
+    (livesum, max, min, liveall, ...), see prometheus_client.
+    """
+    if prometheus_client is None:
+        return _NoopMetric()
+    return prometheus_client.Gauge(name, documentation, labelnames, multiprocess_mode=multiprocess_mode)
+
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Optional[Sequence[float]] = None):
+    if prometheus_client is None:
+        return _NoopMetric()
+    if buckets is None:
+        return prometheus_client.Histogram(name, documentation, labelnames)
+    return prometheus_client.Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+# ============================================================
+# Application metrics
+# ============================================================
+
+
+class AppMetrics:
+    """HTTP, database and event loop metrics of the process."""
+
+    def __init__(self, latency_buckets: Sequence[float]):
+        self.request_duration = histogram(
+            "http_request_duration_seconds",
+            "Time to handle a request, by route template and status.",
+            ["method", "route", "status"],
+            buckets=latency_buckets,
+        )
+        self.requests_in_flight = gauge("http_requests_in_flight", "Requests currently being handled.")
+        self.request_queries = histogram(
+            "http_request_db_queries",
+            "Database statements executed per request, by route template.",
+            ["method", "route"],
+            buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+        )
+        self.db_pool_size = gauge("db_pool_size", "Configured size of the connection pool.")
+        self.db_pool_checked_out = gauge("db_pool_checked_out", "Connections currently checked out of the pool.")
+        self.db_pool_overflow = gauge("db_pool_overflow", "Connections opened beyond the pool size.")
+        self.event_loop_lag = histogram(
+            "event_loop_lag_seconds",
+            "Delay of a timer callback behind its schedule (time the loop was busy).",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+        )
+        self.event_loop_blocks = counter(
+            "event_loop_blocks_total", "Times the event loop was blocked beyond the monitor threshold."
+        )
+        self.cache_requests = counter(
+            "cache_requests_total", "In-process cache lookups, by cache and result (hit/miss).", ["cache", "result"]
+        )
+
+
+@lru_cache
+def get_app_metrics() -> AppMetrics:
+    return AppMetrics(latency_buckets=get_observability_settings().METRICS_LATENCY_BUCKETS)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format; return (body, content type).
+
+    In multiprocess mode (PROMETHEUS_MULTIPROC_DIR set, e.g. under gunicorn) the values
+    written by every worker are aggregated, so any worker can answer the scrape.
+    """
+    if prometheus_client is None:
+        raise RuntimeError("Metrics require the 'metrics' extra (prometheus-client).")
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
+
+# ============================================================
+# Periodic sampling
+# ============================================================
+
+
+def register_metrics_collector(collector: MetricsCollector) -> None:
+    """Register an async function refreshing gauges (e.g. queue depths), run periodically."""
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+async def collect_db_pool_metrics() -> None:
+    from app_base.core.database.engine import get_async_engine
+
+    pool = get_async_engine().sync_engine.pool
+    metrics = get_app_metrics()
+    # Only queue-style pools have a size (NullPool/StaticPool do not)
+    if hasattr(pool, "checkedout"):
+        metrics.db_pool_size.set(pool.size())
+        metrics.db_pool_checked_out.set(pool.checkedout())
+        metrics.db_pool_overflow.set(max(pool.overflow(), 0))
+
+
+async def run_collectors() -> None:
+    for collector in (collect_db_pool_metrics, *_collectors):
+        try:
+            await collector()
+        except Exception as e:
+            logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+
+
+async def _sample_forever(lag_interval: float, collect_interval: float) -> None:
+    loop = asyncio.get_running_loop()
+    metrics = get_app_metrics()
+    next_collect_at = loop.time()
+    while True:
+        scheduled_at = loop.time()
+        await asyncio.sleep(lag_interval)
+        metrics.event_loop_lag.observe(max(loop.time() - scheduled_at - lag_interval, 0.0))
+        if loop.time() >= next_collect_at:
+            await run_collectors()
+            next_collect_at = loop.time() + collect_interval
+
+
+@asynccontextmanager
+async def metrics_lifespan(app):
+    """Sample event loop lag and run the registered collectors while the app is running."""
+    settings = get_observability_settings()
+    if not settings.METRICS_ENABLED or prometheus_client is None:
+        yield
+        return
+    task = asyncio.create_task(
+        _sample_forever(settings.METRICS_LOOP_LAG_INTERVAL, settings.METRICS_COLLECT_INTERVAL),
+        name="metrics-sampler",
+    )
+    try:
+        yield
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -1,9 +1,27 @@
-from . import cors_middleware, query_counter, request_id_middleware, security_header, timeout_middleware
+from . import (
+    compression,
+    concurrency_limit,
+    cors_middleware,
+    metrics,
+    profiler,
+    query_counter,
+    request_id_middleware,
+    security_header,
+    server_timing,
+    timeout_middleware,
+    tracing,
+)
 
 __all__ = [
+    "compression",
+    "concurrency_limit",
     "cors_middleware",
+    "metrics",
+    "profiler",
     "query_counter",
     "request_id_middleware",
     "security_header",
+    "server_timing",
     "timeout_middleware",
+    "tracing",
 ]
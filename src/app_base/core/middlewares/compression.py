@@ -0,0 +1,231 @@
+import zlib
+from functools import lru_cache
+from typing import Callable, Optional, Protocol
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import HTTPSettings, get_http_settings
+
+try:  # optional: pip install '.[compression]'
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:  # optional: pip install '.[compression]'
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Statuses without a body, or whose body must not be re-encoded
+_SKIPPED_STATUSES = frozenset({204, 206, 304})
+
+
+# ============================================================
+# Encoders
+# ============================================================
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def get_encoder_factories(settings: HTTPSettings) -> dict[str, Callable[[], Encoder]]:
+    """Encoders that are both enabled in the settings and importable, keyed by content-coding."""
+    factories: dict[str, Callable[[], Encoder]] = {"gzip": lambda: GzipEncoder(settings.COMPRESSION_GZIP_LEVEL)}
+    if brotli is not None:
+        factories["br"] = lambda: BrotliEncoder(settings.COMPRESSION_BROTLI_QUALITY)
+    if zstandard is not None:
+        factories["zstd"] = lambda: ZstdEncoder(settings.COMPRESSION_ZSTD_LEVEL)
+    return {name: factories[name] for name in settings.COMPRESSION_ENCODINGS if name in factories}
+
+
+@lru_cache(maxsize=256)
+def select_encoding(accept_encoding: str, supported: tuple[str, ...]) -> Optional[str]:
+    """
+    Pick the content-coding to use from an Accept-Encoding header.
+
+    The highest q-value wins; ties are broken by the order of `supported` (server preference).
+    `*` matches any supported coding not listed explicitly, and q=0 excludes a coding.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for name in supported:
+        q = weights.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+# ============================================================
+# Middleware
+# ============================================================
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd, brotli or gzip, as negotiated from Accept-Encoding.
+
+    Bodies sent in one message are compressed only if they reach COMPRESSION_MINIMUM_SIZE.
+    Streamed bodies (more_body=True) are compressed chunk by chunk without buffering, and
+    Content-Length is dropped. Already encoded responses, partial content and excluded
+    content types (already compressed media, event streams) are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[HTTPSettings] = None):
+        self.app = app
+        self.settings = settings or get_http_settings()
+        self.encoder_factories = get_encoder_factories(self.settings)
+        self.supported = tuple(self.encoder_factories)
+        self.excluded_content_types = tuple(self.settings.COMPRESSION_EXCLUDED_CONTENT_TYPES)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        encoding = select_encoding(accept_encoding, self.supported) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in _SKIPPED_STATUSES:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(self.excluded_content_types)
+
+
+class CompressionResponder:
+    """Per-request send wrapper: holds the response start until the first body chunk is known."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str):
+        self.middleware = middleware
+        self.downstream_send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[Encoder] = None
+        self.passthrough = False
+
+    async def send(self, message: Message):
+        if self.passthrough:
+            await self.downstream_send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            if self.middleware.is_compressible(message):
+                self.start_message = message
+            else:
+                self.passthrough = True
+                await self.downstream_send(message)
+            return
+
+        if self.start_message is None or message["type"] != "http.response.body":
+            # e.g. http.response.pathsend: the server sends the file itself
+            await self._send_uncompressed(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body and len(body) < self.middleware.settings.COMPRESSION_MINIMUM_SIZE:
+                await self._send_uncompressed(message)
+                return
+            self.encoder = self.middleware.encoder_factories[self.encoding]()
+            compressed = self._compress(body, more_body)
+            await self.downstream_send(self._compressed_start(compressed, more_body))
+        else:
+            compressed = self._compress(body, more_body)
+
+        await self.downstream_send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        assert self.encoder is not None
+        compressed = self.encoder.compress(body)
+        return compressed if more_body else compressed + self.encoder.finish()
+
+    def _compressed_start(self, compressed: bytes, more_body: bool) -> Message:
+        assert self.start_message is not None
+        headers = MutableHeaders(scope=self.start_message)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(compressed))
+        # The encoded bytes differ from the identity representation: a strong ETag no longer holds
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return self.start_message
+
+    async def _send_uncompressed(self, message: Message):
+        self.passthrough = True
+        if self.start_message is not None:
+            await self.downstream_send(self.start_message)
+        await self.downstream_send(message)
+
+
+def add_middleware(app: FastAPI):
+    """Add response compression middleware to FastAPI app"""
+    app.add_middleware(CompressionMiddleware)
@@ -0,0 +1,201 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import FastAPI
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import HTTPSettings, get_http_settings
+from app_base.core.log import logger
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Responses that mean the request could not be served in time (by us or by a dependency)
+_OVERLOAD_STATUSES = frozenset({503, 504})
+# Smoothing factor of the baseline latency (EWMA)
+_BASELINE_ALPHA = 0.05
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit with a bounded FIFO wait queue.
+
+    Every completed request is a latency sample. While samples stay within
+    `latency_tolerance` x the baseline (a slow moving average of past samples) and the
+    limit is actually used, the limit grows by about one per `limit` completions. A
+    slower sample or a 503/504 shrinks it by `backoff_ratio`, at most once per
+    baseline latency so that a burst of slow requests counts as one overload signal.
+
+    When the limit is reached requests wait in the queue for up to `queue_timeout`; a
+    full queue or an expired wait sheds the request.
+    """
+
+    def __init__(self, name: str, settings: HTTPSettings):
+        self.name = name
+        self.settings = settings
+        self.limit = float(settings.CONCURRENCY_LIMIT_INITIAL)
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.accepted = 0
+        self.rejected = 0
+        self._last_decrease_at = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed; False if the request must be shed."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.accepted += 1
+            return True
+        if len(self._waiters) >= self.settings.CONCURRENCY_LIMIT_QUEUE_SIZE:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.settings.CONCURRENCY_LIMIT_QUEUE_TIMEOUT):
+                await waiter
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right as the wait ended: give it back
+                self.in_flight -= 1
+                self._wake_waiters()
+            else:
+                # Already dropped if a release ran between the timeout and this task resuming
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(exc, TimeoutError):
+                self.rejected += 1
+                return False
+            raise
+        self.accepted += 1
+        return True
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """Free the slot and adjust the limit from the outcome of the request."""
+        utilized = self.in_flight >= self.limit / 2
+        self.in_flight -= 1
+        self._adjust(latency, overloaded, utilized)
+        self._wake_waiters()
+
+    def _adjust(self, latency: float, overloaded: bool, utilized: bool) -> None:
+        settings = self.settings
+        if self.baseline is not None and latency > settings.CONCURRENCY_LIMIT_LATENCY_TOLERANCE * self.baseline:
+            overloaded = True
+
+        if overloaded:
+            now = time.monotonic()
+            if now - self._last_decrease_at >= (self.baseline or 0.0):
+                self.limit = max(
+                    float(settings.CONCURRENCY_LIMIT_MIN), self.limit * settings.CONCURRENCY_LIMIT_BACKOFF_RATIO
+                )
+                self._last_decrease_at = now
+        elif utilized:
+            self.limit = min(float(settings.CONCURRENCY_LIMIT_MAX), self.limit + 1 / self.limit)
+
+        self.baseline = (
+            latency if self.baseline is None else self.baseline + _BASELINE_ALPHA * (latency - self.baseline)
+        )
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "route_class": self.name,
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "baseline_latency_ms": (self.baseline or 0.0) * 1000,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+        }
+
+
+@lru_cache
+def get_concurrency_limiters() -> dict[str, AdaptiveLimiter]:
+    """The limiters of this worker, by route class."""
+    return {}
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Shed load with a fast 503 + Retry-After instead of queueing requests until they time out.
+
+    Each route class (by path prefix, otherwise 'read'/'write' by method) has its own
+    AdaptiveLimiter, so slow writes do not starve reads. Exempt paths (health checks,
+    docs) are never limited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Optional[HTTPSettings] = None,
+        limiters: Optional[dict[str, AdaptiveLimiter]] = None,
+    ):
+        self.app = app
+        self.settings = settings or get_http_settings()
+        self.limiters = limiters if limiters is not None else get_concurrency_limiters()
+        self.exempt_paths = tuple(self.settings.CONCURRENCY_LIMIT_EXEMPT_PATHS)
+        # Longest prefix first
+        self.route_classes = sorted(self.settings.CONCURRENCY_LIMIT_ROUTE_CLASSES.items(), key=lambda i: -len(i[0]))
+
+    def get_route_class(self, scope: Scope) -> str:
+        path = scope["path"]
+        for prefix, route_class in self.route_classes:
+            if path.startswith(prefix):
+                return route_class
+        return "read" if scope["method"] in _READ_METHODS else "write"
+
+    def get_limiter(self, route_class: str) -> AdaptiveLimiter:
+        limiter = self.limiters.get(route_class)
+        if limiter is None:
+            limiter = self.limiters[route_class] = AdaptiveLimiter(route_class, self.settings)
+        return limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not self.settings.CONCURRENCY_LIMIT_ENABLED
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.get_limiter(self.get_route_class(scope))
+        if not await limiter.acquire():
+            logger.debug("Request shed ({} limit {}): {}", limiter.name, int(limiter.limit), scope["path"])
+            response = Response(
+                "Server is busy, please retry later",
+                status_code=503,
+                headers={"Retry-After": str(self.settings.CONCURRENCY_LIMIT_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            limiter.release(time.perf_counter() - started_at, overloaded=status_code in _OVERLOAD_STATUSES)
+
+
+def add_middleware(app: FastAPI):
+    """Add adaptive concurrency limit middleware to FastAPI app"""
+    app.add_middleware(ConcurrencyLimitMiddleware)
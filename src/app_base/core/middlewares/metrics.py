@@ -0,0 +1,53 @@
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import get_observability_settings
+from app_base.core.database.profiling import get_query_count
+from app_base.core.metrics import get_app_metrics, metrics_available
+from app_base.core.middlewares.utils import UNMATCHED_ROUTE, get_route_template
+
+
+class MetricsMiddleware:
+    """
+    Record Prometheus request metrics: latency by route template and status, requests in
+    flight and statements per request.
+
+    Must run inside QueryCounterMiddleware to see the query log of the request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.metrics = get_app_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.metrics.requests_in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            self.metrics.requests_in_flight.dec()
+            method = scope["method"]
+            route = get_route_template(scope) or UNMATCHED_ROUTE
+            self.metrics.request_duration.labels(method, route, str(status_code)).observe(duration)
+            self.metrics.request_queries.labels(method, route).observe(get_query_count())
+
+
+def add_middleware(app: FastAPI):
+    """Add Prometheus metrics middleware to FastAPI app"""
+    if get_observability_settings().METRICS_ENABLED and metrics_available():
+        app.add_middleware(MetricsMiddleware)
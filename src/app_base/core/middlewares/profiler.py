@@ -0,0 +1,207 @@
+import asyncio
+import os
+import re
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+import orjson
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import get_observability_settings
+from app_base.core.log import logger, request_id_var
+from app_base.core.middlewares.utils import get_route_template
+
+try:  # optional: pip install '.[profiling]'
+    import pyinstrument
+    from pyinstrument.renderers import HTMLRenderer, JSONRenderer, SpeedscopeRenderer
+    from pyinstrument.session import Session
+except ImportError:  # pragma: no cover
+    pyinstrument = None
+
+ProfileFormat = Literal["html", "json", "speedscope"]
+Authorizer = Callable[[Scope], Awaitable[bool]]
+
+# Requested with "store": the response is returned as usual and the profile is kept for download
+STORE = "store"
+
+_MEDIA_TYPES: dict[str, str] = {
+    "html": "text/html; charset=utf-8",
+    "json": "application/json",
+    "speedscope": "application/json",
+}
+_PROFILE_ID = re.compile(r"^[0-9a-f]{8,32}$")
+
+
+def profiling_available() -> bool:
+    return pyinstrument is not None
+
+
+def render_profile(session: "Session", fmt: ProfileFormat) -> tuple[bytes, str]:
+    """Render a profiler session as (body, media type)."""
+    if fmt == "html":
+        renderer: Any = HTMLRenderer()
+    elif fmt == "speedscope":
+        renderer = SpeedscopeRenderer()
+    else:
+        renderer = JSONRenderer()
+    return renderer.render(session).encode(), _MEDIA_TYPES[fmt]
+
+
+class ProfileStore:
+    """
+    Profiles kept on disk for later download: `<id>.pyisession` (the samples) next to
+    `<id>.json` (what was profiled). Only the `max_profiles` most recent are kept.
+
+    The directory is shared by the workers, so a profile can be downloaded from any of them.
+    """
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+
+    def _paths(self, profile_id: str) -> tuple[Path, Path]:
+        return self.directory / f"{profile_id}.pyisession", self.directory / f"{profile_id}.json"
+
+    def save(self, profile_id: str, session: "Session", info: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        session_path, info_path = self._paths(profile_id)
+        session.save(str(session_path))
+        info_path.write_bytes(orjson.dumps(info))
+        self._prune()
+
+    def _prune(self) -> None:
+        infos = sorted(self.directory.glob("*.json"), key=os.path.getmtime, reverse=True)
+        for info_path in infos[self.max_profiles :]:
+            for path in self._paths(info_path.stem):
+                path.unlink(missing_ok=True)
+
+    def list(self) -> list[dict[str, Any]]:
+        """The stored profiles, most recent first."""
+        if not self.directory.is_dir():
+            return []
+        infos = []
+        for info_path in self.directory.glob("*.json"):
+            try:
+                infos.append(orjson.loads(info_path.read_bytes()))
+            except (OSError, orjson.JSONDecodeError):
+                continue  # pruned or being written by another worker
+        return sorted(infos, key=lambda info: info["created_at"], reverse=True)
+
+    def load(self, profile_id: str) -> Optional["Session"]:
+        if pyinstrument is None or not _PROFILE_ID.match(profile_id):
+            return None
+        session_path, _ = self._paths(profile_id)
+        if not session_path.is_file():
+            return None
+        return Session.load(str(session_path))
+
+
+@lru_cache
+def get_profile_store() -> ProfileStore:
+    settings = get_observability_settings()
+    return ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_STORED)
+
+
+class RequestProfilerMiddleware:
+    """
+    Profile a single request on demand, with a sampling profiler (pyinstrument): the call
+    tree covers the middlewares inside this one, dependency resolution, the use case,
+    service hooks, repositories and SQL execution. Only the event loop thread is sampled:
+    sync dependencies and endpoints show up as time awaiting the threadpool.
+
+    Triggered by the `X-Profile` header or the `_profile` query parameter (see PROFILING_*):
+        html / json / speedscope   the profile is returned instead of the endpoint response
+        store                      the response is returned as usual with an X-Profile-ID
+                                   header; the profile is downloaded from the diagnostics API
+
+    Only requests accepted by `authorize` (admins) are profiled, the others run as usual.
+    Must run inside RequestIDMiddleware, so that profiles are saved under the request ID.
+    """
+
+    def __init__(self, app: ASGIApp, authorize: Authorizer):
+        self.app = app
+        self.authorize = authorize
+        self.settings = get_observability_settings()
+
+    def _requested_mode(self, scope: Scope) -> Optional[str]:
+        mode = Headers(scope=scope).get(self.settings.PROFILING_HEADER)
+        if mode is None and scope.get("query_string"):
+            mode = QueryParams(scope["query_string"]).get(self.settings.PROFILING_QUERY_PARAM)
+        if mode is None:
+            return None
+        mode = mode.strip().lower() or "html"
+        return mode if mode == STORE or mode in _MEDIA_TYPES else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = self._requested_mode(scope)
+        if mode is None or not await self.authorize(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = request_id_var.get()
+        if not _PROFILE_ID.match(profile_id):
+            profile_id = uuid.uuid4().hex[:16]
+        status_code = 500
+
+        async def send_with_profile_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Profile-ID"] = profile_id
+            await send(message)
+
+        async def discard_response(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        profiler = pyinstrument.Profiler(interval=self.settings.PROFILING_INTERVAL, async_mode="enabled")
+        created_at = time.time()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id if mode == STORE else discard_response)
+        finally:
+            session = profiler.stop()
+            info = {
+                "id": profile_id,
+                "created_at": created_at,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": get_route_template(scope),
+                "status_code": status_code,
+                "duration_ms": session.duration * 1000,
+                "samples": session.sample_count,
+            }
+            logger.info("Profiled {} {} ({:.0f} ms): {}", info["method"], info["path"], info["duration_ms"], mode)
+            if mode == STORE:
+                await asyncio.to_thread(get_profile_store().save, profile_id, session, info)
+
+        if mode != STORE:
+            body, media_type = await asyncio.to_thread(render_profile, session, mode)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", media_type.encode()),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"x-profiled-status", str(status_code).encode()),
+                        (b"cache-control", b"no-store"),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+
+def add_middleware(app: FastAPI, authorize: Authorizer):
+    """Add the on-demand request profiler to FastAPI app (needs the optional "profiling" extra)"""
+    if get_observability_settings().PROFILING_ENABLED and profiling_available():
+        app.add_middleware(RequestProfilerMiddleware, authorize=authorize)
@@ -1,55 +1,59 @@
-from contextvars import ContextVar
-from typing import Callable
-
-from fastapi import FastAPI, Request, Response
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import get_observability_settings
+from app_base.core.database.n_plus_one import NPlusOneDetector
+from app_base.core.database.profiling import (
+    get_query_stats_registry,
+    install_query_listeners,
+    track_queries,
+)
 from app_base.core.log import logger
-
-query_count_ctx: ContextVar[int] = ContextVar("query_count", default=0)
+from app_base.core.middlewares.utils import get_route_name
 
 
-def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """SQLAlchemy event listener: called right before a query is executed."""
-    # Increment the query count for the current context by 1
-    try:
-        current_count = query_count_ctx.get()
-        query_count_ctx.set(current_count + 1)
-    except LookupError:
-        pass
-
-
-class QueryCounterMiddleware(BaseHTTPMiddleware):
+class QueryCounterMiddleware:
     QUERY_COUNT_WARNING_THRESHOLD: int = 20
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # 1. Initialize counter (starts at 0)
-        token = query_count_ctx.set(0)
-
-        # 2. Process request (DB queries that occur here are counted)
-        response = await call_next(request)
-
-        # 3. Get the result
-        query_count = query_count_ctx.get()
-
-        # 4. Add to response headers (can be checked by frontend or client)
-        response.headers["X-Query-Count"] = str(query_count)
-
-        # (Optional) If there are too many queries, print a warning log (for detecting N+1 problems)
-        if query_count > self.QUERY_COUNT_WARNING_THRESHOLD:
-            logger.warning(f"Too many queries ({query_count}) in request: {request.method} {request.url.path}")
-
-        # 5. Clean up context
-        query_count_ctx.reset(token)
-
-        return response
+        self.app = app
+        self.settings = get_observability_settings()
+        install_query_listeners()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 1. Initialize the per-request query log (statements are timed by the engine listeners)
+        detector = None
+        if self.settings.N_PLUS_ONE_ENABLED:
+            detector = NPlusOneDetector(self.settings.N_PLUS_ONE_THRESHOLD, strict=self.settings.N_PLUS_ONE_STRICT)
+
+        # 2. Process request (DB queries that occur here are recorded)
+        with track_queries(detector) as query_log:
+
+            async def send_with_query_count(message: Message):
+                # 3. Add to response headers (can be checked by frontend or client)
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message)["X-Query-Count"] = str(query_log.count)
+                await send(message)
+
+            await self.app(scope, receive, send_with_query_count)
+
+        # (Optional) If there are too many queries, print a warning log
+        if query_log.count > self.QUERY_COUNT_WARNING_THRESHOLD:
+            logger.warning(f"Too many queries ({query_log.count}) in request: {scope['method']} {scope['path']}")
+
+        # 4. Report repeated statement shapes (N+1 problems)
+        if detector is not None:
+            for repeated in detector.repeated_queries:
+                logger.warning(f"N+1 query suspected in {get_route_name(scope)}: {repeated.describe()}")
+
+        # 5. Aggregate per-statement timings by route template
+        if self.settings.QUERY_STATS_ENABLED and query_log.count:
+            get_query_stats_registry().record_request(get_route_name(scope), query_log)
 
 
 def add_middleware(app: FastAPI):
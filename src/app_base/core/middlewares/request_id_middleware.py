@@ -1,43 +1,53 @@
 import uuid
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app_base.core.log import logger, set_request_id
+from app_base.core.log import logger, request_id_var
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware to add request ID to each request"""
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())[:8]
 
-        # Set request ID in context
-        set_request_id(request_id)
+        # Set request ID in context (visible to everything downstream, reset afterwards)
+        token = request_id_var.set(request_id)
 
-        # Add request ID to request state for access in endpoints
-        request.state.request_id = request_id
+        # Add request ID to request state for access in endpoints (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Log request start
-        logger.debug(
-            f"Request started: {request.method} {request.url.path}",
-            extra={"request_id": request_id},
-        )
-
-        # Process request
-        response = await call_next(request)
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        # Log request completion
-        logger.debug(
-            f"Request completed: {request.method} {request.url.path} - Status: {response.status_code}",
-            extra={"request_id": request_id},
-        )
-
-        return response
+        logger.debug("Request started: {} {}", scope["method"], scope["path"])
+
+        status_code = 0
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_request_id)
+
+            # Log request completion
+            logger.debug("Request completed: {} {} - Status: {}", scope["method"], scope["path"], status_code)
+        finally:
+            request_id_var.reset(token)
 
 
 def add_middleware(app: FastAPI):
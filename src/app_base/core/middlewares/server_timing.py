@@ -0,0 +1,90 @@
+import random
+import time
+from typing import Optional
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import get_observability_settings
+from app_base.core.database.profiling import request_query_log_ctx
+from app_base.core.log import logger
+from app_base.core.middlewares.utils import get_route_name
+from app_base.core.timing import (
+    AUTH_PHASE,
+    HOOKS_PHASE,
+    USECASE_PHASE,
+    RequestTimings,
+    format_server_timing,
+    track_timings,
+)
+
+
+class ServerTimingMiddleware:
+    """
+    Emit a `Server-Timing` header with a per-layer breakdown of the request.
+
+    Metrics (milliseconds):
+        auth       token decoding and loading the current user
+        usecase    BaseUseCase.execute (includes hooks, db and the transaction)
+        hooks      service hooks (_context_*, _prepare_*, _post_*)
+        db         SQL execution time, with the statement count as description
+        serialize  from the use case returning to the response start (validation + rendering)
+        total      from entering this middleware to the response start
+
+    Requests slower than SLOW_REQUEST_THRESHOLD_MS are sampled into the logs with the
+    same breakdown as structured fields.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.settings = get_observability_settings()
+
+    @staticmethod
+    def _collect(timings: RequestTimings, response_started_at: float) -> list[tuple[str, float, Optional[str]]]:
+        metrics: list[tuple[str, float, Optional[str]]] = []
+        for name in (AUTH_PHASE, USECASE_PHASE, HOOKS_PHASE):
+            if name in timings.durations:
+                metrics.append((name, timings.durations[name], None))
+
+        query_log = request_query_log_ctx.get()
+        if query_log is not None and query_log.count:
+            metrics.append(("db", query_log.total_time, f"{query_log.count} queries"))
+
+        usecase_ended_at = timings.ended_at.get(USECASE_PHASE)
+        if usecase_ended_at is not None:
+            metrics.append(("serialize", response_started_at - usecase_ended_at, None))
+
+        metrics.append(("total", response_started_at - timings.started_at, None))
+        return metrics
+
+    def _log_slow_request(self, scope: Scope, status_code: int, metrics) -> None:
+        if random.random() >= self.settings.SLOW_REQUEST_LOG_SAMPLE_RATE:
+            return
+        breakdown = {name: round(duration * 1000, 2) for name, duration, _ in metrics}
+        route = get_route_name(scope)
+        logger.bind(route=route, status_code=status_code, timings_ms=breakdown).warning(
+            f"Slow request: {route} took {breakdown['total']:.0f}ms ({format_server_timing(metrics)})"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.settings.SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        with track_timings() as timings:
+
+            async def send_with_server_timing(message: Message):
+                if message["type"] == "http.response.start":
+                    metrics = self._collect(timings, time.perf_counter())
+                    MutableHeaders(scope=message).append("Server-Timing", format_server_timing(metrics))
+                    if metrics[-1][1] * 1000 >= self.settings.SLOW_REQUEST_THRESHOLD_MS:
+                        self._log_slow_request(scope, message["status"], metrics)
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+
+def add_middleware(app: FastAPI):
+    """Add Server-Timing middleware to FastAPI app (inside the query counter, to read the query log)"""
+    app.add_middleware(ServerTimingMiddleware)
@@ -1,22 +1,59 @@
-import asyncio
+from typing import Optional
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app_base.config import HTTPSettings, get_http_settings
+from app_base.core.database.deadline import RequestDeadline, install_deadline_listeners, request_deadline_ctx
 from app_base.core.log import logger
 
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, timeout: int = 60):
-        super().__init__(app)
-        self.timeout = timeout
+class TimeoutMiddleware:
+    """
+    Answer with 504 when the app has not started its response within the request timeout.
 
-    async def dispatch(self, request: Request, call_next):
+    The timeout defaults to REQUEST_TIMEOUT; routes override it with the `request_timeout`
+    dependency. The deadline is shared with the database layer through `request_deadline_ctx`
+    (statement_timeout of the remaining budget, see RequestDeadline).
+    Once the response has started the deadline is lifted, so streaming bodies are not cut off.
+    """
+
+    def __init__(self, app: ASGIApp, timeout: Optional[float] = None, settings: Optional[HTTPSettings] = None):
+        self.app = app
+        self.settings = settings or get_http_settings()
+        self.timeout = timeout if timeout is not None else self.settings.REQUEST_TIMEOUT
+        if self.settings.REQUEST_TIMEOUT_DB_PROPAGATION:
+            install_deadline_listeners()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline = RequestDeadline(self.timeout)
+        response_started = False
+
+        async def send_lifting_deadline(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                if not deadline.timeout.expired():
+                    deadline.set_timeout(None)
+            await send(message)
+
+        token = request_deadline_ctx.set(deadline)
         try:
-            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
-        except asyncio.TimeoutError:
-            logger.error(f"Request timeout: {request.url.path}")
-            return Response("Request processing time exceeded limit", status_code=504)
+            async with deadline.timeout:
+                await self.app(scope, receive, send_lifting_deadline)
+        except TimeoutError:
+            if not deadline.timeout.expired() or response_started:
+                raise
+            logger.error(f"Request timeout: {scope['path']}")
+            response = Response("Request processing time exceeded limit", status_code=504)
+            await response(scope, receive, send)
+        finally:
+            request_deadline_ctx.reset(token)
 
 
 def add_middleware(app: FastAPI):
@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app_base.config import get_observability_settings
+from app_base.core import tracing
+from app_base.core.middlewares.utils import get_route_template
+from app_base.core.tracing import SPAN_KIND_SERVER, STATUS_ERROR
+
+
+class TracingMiddleware:
+    """
+    Open the root span of each request ("GET /api/v1/memos/{memo_id}"), under which
+    the use case, hook, repository and SQL spans are recorded.
+
+    Must run inside RequestIDMiddleware: the trace id is derived from the request id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        tracer = tracing.get_tracer()
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        attributes = {"http.method": method, "http.target": scope["path"]}
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with tracer.start_span(f"{method} {scope['path']}", kind=SPAN_KIND_SERVER, attributes=attributes) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span is not None:
+                    route = get_route_template(scope)
+                    if route is not None:
+                        span.name = f"{method} {route}"
+                        span.set_attribute("http.route", route)
+                    span.set_attribute("http.status_code", status_code)
+                    if status_code >= 500:
+                        span.status = STATUS_ERROR
+
+
+def add_middleware(app: FastAPI):
+    """Add tracing middleware to FastAPI app"""
+    if get_observability_settings().TRACING_ENABLED:
+        app.add_middleware(TracingMiddleware)
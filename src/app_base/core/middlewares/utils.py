@@ -0,0 +1,30 @@
+from starlette.types import Scope
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def get_route_template(scope: Scope) -> str | None:
+    """
+    Get the path template ("/api/v1/workspaces/{workspace_id}") of the matched route.
+
+    Only available after routing, i.e. once the downstream app has handled the request.
+    """
+    # FastAPI resolves included routers lazily: "route" is then the route as declared in its
+    # router (without the include prefixes), and the route as included is kept in its scope
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    # path_format is the path without converters ("{memo_id}" for "{memo_id:int}"), relative
+    # to the mount point of the routes (root_path)
+    route_path = getattr(route, "path_format", None)
+    if route_path is None:
+        return None
+    return scope.get("root_path", "") + route_path
+
+
+def get_route_name(scope: Scope) -> str:
+    """
+    Get "METHOD /path/{template}" for the matched route.
+
+    Uses the route template rather than the raw path so that stats are not split per id.
+    """
+    template = get_route_template(scope) or UNMATCHED_ROUTE
+    return f"{scope.get('method', '')} {template}".strip()
@@ -0,0 +1,108 @@
+import asyncio
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class CoalescingStats:
+    """Executions vs. coalesced calls of one route."""
+
+    def __init__(self, route: str):
+        self.route = route
+        self.executions = 0
+        self.coalesced = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        calls = self.executions + self.coalesced
+        return {
+            "route": self.route,
+            "calls": calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": self.coalesced / calls if calls else 0.0,
+        }
+
+
+class Singleflight(Generic[T]):
+    """
+    Coalesce concurrent calls sharing a key into a single execution.
+
+    The first caller (the leader) starts the call in its own task; callers arriving
+    while it is in flight await the same task and get the same result or exception.
+    Nothing is cached: once the call completes the next caller starts a new one.
+    A cancelled caller (e.g. a client disconnect) does not cancel the shared call.
+
+    The call runs on the leader's resources (e.g. the DB session of its request, closed
+    when its dependencies are torn down), so a cancelled leader only returns once the
+    call is done; a cancelled follower returns at once.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self._stats: dict[str, CoalescingStats] = {}
+        self._lock = Lock()
+
+    def _get_stats(self, route: str) -> CoalescingStats:
+        stats = self._stats.get(route)
+        if stats is None:
+            stats = self._stats[route] = CoalescingStats(route)
+        return stats
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]], route: str = "") -> tuple[T, bool]:
+        """Run `func` or join its in-flight execution; return (result, shared)."""
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        with self._lock:
+            stats = self._get_stats(route)
+            if shared:
+                stats.coalesced += 1
+            else:
+                stats.executions += 1
+        try:
+            return await asyncio.shield(task), shared
+        except asyncio.CancelledError:
+            if not shared:
+                await self._wait_done(task)
+            raise
+
+    @staticmethod
+    async def _wait_done(task: asyncio.Task) -> None:
+        """Wait for `task` to finish, whatever it returns or raises, despite cancellations."""
+        while not task.done():
+            try:
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                pass
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Retrieve the exception so that a call failing with no caller left is not reported
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = [stats.snapshot() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row["calls"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+@lru_cache
+def get_request_singleflight() -> Singleflight:
+    """The process-wide registry used to coalesce identical concurrent requests."""
+    return Singleflight()
@@ -0,0 +1,124 @@
+import functools
+import sys
+import time
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Phase names used by app_base (rendered as Server-Timing metric names)
+AUTH_PHASE = "auth"
+USECASE_PHASE = "usecase"
+HOOKS_PHASE = "hooks"
+
+
+class RequestTimings:
+    """
+    Wall-clock time spent in named phases while handling a single request.
+
+    Re-entering a phase that is already running (a use case calling another use case,
+    a hook calling a hook) is not counted twice.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self.ended_at: dict[str, float] = {}
+        self._active: dict[str, int] = {}
+
+    def enter(self, name: str) -> bool:
+        depth = self._active.get(name, 0)
+        self._active[name] = depth + 1
+        return depth == 0
+
+    def exit(self, name: str, started_at: float, outermost: bool) -> None:
+        self._active[name] -= 1
+        if outermost:
+            now = time.perf_counter()
+            self.durations[name] = self.durations.get(name, 0.0) + (now - started_at)
+            self.ended_at[name] = now
+
+
+# Holds a mutable object so that phases timed in child tasks/threads are visible to the middleware.
+request_timings_ctx: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def track_timings() -> Iterator[RequestTimings]:
+    """Record the phases timed within the block into a fresh RequestTimings."""
+    timings = RequestTimings()
+    token = request_timings_ctx.set(timings)
+    try:
+        yield timings
+    finally:
+        request_timings_ctx.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Add the duration of the block to the phase `name` of the current request.
+
+    No-op outside of a request (background jobs, scripts).
+
+    Usage:
+        with timed("auth"):
+            user = await user_service.get(session, obj_id=user_id)
+    """
+    timings = request_timings_ctx.get()
+    if timings is None:
+        yield
+        return
+    outermost = timings.enter(name)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.exit(name, started_at, outermost)
+
+
+def timed_async(name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator version of `timed` for coroutine functions."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            with timed(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@asynccontextmanager
+async def timed_async_context(name: str, context_manager: AbstractAsyncContextManager[T]):
+    """
+    Enter/exit `context_manager`, timing only its own setup and teardown as `name`.
+
+    The body of the `async with` block is not part of the phase.
+    """
+    with timed(name):
+        value = await context_manager.__aenter__()
+    try:
+        yield value
+    except BaseException:
+        with timed(name):
+            suppress = await context_manager.__aexit__(*sys.exc_info())
+        if not suppress:
+            raise
+    else:
+        with timed(name):
+            await context_manager.__aexit__(None, None, None)
+
+
+def format_server_timing(metrics: list[tuple[str, float, Optional[str]]]) -> str:
+    """Render (name, seconds, description) tuples as a Server-Timing header value."""
+    parts = []
+    for name, duration, description in metrics:
+        part = f"{name};dur={duration * 1000:.2f}"
+        if description:
+            part += f';desc="{description}"'
+        parts.append(part)
+    return ", ".join(parts)
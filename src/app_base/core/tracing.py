@@ -0,0 +1,601 @@
+import functools
+import hashlib
+import inspect
+import os
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterator, Optional, Sequence, TypeVar
+
+import httpx
+import orjson
+
+from app_base.config import ObservabilitySettings, get_observability_settings
+from app_base.core.log import logger, request_id_var
+
+T = TypeVar("T")
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_SERVER = "server"
+
+STATUS_UNSET = "unset"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+# Prefixes of the hook methods traced by `trace_hooks` (see BaseHooksInterface, BaseUseCase)
+HOOK_PREFIXES = ("_context_", "_prepare_", "_post_")
+
+_TRACED_ATTR = "__traced__"
+
+
+# ============================================================
+# Spans
+# ============================================================
+
+
+class Span:
+    """A timed operation within a trace (OpenTelemetry data model, minus links and events)."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: dict[str, Any] = attributes if attributes is not None else {}
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, exc: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+        self.attributes["exception.type"] = type(exc).__name__
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time_ns": self.start_ns,
+            "end_time_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+        }
+
+
+class _Unsampled:
+    """Marks the current trace as not sampled, so that nested spans are skipped cheaply."""
+
+    __slots__ = ()
+
+
+_UNSAMPLED = _Unsampled()
+
+current_span_ctx: ContextVar[Span | _Unsampled | None] = ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Optional[Span]:
+    """The span being recorded in the current context, if any."""
+    span = current_span_ctx.get()
+    return span if isinstance(span, Span) else None
+
+
+def trace_id_for_request(request_id: str) -> str:
+    """
+    Trace id of a request: derived from its request id, so that every root span opened
+    while handling the request (and its log lines) share one trace.
+    """
+    return hashlib.blake2b(request_id.encode(), digest_size=16).hexdigest()
+
+
+def is_sampled(trace_id: str, sample_rate: float) -> bool:
+    """Deterministic head sampling: a trace is kept or dropped as a whole."""
+    if sample_rate >= 1.0:
+        return True
+    if sample_rate <= 0.0:
+        return False
+    return int(trace_id[:16], 16) < sample_rate * 2**64
+
+
+# ============================================================
+# Exporters
+# ============================================================
+
+
+class SpanExporter(ABC):
+    """Sends finished spans somewhere. Called from the exporter thread."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Send a batch of finished spans."""
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Release the resources of the exporter."""
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list (tests, debugging)."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Appends spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str, service_name: str):
+        self.path = path
+        self.service_name = service_name
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        lines = []
+        for span in spans:
+            record = span.to_dict()
+            record["service"] = self.service_name
+            lines.append(orjson.dumps(record, default=str))
+        with open(self.path, "ab") as f:
+            f.write(b"\n".join(lines) + b"\n")
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+_OTLP_KINDS = {SPAN_KIND_INTERNAL: 1, SPAN_KIND_SERVER: 2}
+_OTLP_STATUSES = {STATUS_UNSET: 0, STATUS_OK: 1, STATUS_ERROR: 2}
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Posts spans to an OpenTelemetry collector with OTLP/HTTP in its JSON encoding
+    (e.g. http://localhost:4318/v1/traces), without depending on the OpenTelemetry SDK.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout)
+
+    def encode(self, spans: Sequence[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app_base"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_id or "",
+                                    "name": span.name,
+                                    "kind": _OTLP_KINDS.get(span.kind, 1),
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.end_ns),
+                                    "attributes": _otlp_attributes(span.attributes),
+                                    "status": {
+                                        "code": _OTLP_STATUSES[span.status],
+                                        "message": span.status_message or "",
+                                    },
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: Sequence[Span]) -> None:
+        response = self._client.post(
+            self.endpoint,
+            content=orjson.dumps(self.encode(spans)),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+# ============================================================
+# Processor
+# ============================================================
+
+
+class BatchSpanProcessor:
+    """
+    Hands finished spans to the exporter from a background thread, in batches.
+
+    Ending a span only appends it to a bounded queue: requests never wait for the
+    exporter, and spans are dropped (and counted) when the exporter cannot keep up.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_queue_size: int, batch_size: int, flush_interval: float):
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: deque[Span] = deque()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self.batch_size:
+                self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.force_flush()
+
+    def force_flush(self) -> None:
+        """Export every queued span now."""
+        with self._export_lock:
+            while True:
+                with self._lock:
+                    batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not batch:
+                    return
+                try:
+                    self.exporter.export(batch)
+                except Exception as e:
+                    logger.warning(f"Failed to export {len(batch)} spans: {e}")
+
+    def shutdown(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.force_flush()
+        self.exporter.shutdown()
+
+
+# ============================================================
+# Tracer
+# ============================================================
+
+
+class Tracer:
+    """Starts spans for the current context and passes the finished ones to the processor."""
+
+    def __init__(self, enabled: bool, sample_rate: float = 1.0, processor: Optional[BatchSpanProcessor] = None):
+        self.enabled = enabled and processor is not None
+        self.sample_rate = sample_rate
+        self.processor = processor
+
+    def _start(self, name: str, kind: str, attributes: Optional[dict[str, Any]]) -> Span | _Unsampled | None:
+        """A new span under the current one; _UNSAMPLED if the trace is not recorded, None if disabled."""
+        if not self.enabled:
+            return None
+        parent = current_span_ctx.get()
+        if parent is _UNSAMPLED:
+            return _UNSAMPLED
+        request_id = request_id_var.get()
+        if isinstance(parent, Span):
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id = trace_id_for_request(request_id) if request_id != "N/A" else secrets.token_hex(16)
+            parent_id = None
+            if not is_sampled(trace_id, self.sample_rate):
+                return _UNSAMPLED
+        span = Span(name, trace_id, parent_id, kind=kind, attributes=attributes)
+        if request_id != "N/A":
+            span.attributes["request_id"] = request_id
+        return span
+
+    def enter(self, name: str, kind: str = SPAN_KIND_INTERNAL, attributes: Optional[dict[str, Any]] = None):
+        """Make a new span current; returns the (span, token) to pass to `exit`, or None if disabled."""
+        span = self._start(name, kind, attributes)
+        if span is None:
+            return None
+        return span, current_span_ctx.set(span)
+
+    def exit(self, entered, exc: Optional[BaseException] = None) -> None:
+        if entered is None:
+            return
+        span, token = entered
+        current_span_ctx.reset(token)
+        if isinstance(span, Span):
+            if isinstance(exc, Exception):
+                span.set_error(exc)
+            span.end_ns = time.time_ns()
+            self.processor.on_end(span)  # type: ignore[union-attr]
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[dict[str, Any]] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Record the block as a child of the current span (or as a new trace); yields None if not recorded."""
+        entered = self.enter(name, kind, attributes)
+        if entered is None:
+            yield None
+            return
+        try:
+            yield entered[0] if isinstance(entered[0], Span) else None
+        except BaseException as exc:
+            self.exit(entered, exc)
+            raise
+        self.exit(entered)
+
+    def record_span(self, name: str, duration: float, attributes: Optional[dict[str, Any]] = None) -> None:
+        """Record an operation that just finished (e.g. a SQL statement) under the current span."""
+        if not self.enabled:
+            return
+        parent = current_span_ctx.get()
+        if not isinstance(parent, Span):
+            return
+        end_ns = time.time_ns()
+        span = Span(name, parent.trace_id, parent.span_id, attributes=attributes, start_ns=end_ns - int(duration * 1e9))
+        span.end_ns = end_ns
+        self.processor.on_end(span)  # type: ignore[union-attr]
+
+    def shutdown(self) -> None:
+        if self.processor is not None:
+            self.processor.shutdown()
+
+
+def create_exporter(settings: ObservabilitySettings) -> SpanExporter:
+    if settings.TRACING_EXPORTER == "otlp":
+        return OtlpHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME)
+    return JsonFileSpanExporter(settings.TRACING_JSON_PATH, settings.TRACING_SERVICE_NAME)
+
+
+@lru_cache
+def get_tracer() -> Tracer:
+    settings = get_observability_settings()
+    if not settings.TRACING_ENABLED:
+        return Tracer(enabled=False)
+    processor = BatchSpanProcessor(
+        create_exporter(settings),
+        max_queue_size=settings.TRACING_MAX_QUEUE_SIZE,
+        batch_size=settings.TRACING_BATCH_SIZE,
+        flush_interval=settings.TRACING_FLUSH_INTERVAL,
+    )
+    return Tracer(enabled=True, sample_rate=settings.TRACING_SAMPLE_RATE, processor=processor)
+
+
+def start_span(
+    name: str, kind: str = SPAN_KIND_INTERNAL, attributes: Optional[dict[str, Any]] = None
+) -> AbstractContextManager[Optional[Span]]:
+    """
+    Record the block as a span of the current trace.
+
+    Usage:
+        with start_span("outbox.dispatch", attributes={"event_type": event_type}):
+            await handler(event)
+    """
+    return get_tracer().start_span(name, kind=kind, attributes=attributes)
+
+
+# ============================================================
+# Decorators
+# ============================================================
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Record every call of a coroutine function as a span (named after the function by default)."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            with tracer.start_span(span_name):
+                return await func(*args, **kwargs)
+
+        setattr(wrapper, _TRACED_ATTR, True)
+        return wrapper
+
+    return decorator
+
+
+def traced_method(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Record every call of an async method as a span named "<class of self>.<method>".
+
+    The name uses the runtime class, so a method defined once in a base class
+    (BaseRepository.get_by_pk) shows up per concrete class (MemoRepository.get_by_pk).
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs) -> T:
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return await func(self, *args, **kwargs)
+        with tracer.start_span(f"{type(self).__name__}.{func.__name__}"):
+            return await func(self, *args, **kwargs)
+
+    setattr(wrapper, _TRACED_ATTR, True)
+    return wrapper
+
+
+def _traced_sync(func: Callable[..., T], name: str) -> Callable[..., T]:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        with tracer.start_span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _TracedAsyncContext:
+    """Records the setup, body and teardown of an async context manager as one span."""
+
+    def __init__(self, tracer: Tracer, name: str, context_manager: AbstractAsyncContextManager):
+        self.tracer = tracer
+        self.name = name
+        self.context_manager = context_manager
+        self._entered = None
+
+    async def __aenter__(self):
+        self._entered = self.tracer.enter(self.name)
+        try:
+            return await self.context_manager.__aenter__()
+        except BaseException as exc:
+            self.tracer.exit(self._entered, exc)
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            suppress = await self.context_manager.__aexit__(exc_type, exc, tb)
+        except BaseException as exit_exc:
+            self.tracer.exit(self._entered, exit_exc)
+            raise
+        self.tracer.exit(self._entered, None if suppress else exc)
+        return suppress
+
+
+def _traced_async_context(func: Callable[..., AbstractAsyncContextManager], name: str):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = get_tracer()
+        context_manager = func(*args, **kwargs)
+        if not tracer.enabled:
+            return context_manager
+        return _TracedAsyncContext(tracer, name, context_manager)
+
+    return wrapper
+
+
+def trace_hooks(cls: type, names: Sequence[str] = ()) -> None:
+    """
+    Record the hook methods defined by `cls` itself as spans named "<cls>.<hook>".
+
+    Hooks are the methods starting with HOOK_PREFIXES (`_context_*` async context
+    managers, `_prepare_*` functions, `_post_*` coroutines) and the extra `names`. As
+    each class of a hook chain (super() calls through the mixins) is wrapped on its
+    own, the spans nest and show the time spent in every mixin.
+
+    Nothing is wrapped when tracing is disabled, so the hooks cost nothing then.
+    """
+    if not get_observability_settings().TRACING_ENABLED:
+        return
+    for attr, func in list(cls.__dict__.items()):
+        if not inspect.isfunction(func) or getattr(func, _TRACED_ATTR, False):
+            continue
+        if not (attr.startswith(HOOK_PREFIXES) or attr in names):
+            continue
+        if getattr(func, "__isabstractmethod__", False):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if attr.startswith("_context_"):
+            wrapped = _traced_async_context(func, name)
+        elif inspect.iscoroutinefunction(func):
+            wrapped = traced(name)(func)
+        else:
+            wrapped = _traced_sync(func, name)
+        setattr(wrapped, _TRACED_ATTR, True)
+        setattr(cls, attr, wrapped)
+
+
+def trace_public_methods(cls: type) -> None:
+    """Record the public coroutine methods defined by `cls` itself with `traced_method` (if tracing is enabled)."""
+    if not get_observability_settings().TRACING_ENABLED:
+        return
+    for attr, func in list(cls.__dict__.items()):
+        if attr.startswith("_") or not inspect.iscoroutinefunction(func) or getattr(func, _TRACED_ATTR, False):
+            continue
+        setattr(cls, attr, traced_method(func))
+
+
+# ============================================================
+# Lifespan
+# ============================================================
+
+
+@asynccontextmanager
+async def tracing_lifespan(app):
+    """Flush the queued spans and stop the exporter when the app shuts down."""
+    try:
+        yield
+    finally:
+        get_tracer().shutdown()
@@ -18,9 +18,15 @@ Test Structure:
 """
 
 import logging
+import os
 
 import pytest
 
+# Tracing hooks are installed when the classes are defined, only if tracing is enabled: enable
+# it before the app is imported, sampling nothing unless a test installs its own tracer
+os.environ.setdefault("TRACING_ENABLED", "true")
+os.environ.setdefault("TRACING_SAMPLE_RATE", "0")
+
 # Configure logging - reduce noise from SQLAlchemy and httpx
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -47,6 +53,14 @@ def db_type(request):
     return request.config.getoption("--db-type")
 
 
+@pytest.fixture(autouse=True)
+def _strict_n_plus_one(monkeypatch: pytest.MonkeyPatch):
+    """Fail requests that repeat one statement shape (N+1) instead of only logging a warning."""
+    from app_base.config import get_observability_settings
+
+    monkeypatch.setattr(get_observability_settings(), "N_PLUS_ONE_STRICT", True)
+
+
 # =============================================================================
 # Import Fixtures
 # =============================================================================
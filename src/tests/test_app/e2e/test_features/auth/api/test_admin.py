@@ -0,0 +1,34 @@
+import orjson
+from httpx import AsyncClient
+
+from tests.test_app.utils import assert_status_code
+
+
+async def test_create_users_bulk_ndjson(client: AsyncClient):
+    rows = [
+        {"name": "Bulk", "surname": "One", "email": "bulk-one@example.com", "password": "password-1"},
+        {"name": "Bulk", "surname": "Invalid", "email": "not-an-email", "password": "password-2"},
+        {"name": "Bulk", "surname": "Three", "email": "bulk-three@example.com", "password": "password-3"},
+    ]
+    content = b"\n".join(orjson.dumps(row) for row in rows)
+
+    response = await client.post(
+        "/api/v1/admin/users/bulk", content=content, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert_status_code(response, 200)
+    body = response.json()
+    assert [created["index"] for created in body["created"]] == [0, 2]
+    assert [error["index"] for error in body["errors"]] == [1]
+
+    response = await client.post("/api/v1/admin/users/bulk", json=rows[:1])
+    assert_status_code(response, 200)
+    assert response.json() == {
+        "created": [],
+        "errors": [{"index": 0, "message": "Email already registered: bulk-one@example.com"}],
+    }
+
+
+async def test_create_users_bulk_requires_admin(unauthenticated_client: AsyncClient):
+    response = await unauthenticated_client.post("/api/v1/admin/users/bulk", json=[])
+    assert response.status_code in (401, 403)
@@ -0,0 +1,91 @@
+import jwt
+import pytest_asyncio
+from httpx import AsyncClient
+from pydantic import SecretStr
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.auth.passwords import PasswordHasher
+from app.features.auth.schemas import UserCreate
+from app.features.auth.services import UserService
+from tests.test_app.utils import assert_status_code
+
+PASSWORD = "login-password"
+
+
+@pytest_asyncio.fixture
+async def tokens(unauthenticated_client: AsyncClient, session: AsyncSession, user_service: UserService) -> dict:
+    """Create an admin with a known password, log in and return the token response."""
+    user_in = UserCreate(name="Login", surname="Admin", email="login@example.com", password=SecretStr(PASSWORD))
+    await user_service.create_admin(session, user_in)
+    response = await unauthenticated_client.post(
+        "/api/v1/login/", data={"username": user_in.email, "password": PASSWORD}
+    )
+    assert_status_code(response, 200)
+    return response.json()
+
+
+async def refresh(client: AsyncClient, refresh_token: str):
+    return await client.post("/api/v1/token/refresh", json={"refresh_token": refresh_token})
+
+
+async def test_login_returns_refresh_token(unauthenticated_client: AsyncClient, tokens: dict):
+    assert tokens["refresh_token"]
+    response = await unauthenticated_client.get(
+        "/api/v1/admin/diagnostics/concurrency", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    assert_status_code(response, 200)
+
+
+async def test_refresh_rotates_without_password_hashing(unauthenticated_client: AsyncClient, tokens: dict, mocker):
+    verify = mocker.spy(PasswordHasher, "verify")
+
+    response = await refresh(unauthenticated_client, tokens["refresh_token"])
+
+    assert_status_code(response, 200)
+    refreshed = response.json()
+    assert refreshed["refresh_token"] != tokens["refresh_token"]
+    verify.assert_not_called()
+    response = await unauthenticated_client.get(
+        "/api/v1/admin/diagnostics/concurrency", headers={"Authorization": f"Bearer {refreshed['access_token']}"}
+    )
+    assert_status_code(response, 200)
+
+
+async def test_replayed_refresh_token_revokes_family(unauthenticated_client: AsyncClient, tokens: dict):
+    response = await refresh(unauthenticated_client, tokens["refresh_token"])
+    assert_status_code(response, 200)
+    next_token = response.json()["refresh_token"]
+
+    response = await refresh(unauthenticated_client, tokens["refresh_token"])
+    assert_status_code(response, 403)
+    # The token issued by the first refresh belongs to the replayed family
+    response = await refresh(unauthenticated_client, next_token)
+    assert_status_code(response, 403)
+
+
+async def test_revoke(unauthenticated_client: AsyncClient, tokens: dict):
+    response = await unauthenticated_client.post(
+        "/api/v1/token/revoke", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert_status_code(response, 204)
+
+    response = await refresh(unauthenticated_client, tokens["refresh_token"])
+    assert_status_code(response, 403)
+
+
+async def test_unknown_refresh_token(unauthenticated_client: AsyncClient):
+    response = await refresh(unauthenticated_client, "not-a-token")
+    assert_status_code(response, 403)
+
+
+async def test_admin_revokes_user_tokens(unauthenticated_client: AsyncClient, tokens: dict):
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    user_id = jwt.decode(tokens["access_token"], options={"verify_signature": False})["user_id"]
+
+    response = await unauthenticated_client.post(f"/api/v1/admin/{user_id}/revoke-tokens", headers=headers)
+    assert_status_code(response, 204)
+
+    response = await unauthenticated_client.get("/api/v1/admin/diagnostics/concurrency", headers=headers)
+    assert_status_code(response, 403)
+    response = await refresh(unauthenticated_client, tokens["refresh_token"])
+    assert_status_code(response, 403)
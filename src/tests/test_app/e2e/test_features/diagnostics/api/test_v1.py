@@ -0,0 +1,137 @@
+import asyncio
+
+from httpx import AsyncClient
+
+from app_base.core.database.profiling import get_query_stats_registry
+from app_base.core.loop_monitor import get_event_loop_monitor
+from app_base.core.middlewares.profiler import get_profile_store
+from app_base.core.singleflight import get_request_singleflight
+from tests.test_app.utils import assert_status_code
+
+
+async def test_query_count_header(client: AsyncClient, workspace_via_api: dict):
+    workspace_id = workspace_via_api["id"]
+    response = await client.get(f"/api/v1/workspaces/{workspace_id}/memos")
+    assert_status_code(response, 200)
+    assert int(response.headers["X-Query-Count"]) > 0
+
+
+async def test_server_timing_header(client: AsyncClient, workspace_via_api: dict):
+    workspace_id = workspace_via_api["id"]
+    response = await client.get(f"/api/v1/workspaces/{workspace_id}/memos")
+    assert_status_code(response, 200)
+    metrics = {entry.split(";")[0].strip(): entry for entry in response.headers["Server-Timing"].split(",")}
+    assert {"auth", "usecase", "hooks", "db", "serialize", "total"} <= metrics.keys()
+    assert f'desc="{response.headers["X-Query-Count"]} queries"' in metrics["db"]
+
+
+async def test_get_query_stats(client: AsyncClient, workspace_via_api: dict):
+    get_query_stats_registry().reset()
+    workspace_id = workspace_via_api["id"]
+    for _ in range(2):
+        response = await client.get(f"/api/v1/workspaces/{workspace_id}")
+        assert_status_code(response, 200)
+
+    route = "GET /api/v1/workspaces/{workspace_id}"
+    response = await client.get("/api/v1/admin/diagnostics/queries", params={"route": route})
+    assert_status_code(response, 200)
+    items = response.json()["items"]
+    assert items
+    assert all(item["route"] == route for item in items)
+    assert all(item["calls"] >= 2 for item in items)
+    assert all("?" in item["query"] or "WHERE" not in item["query"] for item in items)
+
+
+async def test_reset_query_stats(client: AsyncClient):
+    # The token version lookup of the first request would be recorded after the reset
+    await client.get("/api/v1/admin/diagnostics/concurrency")
+    response = await client.delete("/api/v1/admin/diagnostics/queries")
+    assert_status_code(response, 204)
+    assert get_query_stats_registry().snapshot() == []
+
+
+async def test_get_coalescing_stats(client: AsyncClient, memo_via_api: dict):
+    get_request_singleflight().reset()
+    workspace_id = memo_via_api["workspace_id"]
+    responses = await asyncio.gather(*(client.get(f"/api/v1/workspaces/{workspace_id}/memos") for _ in range(5)))
+    for response in responses:
+        assert_status_code(response, 200)
+        assert response.json() == responses[0].json()
+        assert response.headers["ETag"] == responses[0].headers["ETag"]
+
+    response = await client.get("/api/v1/admin/diagnostics/coalescing")
+    assert_status_code(response, 200)
+    body = response.json()
+    assert body["in_flight"] == 0
+    (stats,) = [item for item in body["items"] if item["route"] == "GET /api/v1/workspaces/{workspace_id}/memos"]
+    assert stats["calls"] == 5
+    assert stats["executions"] + stats["coalesced"] == 5
+
+
+async def test_reset_coalescing_stats(client: AsyncClient):
+    response = await client.delete("/api/v1/admin/diagnostics/coalescing")
+    assert_status_code(response, 204)
+    assert get_request_singleflight().snapshot() == []
+
+
+async def test_get_concurrency_limits(client: AsyncClient):
+    response = await client.get("/api/v1/admin/diagnostics/concurrency")
+    assert_status_code(response, 200)
+    (admin,) = [item for item in response.json() if item["route_class"] == "admin"]
+    assert admin["in_flight"] == 1  # this very request
+    assert admin["limit"] >= 1
+
+
+async def test_get_event_loop_stats(client: AsyncClient):
+    monitor = get_event_loop_monitor()
+    monitor.start()
+    try:
+        await asyncio.sleep(monitor.interval * 3)
+        response = await client.get("/api/v1/admin/diagnostics/event-loop")
+    finally:
+        await monitor.stop()
+    assert_status_code(response, 200)
+    data = response.json()
+    assert data["running"] is True
+    assert data["lag_samples"] >= 1
+    assert data["lag_p99_ms"] >= data["lag_p50_ms"] >= 0
+
+    response = await client.delete("/api/v1/admin/diagnostics/event-loop")
+    assert_status_code(response, 204)
+    assert monitor.snapshot()["lag_samples"] == 0
+
+
+async def test_profile_request(client: AsyncClient, memo_via_api: dict, monkeypatch, tmp_path):
+    monkeypatch.setattr(get_profile_store(), "directory", tmp_path)
+    workspace_id = memo_via_api["workspace_id"]
+    response = await client.get(f"/api/v1/workspaces/{workspace_id}/memos", headers={"X-Profile": "store"})
+    assert_status_code(response, 200)
+    assert response.json()["items"]
+    profile_id = response.headers["X-Profile-ID"]
+
+    response = await client.get("/api/v1/admin/diagnostics/profiles")
+    assert_status_code(response, 200)
+    (profile,) = response.json()
+    assert profile["id"] == profile_id
+    assert profile["route"] == "/api/v1/workspaces/{workspace_id}/memos"
+
+    response = await client.get(f"/api/v1/admin/diagnostics/profiles/{profile_id}", params={"format": "json"})
+    assert_status_code(response, 200)
+    assert "solve_dependencies" in response.text
+    assert "execute" in response.text
+
+    response = await client.get("/api/v1/admin/diagnostics/profiles/0000000000")
+    assert_status_code(response, 404)
+
+
+async def test_profile_request_inline(client: AsyncClient, workspace_via_api: dict):
+    response = await client.get(f"/api/v1/workspaces/{workspace_via_api['id']}", params={"_profile": "html"})
+    assert_status_code(response, 200)
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["X-Profiled-Status"] == "200"
+
+
+async def test_profile_ignored_for_non_admins(unauthenticated_client: AsyncClient):
+    response = await unauthenticated_client.get("/api/v1/workspaces", headers={"X-Profile": "html"})
+    assert response.status_code in (401, 403)
+    assert "X-Profiled-Status" not in response.headers
@@ -88,3 +88,45 @@ async def test_delete_memo(client: AsyncClient, memo, workspace_via_api: dict):
     non_existent_id = uuid.uuid4()
     response = await client.delete(f"/api/v1/workspaces/{workspace_id}/memos/{non_existent_id}")
     assert_status_code(response, 404)
+
+
+async def test_get_memo_conditional(client: AsyncClient, memo, workspace_via_api: dict):
+    workspace_id = workspace_via_api["id"]
+    url = f"/api/v1/workspaces/{workspace_id}/memos/{memo['id']}"
+    response = await client.get(url)
+    assert_status_code(response, 200)
+    etag = response.headers["ETag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert_status_code(response, 304)
+
+    # The probe is scoped to the parent: a memo reached through another workspace is still a 404
+    other = await client.post("/api/v1/workspaces", json={"name": "Other Workspace"})
+    response = await client.get(
+        f"/api/v1/workspaces/{other.json()['id']}/memos/{memo['id']}", headers={"If-None-Match": etag}
+    )
+    assert_status_code(response, 404)
+
+
+async def test_get_memos_conditional(client: AsyncClient, memo, workspace_via_api: dict):
+    url = f"/api/v1/workspaces/{workspace_via_api['id']}/memos"
+    response = await client.get(url)
+    assert_status_code(response, 200)
+    etag = response.headers["ETag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert_status_code(response, 304)
+
+    response = await client.put(f"{url}/{memo['id']}", json={"title": "Changed"})
+    assert_status_code(response, 200)
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert_status_code(response, 200)
+
+
+async def test_get_memos_rate_limit_headers(client: AsyncClient, workspace_via_api: dict):
+    workspace_id = workspace_via_api["id"]
+    first = await client.get(f"/api/v1/workspaces/{workspace_id}/memos")
+    second = await client.get(f"/api/v1/workspaces/{workspace_id}/memos")
+    assert_status_code(second, 200)
+    assert second.headers["X-RateLimit-Limit"] == "300"
+    assert int(second.headers["X-RateLimit-Remaining"]) == int(first.headers["X-RateLimit-Remaining"]) - 1
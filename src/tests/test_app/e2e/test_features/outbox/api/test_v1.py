@@ -0,0 +1,43 @@
+import uuid
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.outbox.models import EventStatus, Outbox
+from tests.test_app.utils import assert_status_code
+
+
+async def test_list_and_replay_dead_letters(client: AsyncClient, session: AsyncSession):
+    event = Outbox(
+        aggregate_type="memo",
+        aggregate_id=str(uuid.uuid4()),
+        event_type="MEMO_UPDATED",
+        payload={},
+        status=EventStatus.DEAD_LETTER,
+        retry_count=8,
+        last_error="RuntimeError: handler failed",
+    )
+    session.add(event)
+    await session.commit()
+
+    response = await client.get("/api/v1/admin/outbox/events", params={"status": "DEAD_LETTER", "limit": 200})
+    assert_status_code(response, 200)
+    items = {item["id"]: item for item in response.json()["items"]}
+    assert items[str(event.id)]["last_error"] == "RuntimeError: handler failed"
+
+    response = await client.post("/api/v1/admin/outbox/replay", json={"event_ids": [str(event.id)]})
+    assert_status_code(response, 200)
+    assert response.json() == {"replayed": 1}
+
+    await session.refresh(event)
+    assert (event.status, event.retry_count) == (EventStatus.PENDING, 0)
+
+
+async def test_replay_rejects_in_flight_statuses(client: AsyncClient):
+    response = await client.post("/api/v1/admin/outbox/replay", json={"statuses": ["PROCESSING"]})
+    assert_status_code(response, 422)
+
+
+async def test_requires_admin(unauthenticated_client: AsyncClient):
+    response = await unauthenticated_client.post("/api/v1/admin/outbox/replay", json={})
+    assert_status_code(response, 401)
@@ -40,6 +40,42 @@ async def test_get_workspace(client: AsyncClient, workspace):
     assert_status_code(response, 404)
 
 
+async def test_get_workspace_conditional(client: AsyncClient, workspace):
+    url = f"/api/v1/workspaces/{workspace['id']}"
+    response = await client.get(url)
+    assert_status_code(response, 200)
+    etag = response.headers["ETag"]
+    query_count = int(response.headers["X-Query-Count"])
+
+    # The version probe answers without running the use case
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert_status_code(response, 304)
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert int(response.headers["X-Query-Count"]) <= query_count
+
+    response = await client.put(url, json={"name": "Renamed Workspace"})
+    assert_status_code(response, 200)
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert_status_code(response, 200)
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Renamed Workspace"
+
+
+async def test_get_workspaces_conditional(client: AsyncClient, workspace):
+    response = await client.get("/api/v1/workspaces")
+    assert_status_code(response, 200)
+    etag = response.headers["ETag"]
+
+    response = await client.get("/api/v1/workspaces", headers={"If-None-Match": etag})
+    assert_status_code(response, 304)
+
+    await client.post("/api/v1/workspaces", json={"name": "Another Workspace"})
+    response = await client.get("/api/v1/workspaces", headers={"If-None-Match": etag})
+    assert_status_code(response, 200)
+
+
 async def test_update_workspace(client: AsyncClient, workspace):
     workspace_id = workspace["id"]
     update_data = {"name": "Updated Workspace Name"}
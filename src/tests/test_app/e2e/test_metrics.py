@@ -0,0 +1,42 @@
+from httpx import AsyncClient
+
+from app.features.outbox.metrics import collect_outbox_metrics
+from app_base.core.metrics import run_collectors
+from tests.test_app.utils import assert_status_code
+
+
+async def test_metrics_endpoint(client: AsyncClient, workspace_via_api: dict):
+    response = await client.get(f"/api/v1/workspaces/{workspace_via_api['id']}")
+    assert_status_code(response, 200)
+
+    response = await client.get("/metrics")
+    assert_status_code(response, 200)
+    assert response.headers["Content-Type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/workspaces/{workspace_id}",status="200"}'
+        in body
+    )
+    assert 'http_request_db_queries_count{method="GET",route="/api/v1/workspaces/{workspace_id}"}' in body
+    assert "http_requests_in_flight" in body
+    assert "event_loop_lag_seconds" in body
+
+
+async def test_unmatched_routes_share_one_label(client: AsyncClient):
+    response = await client.get("/api/v1/does-not-exist/123")
+    assert_status_code(response, 404)
+
+    body = (await client.get("/metrics")).text
+    assert 'route="<unmatched>",status="404"' in body
+    assert "does-not-exist" not in body
+
+
+async def test_collectors(client: AsyncClient, memo_via_api: dict):
+    await run_collectors()
+    await collect_outbox_metrics()
+
+    body = (await client.get("/metrics")).text
+    pending = [line for line in body.splitlines() if line.startswith("outbox_pending_events ")]
+    assert pending and float(pending[0].split()[1]) >= 1
+    assert "outbox_oldest_pending_age_seconds" in body
+    assert "db_pool_checked_out" in body
@@ -0,0 +1,39 @@
+import pytest
+from httpx import AsyncClient
+
+from app_base.core import tracing
+from app_base.core.tracing import BatchSpanProcessor, InMemorySpanExporter, Tracer
+from tests.test_app.utils import assert_status_code
+
+
+@pytest.fixture
+def exporter(monkeypatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    processor = BatchSpanProcessor(exporter, max_queue_size=10_000, batch_size=1000, flush_interval=60)
+    monkeypatch.setattr(tracing, "get_tracer", lambda: Tracer(enabled=True, processor=processor))
+    yield exporter
+    processor.shutdown()
+
+
+async def test_memo_update_spans(client: AsyncClient, memo_via_api: dict, exporter: InMemorySpanExporter):
+    url = f"/api/v1/workspaces/{memo_via_api['workspace_id']}/memos/{memo_via_api['id']}"
+    response = await client.put(url, json={"title": "Updated"})
+    assert_status_code(response, 200)
+
+    tracing.get_tracer().processor.force_flush()
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["UpdateMemoUseCase.execute"]
+    assert root.attributes["request_id"] == response.headers["X-Request-ID"]
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+
+    service_span = spans["MemoService.update"]
+    assert service_span.parent_id in {span.span_id for span in exporter.spans}
+    # Each mixin of the hook chain, the repository, the SQL and the use case hooks show up
+    for name in (
+        "NestedResourceHooksMixin._context_update",
+        "ExistsCheckHooksMixin._context_update",
+        "MemoRepository.update_by_pk",
+        "UpdateMemoUseCase._post_execute",
+        "db.query",
+    ):
+        assert name in spans, name
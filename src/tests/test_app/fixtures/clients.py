@@ -24,7 +24,7 @@ class AsyncClientWithJson(AsyncClient):
         raise TypeError(f"Object of type '{obj.__class__.__name__}' is not JSON serializable")
 
     async def request(self, *args, **kwargs):
-        if "json" in kwargs:
+        if kwargs.get("json") is not None:
             kwargs["content"] = orjson.dumps(kwargs.pop("json"), default=self._json_serializer)
             if kwargs.get("headers") is None:
                 kwargs["headers"] = {}
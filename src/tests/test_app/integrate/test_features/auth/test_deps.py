@@ -0,0 +1,165 @@
+"""
+Integration app_tests for the authentication dependencies.
+"""
+
+import uuid
+
+import jwt
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.auth.cache import get_token_version_cache, get_user_cache
+from app.features.auth.deps import get_current_user, get_verified_token, require_scopes
+from app.features.auth.exceptions import (
+    InvalidCredentialsException,
+    PermissionDeniedException,
+    UserNotFoundException,
+)
+from app.features.auth.models import Scope, User
+from app.features.auth.schemas import UserUpdate
+from app.features.auth.services import UserService
+from app.features.auth.token_schemas import TokenPayload
+
+
+@pytest.fixture(autouse=True)
+def user_cache():
+    get_user_cache.cache_clear()
+    get_token_version_cache.cache_clear()
+    yield get_user_cache()
+    get_user_cache.cache_clear()
+    get_token_version_cache.cache_clear()
+
+
+def decode(user_service: UserService, access_token: str) -> TokenPayload:
+    secret_key = user_service.settings.SECRET_KEY.get_secret_value()
+    return TokenPayload(**jwt.decode(access_token, secret_key, algorithms=[user_service.ALGORITHM]))
+
+
+class TestGetCurrentUser:
+    """Tests for the authenticated-user cache and the stateless mode."""
+
+    async def test_cached_after_first_lookup(
+        self, session: AsyncSession, user_service: UserService, regular_user: User, mocker
+    ):
+        token = TokenPayload(user_id=regular_user.id)
+        await get_current_user(token, session, user_service)
+        get = mocker.spy(user_service, "get")
+
+        user = await get_current_user(token, session, user_service)
+
+        get.assert_not_called()
+        assert user.id == regular_user.id
+        assert user.email == regular_user.email
+        assert user is not regular_user
+
+    async def test_update_invalidates_after_commit(
+        self, session: AsyncSession, user_service: UserService, regular_user: User, user_cache
+    ):
+        token = TokenPayload(user_id=regular_user.id)
+        stale = await get_current_user(token, session, user_service)
+
+        await user_service.update_user(
+            session, UserUpdate(name="Renamed", surname=regular_user.surname), regular_user.id
+        )
+        user_cache.set(stale)  # cached by a concurrent request before the commit
+        await session.commit()
+
+        user = await get_current_user(token, session, user_service)
+        assert user.name == "Renamed"
+
+    async def test_delete_invalidates(self, session: AsyncSession, user_service: UserService, regular_user: User):
+        token = TokenPayload(user_id=regular_user.id)
+        await get_current_user(token, session, user_service)
+
+        await user_service.delete(session, regular_user.id)
+        await session.commit()
+
+        with pytest.raises(UserNotFoundException):
+            await get_current_user(token, session, user_service)
+
+    async def test_revoked_token_rejected_on_every_request(
+        self, session: AsyncSession, user_service: UserService, regular_user: User
+    ):
+        token = decode(user_service, user_service.create_access_token(regular_user))
+        await get_current_user(token, session, user_service)
+
+        assert await user_service.revoke_tokens(session, regular_user.id)
+        await session.commit()
+
+        # The first rejection caches the user again: the second request must still be rejected
+        for _ in range(2):
+            with pytest.raises(InvalidCredentialsException):
+                await get_current_user(token, session, user_service)
+
+    async def test_stateless_trusts_token_claims(
+        self, session: AsyncSession, user_service: UserService, regular_user: User, monkeypatch, mocker
+    ):
+        monkeypatch.setattr(user_service.settings, "STATELESS_AUTH", True)
+        token = decode(user_service, user_service.create_access_token(regular_user))
+        get = mocker.spy(user_service, "get")
+
+        user = await get_current_user(token, session, user_service)
+
+        get.assert_not_called()
+        assert (user.id, user.email, user.role) == (regular_user.id, regular_user.email, regular_user.role)
+
+
+class TestGetVerifiedToken:
+    """Tests for the authorization from the token claims alone."""
+
+    async def test_admin_authorized_without_loading_user(
+        self, session: AsyncSession, user_service: UserService, admin_user: User, mocker
+    ):
+        token = decode(user_service, user_service.create_access_token(admin_user))
+        get = mocker.spy(user_service, "get")
+        get_token_version = mocker.spy(user_service.repo, "get_token_version")
+
+        for _ in range(2):
+            verified = await get_verified_token(token, session, user_service)
+            assert await require_scopes(Scope.ADMIN)(verified) is token
+
+        get.assert_not_called()
+        get_token_version.assert_called_once()
+        assert token.role == User.Role.ADMIN
+        assert token.scopes == {Scope.ADMIN, Scope.DIAGNOSTICS}
+
+    async def test_regular_user_lacks_admin_scope(
+        self, session: AsyncSession, user_service: UserService, regular_user: User
+    ):
+        token = decode(user_service, user_service.create_access_token(regular_user))
+        verified = await get_verified_token(token, session, user_service)
+
+        with pytest.raises(PermissionDeniedException):
+            await require_scopes(Scope.ADMIN)(verified)
+
+    async def test_revoke_tokens_rejects_issued_tokens(
+        self, session: AsyncSession, user_service: UserService, admin_user: User
+    ):
+        token = decode(user_service, user_service.create_access_token(admin_user))
+        await get_verified_token(token, session, user_service)
+
+        assert await user_service.revoke_tokens(session, admin_user.id)
+        await session.commit()
+
+        with pytest.raises(InvalidCredentialsException):
+            await get_verified_token(token, session, user_service)
+        with pytest.raises(InvalidCredentialsException):
+            await get_current_user(token, session, user_service)
+        await session.refresh(admin_user)
+        token = decode(user_service, user_service.create_access_token(admin_user))
+        assert await get_verified_token(token, session, user_service) is token
+
+    async def test_token_without_version_rejected(
+        self, session: AsyncSession, user_service: UserService, admin_user: User
+    ):
+        token = TokenPayload(user_id=admin_user.id, role=admin_user.role, scope=Scope.ADMIN)
+
+        with pytest.raises(InvalidCredentialsException):
+            await get_verified_token(token, session, user_service)
+
+    async def test_unknown_user(self, session: AsyncSession, user_service: UserService):
+        assert not await user_service.revoke_tokens(session, uuid.uuid4())
+        token = TokenPayload(user_id=uuid.uuid4(), scope=Scope.ADMIN, ver=0)
+
+        with pytest.raises(UserNotFoundException):
+            await get_verified_token(token, session, user_service)
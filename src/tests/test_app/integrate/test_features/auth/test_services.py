@@ -3,15 +3,17 @@ Integration app_tests for UserService.
 Tests service layer operations with real database connections.
 """
 
+import datetime
+
 import pytest
 from pydantic import SecretStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.exceptions import UserAlreadyExistsException
 from app.features.auth.models import User
-from app.features.auth.repos import UserRepository
+from app.features.auth.repos import RefreshTokenRepository, UserRepository
 from app.features.auth.schemas import UserCreate, UserUpdate
-from app.features.auth.services import UserService
+from app.features.auth.services import RefreshTokenService, UserService
 from app_base.config import get_auth_settings
 
 
@@ -203,8 +205,76 @@ class TestUserServiceIntegration:
         """Should hash and verify passwords correctly."""
         password = "testpassword123"
 
-        hashed = service.get_password_hash(password)
+        hashed = await service.get_password_hash(password)
 
         assert hashed != password
-        assert service.is_valid_password(password, hashed)
-        assert not service.is_valid_password("wrongpassword", hashed)
+        assert await service.is_valid_password(password, hashed)
+        assert not await service.is_valid_password("wrongpassword", hashed)
+
+    @pytest.mark.asyncio
+    async def test_create_users_bulk(self, session: AsyncSession, service: UserService, regular_user: User, mocker):
+        """Should create valid rows in bulk and report taken or repeated emails by position."""
+        rows = {
+            0: UserCreate(name="A", surname="One", email="bulk-a@example.com", password=SecretStr("password-a")),
+            2: UserCreate(name="B", surname="Two", email=regular_user.email, password=SecretStr("password-b")),
+            3: UserCreate(name="C", surname="Three", email="bulk-c@example.com", password=SecretStr("password-c")),
+            4: UserCreate(name="A", surname="Again", email="bulk-a@example.com", password=SecretStr("password-d")),
+        }
+        get_existing_emails = mocker.spy(service.repo, "get_existing_emails")
+
+        hashed_passwords = await service.hash_bulk_passwords(rows)
+        result = await service.create_users_bulk(session, rows, hashed_passwords)
+
+        # The repeated email is not hashed
+        assert set(hashed_passwords) == {0, 2, 3}
+        get_existing_emails.assert_called_once()
+        assert [(created.index, created.email) for created in result.created] == [
+            (0, "bulk-a@example.com"),
+            (3, "bulk-c@example.com"),
+        ]
+        assert [error.index for error in result.errors] == [2, 4]
+        user = await service.get_by_email(session, "bulk-c@example.com")
+        assert user is not None
+        assert user.id == result.created[1].id
+        assert user.role == User.Role.USER
+        assert await service.is_valid_password("password-c", user.hashed_password)
+
+
+class TestRefreshTokenServiceIntegration:
+    """Integration app_tests for RefreshTokenService with real database."""
+
+    @pytest.fixture
+    def refresh_service(self) -> RefreshTokenService:
+        return RefreshTokenService(settings=get_auth_settings(), repo=RefreshTokenRepository())
+
+    @pytest.mark.asyncio
+    async def test_stores_only_the_digest(
+        self, session: AsyncSession, refresh_service: RefreshTokenService, regular_user: User
+    ):
+        token = await refresh_service.issue(session, regular_user.id)
+
+        assert await refresh_service.repo.get_by_pk(session, token) is None
+        stored = await refresh_service.repo.get_by_pk(session, refresh_service.hash_token(token))
+        assert stored.user_id == regular_user.id
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected(
+        self, session: AsyncSession, refresh_service: RefreshTokenService, regular_user: User
+    ):
+        token = await refresh_service.issue(session, regular_user.id)
+        stored = await refresh_service.repo.get_by_pk(session, refresh_service.hash_token(token))
+        stored.expires_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=1)
+        await session.flush()
+
+        assert await refresh_service.rotate(session, token) is None
+
+    @pytest.mark.asyncio
+    async def test_password_change_revokes_tokens(
+        self, session: AsyncSession, user_service: UserService, refresh_service: RefreshTokenService, regular_user: User
+    ):
+        token = await refresh_service.issue(session, regular_user.id)
+
+        update = UserUpdate(name=regular_user.name, surname=regular_user.surname, password=SecretStr("new-password"))
+        await user_service.update_user(session, update, regular_user.id)
+
+        assert await refresh_service.rotate(session, token) is None
@@ -0,0 +1,158 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.outbox.models import EventStatus, Outbox
+from app.features.outbox.repos import OutboxRepository
+
+
+def make_event(aggregate_id: str, number: int, **fields) -> Outbox:
+    created_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=number)
+    return Outbox(
+        aggregate_type="memo",
+        aggregate_id=aggregate_id,
+        event_type="MEMO_UPDATED",
+        payload={"number": number},
+        created_at=created_at,
+        **fields,
+    )
+
+
+class TestOutboxRepositoryIntegration:
+    """Integration app_tests for the selection of due events."""
+
+    @pytest.fixture
+    def repo(self) -> OutboxRepository:
+        return OutboxRepository()
+
+    async def select(self, session: AsyncSession, repo: OutboxRepository, aggregate_id: str) -> list[int]:
+        events = await repo.get_and_lock_pending_events(session, limit=10_000)
+        return sorted(event.payload["number"] for event in events if event.aggregate_id == aggregate_id)
+
+    @pytest.mark.asyncio
+    async def test_only_due_events(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_a, aggregate_b = str(uuid.uuid4()), str(uuid.uuid4())
+        later = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5)
+        session.add_all([make_event(aggregate_a, 0), make_event(aggregate_b, 1, next_attempt_at=later)])
+        await session.commit()
+
+        assert await self.select(session, repo, aggregate_a) == [0]
+        assert await self.select(session, repo, aggregate_b) == []
+
+    @pytest.mark.asyncio
+    async def test_blocked_behind_older_event_of_aggregate(self, session: AsyncSession, repo: OutboxRepository):
+        retrying, processing, dead = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+        later = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5)
+        session.add_all(
+            [
+                make_event(retrying, 0, next_attempt_at=later, retry_count=1),
+                make_event(retrying, 1),
+                make_event(processing, 2, status=EventStatus.PROCESSING, locked_by="worker", locked_until=later),
+                make_event(processing, 3),
+                # A dead letter no longer holds its aggregate back
+                make_event(dead, 4, status=EventStatus.DEAD_LETTER),
+                make_event(dead, 5),
+            ]
+        )
+        await session.commit()
+
+        assert await self.select(session, repo, retrying) == []
+        assert await self.select(session, repo, processing) == []
+        assert await self.select(session, repo, dead) == [5]
+
+    @pytest.mark.asyncio
+    async def test_one_event_per_aggregate_and_batch(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_id = str(uuid.uuid4())
+        # A retried event is due later than the events created after it, which come first
+        now = datetime.datetime.now(datetime.timezone.utc)
+        created_at = now - datetime.timedelta(minutes=1)
+        session.add_all(
+            [
+                make_event(aggregate_id, 0, next_attempt_at=now - datetime.timedelta(seconds=1), retry_count=1),
+                make_event(aggregate_id, 1, next_attempt_at=created_at),
+                make_event(aggregate_id, 2, next_attempt_at=created_at),
+            ]
+        )
+        await session.commit()
+
+        assert await self.select(session, repo, aggregate_id) == [0]
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_due_again(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_id, legacy = str(uuid.uuid4()), str(uuid.uuid4())
+        expired = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=1)
+        session.add_all(
+            [
+                make_event(aggregate_id, 0, status=EventStatus.PROCESSING, locked_by="dead", locked_until=expired),
+                make_event(aggregate_id, 1),
+                # Claimed before leases existed
+                make_event(legacy, 2, status=EventStatus.PROCESSING),
+            ]
+        )
+        await session.commit()
+
+        # The later event waits for the reclaimed one
+        assert await self.select(session, repo, aggregate_id) == [0]
+        assert await self.select(session, repo, legacy) == [2]
+
+    @pytest.mark.asyncio
+    async def test_renew_leases(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_id = str(uuid.uuid4())
+        soon = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=10)
+        mine = make_event(aggregate_id, 0, status=EventStatus.PROCESSING, locked_by="me", locked_until=soon)
+        taken = make_event(aggregate_id, 1, status=EventStatus.PROCESSING, locked_by="other", locked_until=soon)
+        session.add_all([mine, taken])
+        await session.commit()
+        later = soon + datetime.timedelta(minutes=1)
+
+        assert await repo.renew_leases(session, [mine.id, taken.id], "me", later) == {mine.id}
+        await session.commit()
+
+        await session.refresh(mine)
+        await session.refresh(taken)
+        assert mine.locked_until == later.replace(tzinfo=mine.locked_until.tzinfo)
+        assert taken.locked_until == soon.replace(tzinfo=taken.locked_until.tzinfo)
+
+    @pytest.mark.asyncio
+    async def test_outcome_written_only_under_lease(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_id = str(uuid.uuid4())
+        soon = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=10)
+        mine = make_event(aggregate_id, 0, status=EventStatus.PROCESSING, locked_by="me", locked_until=soon)
+        taken = make_event(aggregate_id, 1, status=EventStatus.PROCESSING, locked_by="other", locked_until=soon)
+        session.add_all([mine, taken])
+        await session.commit()
+        session.expunge_all()
+        for event in (mine, taken):
+            event.status = EventStatus.COMPLETED
+
+        assert await repo.save_leased_outcome(session, mine, "me") is True
+        assert await repo.save_leased_outcome(session, taken, "me") is False
+        await session.commit()
+
+        stored_mine = await repo.get_by_pk(session, mine.id)
+        stored_taken = await repo.get_by_pk(session, taken.id)
+        assert (stored_mine.status, stored_mine.locked_by, stored_mine.locked_until) == (
+            EventStatus.COMPLETED,
+            None,
+            None,
+        )
+        assert (stored_taken.status, stored_taken.locked_by) == (EventStatus.PROCESSING, "other")
+
+    @pytest.mark.asyncio
+    async def test_replay(self, session: AsyncSession, repo: OutboxRepository):
+        aggregate_id = str(uuid.uuid4())
+        dead = make_event(aggregate_id, 0, status=EventStatus.DEAD_LETTER, retry_count=8, last_error="boom")
+        other = make_event(aggregate_id, 1, status=EventStatus.DEAD_LETTER, retry_count=8)
+        session.add_all([dead, other])
+        await session.commit()
+
+        assert await repo.replay(session, [EventStatus.DEAD_LETTER], event_ids=[dead.id]) == 1
+        await session.commit()
+
+        await session.refresh(dead)
+        await session.refresh(other)
+        assert (dead.status, dead.retry_count, dead.last_error) == (EventStatus.PENDING, 0, None)
+        assert other.status == EventStatus.DEAD_LETTER
+        assert await self.select(session, repo, aggregate_id) == [0]
@@ -0,0 +1,121 @@
+import asyncio
+import datetime
+import time
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.outbox.models import EventStatus, Outbox
+from app.features.outbox.notifier import get_outbox_notifier
+from app.features.outbox.registry import EVENT_HANDLER_REGISTRY, register_event_handler
+from app.features.outbox.repos import OutboxRepository
+from app.features.outbox.scheduler import OutboxScheduler, outbox_worker_id, process_outbox_events_job
+from app.features.outbox.schemas import OutboxCreate
+from app_base.config import get_outbox_settings
+
+
+@pytest.fixture
+def notifier():
+    get_outbox_notifier.cache_clear()
+    yield get_outbox_notifier()
+    get_outbox_notifier.cache_clear()
+
+
+@pytest.fixture
+def handled():
+    event_type = f"TEST_WAKEUP_{uuid.uuid4().hex}"
+    dispatched = asyncio.Event()
+
+    @register_event_handler(event_type)
+    async def handle(event):
+        dispatched.set()
+
+    yield event_type, dispatched
+    EVENT_HANDLER_REGISTRY.pop(event_type, None)
+
+
+class TestOutboxSchedulerIntegration:
+    """The scheduler dispatches committed events without waiting for its next poll."""
+
+    async def test_commit_wakes_scheduler_up(self, session: AsyncSession, notifier, handled):
+        event_type, dispatched = handled
+        scheduler = OutboxScheduler(notifier, min_interval=30.0, max_interval=30.0)
+        task = asyncio.create_task(scheduler.run())
+        try:
+            await asyncio.sleep(0.05)  # the first (empty) batch is done, the scheduler waits
+            started = time.perf_counter()
+            event_data = OutboxCreate(aggregate_type="test", aggregate_id="1", event_type=event_type, payload={})
+            await OutboxRepository().create(session, event_data)
+            await session.commit()
+
+            await asyncio.wait_for(dispatched.wait(), timeout=5)
+            assert time.perf_counter() - started < 5
+        finally:
+            scheduler.stop()
+            await asyncio.wait_for(task, timeout=5)
+
+    async def test_rollback_does_not_notify(self, session: AsyncSession, notifier):
+        event_data = OutboxCreate(aggregate_type="test", aggregate_id="1", event_type="TEST_ROLLBACK", payload={})
+        await OutboxRepository().create(session, event_data)
+        await session.rollback()
+
+        assert not await notifier.wait(0.01)
+
+
+class TestOutboxLeaseIntegration:
+    """Processing events are leased: renewed while dispatched, claimed again once expired."""
+
+    @pytest.fixture
+    def lease_duration(self, monkeypatch):
+        monkeypatch.setenv("OUTBOX_LEASE_DURATION", "0.3")
+        get_outbox_settings.cache_clear()
+        yield 0.3
+        get_outbox_settings.cache_clear()
+
+    async def test_expired_lease_claimed_again(self, session: AsyncSession, handled):
+        event_type, dispatched = handled
+        expired = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=1)
+        event = Outbox(
+            aggregate_type="test",
+            aggregate_id=str(uuid.uuid4()),
+            event_type=event_type,
+            payload={},
+            status=EventStatus.PROCESSING,
+            locked_by="crashed-worker",
+            locked_until=expired,
+        )
+        session.add(event)
+        await session.commit()
+
+        while await process_outbox_events_job():
+            pass
+
+        assert dispatched.is_set()
+        await session.refresh(event)
+        assert (event.status, event.retry_count, event.locked_by) == (EventStatus.COMPLETED, 1, None)
+
+    async def test_lease_renewed_while_dispatching(self, session: AsyncSession, lease_duration, mocker):
+        event_type = f"TEST_LEASE_{uuid.uuid4().hex}"
+        renew_leases = mocker.spy(OutboxRepository, "renew_leases")
+
+        @register_event_handler(event_type)
+        async def handle(event):
+            await asyncio.sleep(lease_duration)
+
+        try:
+            event = await OutboxRepository().create(
+                session, OutboxCreate(aggregate_type="test", aggregate_id="1", event_type=event_type, payload={})
+            )
+            await session.commit()
+
+            while await process_outbox_events_job():
+                pass
+        finally:
+            EVENT_HANDLER_REGISTRY.pop(event_type, None)
+
+        renewals = renew_leases.spy_return_list
+        assert renewals and all(event.id in held for held in renewals)
+        assert all(call.args[3] == outbox_worker_id() for call in renew_leases.call_args_list)
+        await session.refresh(event)
+        assert (event.status, event.locked_by, event.locked_until) == (EventStatus.COMPLETED, None, None)
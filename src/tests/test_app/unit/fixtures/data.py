@@ -60,6 +60,7 @@ def mock_user(sample_user_id):
     user.email = "test@example.com"
     user.role = User.Role.USER
     user.hashed_password = "$2b$12$hashedpassword"
+    user.token_version = 0
     user.created_at = datetime.datetime.now(datetime.timezone.utc)
     user.updated_at = datetime.datetime.now(datetime.timezone.utc)
     return user
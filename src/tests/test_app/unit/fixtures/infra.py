@@ -37,4 +37,5 @@ def mock_settings():
     settings = MagicMock()
     settings.SECRET_KEY = SecretStr("test-secret-key-for-testing-purposes-only")
     settings.ACCESS_TOKEN_EXPIRE_MINUTES = 30
+    settings.STATELESS_AUTH = False
     return settings
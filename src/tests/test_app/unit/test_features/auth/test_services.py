@@ -18,29 +18,32 @@ class TestUserServicePasswordHashing:
         repo = AsyncMock()
         return UserService(settings=mock_settings, repo=repo)
 
-    def test_get_password_hash_returns_hashed_string(self, user_service):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_returns_hashed_string(self, user_service):
         """Should return hashed password string."""
         password = "test_password123"
-        hashed = user_service.get_password_hash(password)
+        hashed = await user_service.get_password_hash(password)
 
         assert hashed != password
         assert hashed.startswith("$2b$")  # bcrypt prefix
 
-    def test_is_valid_password_returns_true_for_correct_password(self, user_service):
+    @pytest.mark.asyncio
+    async def test_is_valid_password_returns_true_for_correct_password(self, user_service):
         """Should return True for correct password."""
         password = "test_password123"
-        hashed = user_service.get_password_hash(password)
+        hashed = await user_service.get_password_hash(password)
 
-        result = user_service.is_valid_password(password, hashed)
+        result = await user_service.is_valid_password(password, hashed)
 
         assert result is True
 
-    def test_is_valid_password_returns_false_for_incorrect_password(self, user_service):
+    @pytest.mark.asyncio
+    async def test_is_valid_password_returns_false_for_incorrect_password(self, user_service):
         """Should return False for incorrect password."""
         password = "test_password123"
-        hashed = user_service.get_password_hash(password)
+        hashed = await user_service.get_password_hash(password)
 
-        result = user_service.is_valid_password("wrong_password", hashed)
+        result = await user_service.is_valid_password("wrong_password", hashed)
 
         assert result is False
 
@@ -177,7 +180,7 @@ class TestUserServiceAuthenticate:
     async def test_authenticate_returns_user_for_valid_credentials(self, user_service, mock_async_session):
         """Should return user when credentials are valid."""
         password = "password123"
-        hashed = user_service.get_password_hash(password)
+        hashed = await user_service.get_password_hash(password)
 
         mock_user = MagicMock()
         mock_user.hashed_password = hashed
@@ -190,7 +193,7 @@ class TestUserServiceAuthenticate:
     @pytest.mark.asyncio
     async def test_authenticate_returns_none_for_invalid_password(self, user_service, mock_async_session):
         """Should return None when password is invalid."""
-        hashed = user_service.get_password_hash("correct_password")
+        hashed = await user_service.get_password_hash("correct_password")
 
         mock_user = MagicMock()
         mock_user.hashed_password = hashed
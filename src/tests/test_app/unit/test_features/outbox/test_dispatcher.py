@@ -0,0 +1,120 @@
+import asyncio
+import datetime
+import uuid
+
+import pytest
+
+from app.features.outbox import dispatcher
+from app.features.outbox.dispatcher import RetryPolicy, dispatch_outbox_batch, dispatch_outbox_event
+from app.features.outbox.models import EventStatus, Outbox
+from app_base.base.exceptions.event import InvalidEventPayloadException
+
+RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=10.0, max_delay=60.0)
+
+
+def make_event(aggregate_id: str, number: int) -> Outbox:
+    return Outbox(
+        id=uuid.uuid4(),
+        aggregate_type="memo",
+        aggregate_id=aggregate_id,
+        event_type="MEMO_UPDATED",
+        payload={"number": number},
+        status=EventStatus.PROCESSING,
+        retry_count=0,
+        created_at=datetime.datetime.now(datetime.timezone.utc),
+    )
+
+
+class TestDispatchOutboxBatch:
+    """Tests for concurrent dispatch."""
+
+    @pytest.fixture
+    def handled(self, monkeypatch):
+        state = {"running": 0, "max_running": 0, "order": [], "fail": set()}
+
+        async def dispatch_event(event_type, event):
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+            try:
+                await asyncio.sleep(0.01)
+                if event.payload["number"] in state["fail"]:
+                    raise RuntimeError("handler failed")
+                state["order"].append((event.meta["aggregate_id"], event.payload["number"]))
+            finally:
+                state["running"] -= 1
+
+        monkeypatch.setattr(dispatcher, "dispatch_event", dispatch_event)
+        return state
+
+    async def test_events_in_parallel(self, handled):
+        events = [make_event(aggregate_id, 0) for aggregate_id in "abcdef"]
+
+        await dispatch_outbox_batch(events, concurrency=2, retry_policy=RETRY_POLICY)
+
+        assert handled["max_running"] == 2
+        assert sorted(handled["order"]) == [(aggregate_id, 0) for aggregate_id in "abcdef"]
+        assert all(event.status == EventStatus.COMPLETED for event in events)
+        assert all(event.processed_at is not None for event in events)
+
+    async def test_failure_leaves_other_events(self, handled):
+        handled["fail"].add(1)
+        failing, other = make_event("a", 1), make_event("b", 2)
+
+        await dispatch_outbox_batch([failing, other], concurrency=4, retry_policy=RETRY_POLICY)
+
+        assert failing.status == EventStatus.PENDING
+        assert failing.retry_count == 1
+        assert failing.next_attempt_at > datetime.datetime.now(datetime.timezone.utc)
+        assert other.status == EventStatus.COMPLETED
+        assert handled["order"] == [("b", 2)]
+
+
+class TestRetryPolicy:
+    def test_delay_doubles_with_jitter_and_cap(self):
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=8.0)
+
+        for failures, full_delay in ((1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (9, 8.0)):
+            delays = [policy.delay(failures) for _ in range(50)]
+            assert all(full_delay / 2 <= delay <= full_delay for delay in delays)
+
+
+class TestDispatchOutboxEvent:
+    @pytest.fixture
+    def raises(self, monkeypatch):
+        state = {"error": RuntimeError("handler failed")}
+
+        async def dispatch_event(event_type, event):
+            raise state["error"]
+
+        monkeypatch.setattr(dispatcher, "dispatch_event", dispatch_event)
+        return state
+
+    async def test_failure_schedules_retry(self, raises):
+        event = make_event("a", 0)
+        before = datetime.datetime.now(datetime.timezone.utc)
+
+        assert await dispatch_outbox_event(event, RETRY_POLICY) is False
+
+        assert event.status == EventStatus.PENDING
+        assert event.retry_count == 1
+        assert event.last_error == "RuntimeError: handler failed"
+        delay = (event.next_attempt_at - before).total_seconds()
+        assert 5.0 <= delay <= 10.5
+
+    async def test_dead_letter_when_out_of_attempts(self, raises):
+        event = make_event("a", 0)
+        event.retry_count = RETRY_POLICY.max_attempts - 1
+
+        await dispatch_outbox_event(event, RETRY_POLICY)
+
+        assert event.status == EventStatus.DEAD_LETTER
+        assert event.retry_count == RETRY_POLICY.max_attempts
+
+    async def test_not_retriable_error_dead_letters_at_once(self, raises):
+        raises["error"] = InvalidEventPayloadException()
+        event = make_event("a", 0)
+
+        await dispatch_outbox_event(event, RETRY_POLICY)
+
+        assert event.status == EventStatus.DEAD_LETTER
+        assert event.retry_count == 1
@@ -0,0 +1,18 @@
+from app.features.outbox.leader import FileOutboxLeaderLock
+
+
+class TestFileOutboxLeaderLock:
+    """Tests for the leader election of the processes of one host."""
+
+    async def test_one_leader_at_a_time(self, tmp_path):
+        path = str(tmp_path / "outbox-leader.lock")
+        leader, follower = FileOutboxLeaderLock(path), FileOutboxLeaderLock(path)
+
+        assert await leader.acquire() is True
+        assert await leader.acquire() is True
+        assert await follower.acquire() is False
+
+        await leader.release()
+        assert await follower.acquire() is True
+        assert await leader.acquire() is False
+        await follower.release()
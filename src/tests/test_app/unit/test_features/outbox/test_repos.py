@@ -66,8 +66,9 @@ class TestOutboxRepository:
         mock_async_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_create_outbox_event(self, outbox_repo, mock_async_session):
-        """Should create a new outbox event."""
+    async def test_create_outbox_event(self, outbox_repo, mock_async_session, mocker):
+        """Should create a new outbox event and signal it to the outbox scheduler."""
+        notify_outbox_insert = mocker.patch("app.features.outbox.repos.notify_outbox_insert")
         create_data = OutboxCreate(
             aggregate_type="memo",
             aggregate_id=str(uuid.uuid4()),
@@ -90,6 +91,7 @@ class TestOutboxRepository:
         mock_async_session.add.assert_called_once()
         mock_async_session.flush.assert_called_once()
         mock_async_session.refresh.assert_called_once()
+        notify_outbox_insert.assert_awaited_once_with(mock_async_session)
         assert result.aggregate_type == create_data.aggregate_type
 
     @pytest.mark.asyncio
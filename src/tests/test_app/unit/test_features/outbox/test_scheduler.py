@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from app.features.outbox import scheduler as scheduler_module
+from app.features.outbox.leader import OutboxLeaderLock
+from app.features.outbox.notifier import OutboxNotifier
+from app.features.outbox.scheduler import OutboxScheduler
+
+
+class RecordingNotifier(OutboxNotifier):
+    """Records the poll intervals, and notifies at the given waits."""
+
+    def __init__(self, notified_at: set[int], waits: int):
+        super().__init__()
+        self.notified_at = notified_at
+        self.waits = waits
+        self.timeouts: list[float] = []
+
+    async def wait(self, timeout: float) -> bool:
+        self.timeouts.append(timeout)
+        if len(self.timeouts) == self.waits:
+            raise asyncio.CancelledError
+        return len(self.timeouts) in self.notified_at
+
+
+class ScriptedLeaderLock(OutboxLeaderLock):
+    """Held from the given attempt on."""
+
+    def __init__(self, held_from: int):
+        self.held_from = held_from
+        self.attempts = 0
+
+    async def acquire(self) -> bool:
+        self.attempts += 1
+        return self.attempts >= self.held_from
+
+    async def release(self) -> None:
+        pass
+
+
+class TestOutboxScheduler:
+    """Tests for the adaptive polling fallback."""
+
+    @pytest.fixture
+    def batches(self, monkeypatch):
+        batches: list[int] = []
+
+        async def process_outbox_events_job() -> int:
+            return batches.pop(0) if batches else 0
+
+        monkeypatch.setattr(scheduler_module, "process_outbox_events_job", process_outbox_events_job)
+        return batches
+
+    async def test_backs_off_while_idle(self, batches):
+        notifier = RecordingNotifier(notified_at=set(), waits=6)
+
+        with pytest.raises(asyncio.CancelledError):
+            await OutboxScheduler(notifier, min_interval=1.0, max_interval=8.0).run()
+
+        assert notifier.timeouts == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+    async def test_notification_resets_interval(self, batches):
+        notifier = RecordingNotifier(notified_at={3}, waits=5)
+
+        with pytest.raises(asyncio.CancelledError):
+            await OutboxScheduler(notifier, min_interval=1.0, max_interval=8.0).run()
+
+        assert notifier.timeouts == [1.0, 2.0, 4.0, 1.0, 2.0]
+
+    async def test_drains_without_waiting(self, batches):
+        batches.extend([10, 10, 3])
+        notifier = RecordingNotifier(notified_at=set(), waits=1)
+
+        with pytest.raises(asyncio.CancelledError):
+            await OutboxScheduler(notifier, min_interval=1.0, max_interval=8.0).run()
+
+        assert batches == []
+        assert notifier.timeouts == [1.0]
+
+    async def test_survives_failed_iterations(self, monkeypatch):
+        calls = 0
+
+        async def process_outbox_events_job() -> int:
+            nonlocal calls
+            calls += 1
+            if calls <= 2:
+                raise RuntimeError("commit failed")
+            return 0
+
+        monkeypatch.setattr(scheduler_module, "process_outbox_events_job", process_outbox_events_job)
+        notifier = RecordingNotifier(notified_at=set(), waits=1)
+
+        with pytest.raises(asyncio.CancelledError):
+            await OutboxScheduler(notifier, min_interval=0.01, max_interval=8.0).run()
+
+        # Two failures backed off (0.01 s, then 0.02 s) before the loop went on polling
+        assert calls == 3
+        assert notifier.timeouts == [0.04]
+
+    async def test_follower_waits_for_leadership(self, batches):
+        batches.extend([10, 10])
+        notifier = RecordingNotifier(notified_at=set(), waits=1)
+        leader = ScriptedLeaderLock(held_from=3)
+        scheduler = OutboxScheduler(
+            notifier, min_interval=1.0, max_interval=8.0, leader=leader, leader_retry_interval=0
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await scheduler.run()
+
+        assert leader.attempts == 5
+        assert batches == []
+
+    async def test_stop_interrupts_follower(self, batches):
+        batches.append(10)
+        notifier = RecordingNotifier(notified_at=set(), waits=1)
+        scheduler = OutboxScheduler(
+            notifier,
+            min_interval=1.0,
+            max_interval=8.0,
+            leader=ScriptedLeaderLock(held_from=2),
+            leader_retry_interval=60,
+        )
+
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.01)
+        scheduler.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert batches == [10]
@@ -0,0 +1,39 @@
+import asyncio
+import os
+import signal
+
+import pytest
+
+from app.features.outbox import scheduler as scheduler_module
+from app.features.outbox import worker
+
+
+class TestRunWorker:
+    """Tests for the standalone outbox worker."""
+
+    @pytest.fixture
+    def jobs(self, monkeypatch, tmp_path):
+        started = asyncio.Event()
+        finished: list[bool] = []
+
+        async def process_outbox_events_job() -> int:
+            started.set()
+            await asyncio.sleep(0.05)
+            finished.append(True)
+            return 0
+
+        monkeypatch.setattr(scheduler_module, "process_outbox_events_job", process_outbox_events_job)
+        monkeypatch.setenv("OUTBOX_LEADER_LOCK_FILE", str(tmp_path / "outbox-leader.lock"))
+        worker.get_outbox_settings.cache_clear()
+        yield started, finished
+        worker.get_outbox_settings.cache_clear()
+
+    async def test_sigterm_stops_after_batch(self, jobs):
+        started, finished = jobs
+        task = asyncio.create_task(worker.run_worker())
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(task, timeout=1)
+
+        assert finished == [True]
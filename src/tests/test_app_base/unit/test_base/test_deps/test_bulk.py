@@ -0,0 +1,83 @@
+"""Unit app_tests for app_base.base.deps.bulk module."""
+
+from typing import Annotated
+
+import orjson
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app_base.base.deps.bulk import BulkRows, bulk_body
+from app_base.base.exceptions.handler import set_exception_handler
+
+
+class Item(BaseModel):
+    name: str
+    count: int
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    set_exception_handler(app)
+
+    @app.post("/items/bulk")
+    async def import_items(body: Annotated[BulkRows[Item], Depends(bulk_body(Item, max_rows=3))]):
+        return {
+            "rows": {index: row.model_dump() for index, row in body.rows.items()},
+            "errors": [error.model_dump() for error in body.errors],
+        }
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestBulkBody:
+    """Tests for parsing bulk request bodies row by row."""
+
+    async def test_json_list(self, client):
+        response = await client.post("/items/bulk", json=[{"name": "a", "count": 1}, {"name": "b"}])
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["rows"] == {"0": {"name": "a", "count": 1}}
+        assert [error["index"] for error in body["errors"]] == [1]
+        assert "count" in body["errors"][0]["message"]
+
+    async def test_ndjson(self, client):
+        content = b'{"name": "a", "count": 1}\n\nnot json\n{"name": "c", "count": 3}\n'
+
+        response = await client.post(
+            "/items/bulk", content=content, headers={"Content-Type": "application/x-ndjson; charset=utf-8"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["rows"].keys() == {"0", "2"}
+        assert body["errors"] == [{"index": 1, "message": "Invalid JSON"}]
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"{", orjson.dumps({"name": "a", "count": 1}), orjson.dumps([{"name": "a", "count": 1}] * 4)],
+    )
+    async def test_rejects_whole_body(self, client, content):
+        response = await client.post("/items/bulk", content=content, headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 400
+
+    async def test_max_rows_read_per_request(self):
+        limits = iter([1, 2])
+        app = FastAPI()
+        set_exception_handler(app)
+
+        @app.post("/items/bulk")
+        async def import_items(
+            body: Annotated[BulkRows[Item], Depends(bulk_body(Item, max_rows=lambda: next(limits)))],
+        ):
+            return len(body.rows)
+
+        rows = [{"name": "a", "count": 1}] * 2
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.post("/items/bulk", json=rows)).status_code == 400
+            assert (await client.post("/items/bulk", json=rows)).json() == 2
@@ -0,0 +1,98 @@
+"""Unit app_tests for app_base.base.deps.coalesce module."""
+
+import asyncio
+from typing import Annotated, Optional
+
+import pytest
+from fastapi import Depends, FastAPI, Header, Response
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app_base.base.deps.coalesce import coalesce_requests
+from app_base.core.singleflight import get_request_singleflight
+
+
+class Item(BaseModel):
+    name: str
+    count: int
+
+
+class User:
+    def __init__(self, role: str):
+        self.role = role
+
+
+def get_user(x_role: Annotated[str, Header()] = "user") -> User:
+    return User(x_role)
+
+
+def set_rate_limit_header(response: Response):
+    response.headers["X-RateLimit-Remaining"] = "9"
+
+
+@pytest.fixture
+def state():
+    get_request_singleflight().reset()
+    return {"executions": 0, "release": asyncio.Event()}
+
+
+@pytest.fixture
+def client(state):
+    app = FastAPI()
+
+    @app.get("/items/{name}", response_model=Item, dependencies=[Depends(set_rate_limit_header)])
+    @coalesce_requests()
+    async def get_item(
+        name: str,
+        current_user: Annotated[User, Depends(get_user)],
+        response: Response,
+        count: Optional[int] = None,
+    ):
+        state["executions"] += 1
+        await state["release"].wait()
+        response.headers["ETag"] = '"v1"'
+        return {"name": name, "count": count or 0, "extra": "not in the response model"}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def gather_released(state, *requests):
+    tasks = [asyncio.create_task(request) for request in requests]
+    await asyncio.sleep(0.05)
+    state["release"].set()
+    return await asyncio.gather(*tasks)
+
+
+async def test_identical_requests_share_one_execution(client, state):
+    responses = await gather_released(state, *(client.get("/items/a?count=2") for _ in range(4)))
+
+    assert state["executions"] == 1
+    for response in responses:
+        assert response.status_code == 200
+        assert response.json() == {"name": "a", "count": 2}
+        assert response.headers["ETag"] == '"v1"'
+        assert response.headers["X-RateLimit-Remaining"] == "9"
+    stats = get_request_singleflight().snapshot()
+    assert stats[0]["route"] == "GET /items/{name}"
+    assert (stats[0]["executions"], stats[0]["coalesced"]) == (1, 3)
+
+
+async def test_different_params_or_scope_do_not_coalesce(client, state):
+    responses = await gather_released(
+        state,
+        client.get("/items/a"),
+        client.get("/items/b"),
+        client.get("/items/a", params={"count": 1}),
+        client.get("/items/a", headers={"X-Role": "admin"}),
+    )
+
+    assert state["executions"] == 4
+    assert [response.json()["name"] for response in responses] == ["a", "b", "a", "a"]
+
+
+async def test_disabled(client, state, monkeypatch):
+    from app_base.config import get_http_settings
+
+    monkeypatch.setattr(get_http_settings(), "SINGLEFLIGHT_ENABLED", False)
+    await gather_released(state, *(client.get("/items/a") for _ in range(3)))
+    assert state["executions"] == 3
@@ -0,0 +1,79 @@
+"""Unit app_tests for app_base.base.deps.conditional module."""
+
+import datetime
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+
+from app_base.base.deps.conditional import ConditionalRequest, make_etag, make_page_etag
+from app_base.base.schemas.paginated import PaginatedList
+
+UPDATED_AT = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class TestETags:
+    """Tests for ETag generation."""
+
+    def test_make_etag_is_weak_and_stable(self):
+        etag = make_etag(UPDATED_AT)
+        assert etag.startswith('W/"')
+        assert etag == make_etag(UPDATED_AT)
+        assert etag != make_etag(UPDATED_AT + datetime.timedelta(microseconds=1))
+
+    def test_page_etag_changes_with_items_and_window(self):
+        item = SimpleNamespace(id=uuid.uuid4(), updated_at=UPDATED_AT)
+        page = PaginatedList(items=[item], total_count=1, offset=0, limit=10)
+        etag = make_page_etag(page)
+
+        assert etag == make_page_etag(PaginatedList(items=[item], total_count=1, offset=0, limit=10))
+        assert etag != make_page_etag(PaginatedList(items=[item], total_count=1, offset=0, limit=20))
+        updated = SimpleNamespace(id=item.id, updated_at=UPDATED_AT + datetime.timedelta(seconds=1))
+        assert etag != make_page_etag(PaginatedList(items=[updated], total_count=1, offset=0, limit=10))
+
+
+class TestConditionalRequest:
+    """Tests for If-None-Match evaluation."""
+
+    @pytest.mark.parametrize(
+        "if_none_match, expected",
+        [
+            (None, False),
+            ('W/"abc"', True),
+            ('"abc"', True),
+            ('"other", W/"abc"', True),
+            ("*", True),
+            ('"other"', False),
+        ],
+    )
+    def test_matches(self, if_none_match, expected):
+        assert ConditionalRequest(Response(), if_none_match).matches('W/"abc"') is expected
+
+    def test_not_modified_sets_etag(self):
+        response = Response()
+        conditional = ConditionalRequest(response, '"other"')
+        assert conditional.not_modified('W/"abc"') is None
+        assert response.headers["ETag"] == 'W/"abc"'
+
+        not_modified = ConditionalRequest(Response(), 'W/"abc"').not_modified('W/"abc"')
+        assert not_modified is not None
+        assert not_modified.status_code == 304
+
+    async def test_check_version_skips_probe_without_header(self):
+        async def probe():
+            raise AssertionError("probe must not run")
+
+        assert await ConditionalRequest(Response(), None).check_version(probe) is None
+
+    async def test_check_version(self):
+        async def probe():
+            return UPDATED_AT
+
+        async def missing():
+            return None
+
+        conditional = ConditionalRequest(Response(), make_etag(UPDATED_AT))
+        response = await conditional.check_version(probe)
+        assert response is not None and response.status_code == 304
+        assert await conditional.check_version(missing) is None
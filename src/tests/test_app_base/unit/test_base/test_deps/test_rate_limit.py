@@ -0,0 +1,76 @@
+"""Unit app_tests for app_base.base.deps.rate_limit module and the rate limit backends."""
+
+import pytest
+from fastapi import Response
+
+from app_base.adapter.rate_limit.interface import gcra
+from app_base.adapter.rate_limit.providers import MemoryRateLimitBackend
+from app_base.base.deps.rate_limit import RateLimiter
+from app_base.base.exceptions.basic import TooManyRequestsException
+
+
+class TestGCRA:
+    """Tests for the token bucket arithmetic."""
+
+    def test_burst_then_refill(self):
+        tat, now = 0.0, 0.0
+        remaining = []
+        for _ in range(3):
+            tat, result = gcra(tat, now, limit=3, period=3.0)
+            assert result.allowed
+            remaining.append(result.remaining)
+        assert remaining == [2, 1, 0]
+
+        tat, denied = gcra(tat, now, limit=3, period=3.0)
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(1.0)
+        assert denied.reset_after == pytest.approx(3.0)
+
+        # One token is back after period / limit
+        _, result = gcra(tat, now + 1.0, limit=3, period=3.0)
+        assert result.allowed
+        assert result.remaining == 0
+
+    def test_denied_hit_does_not_consume(self):
+        tat, _ = gcra(0.0, 0.0, limit=1, period=10.0)
+        new_tat, result = gcra(tat, 5.0, limit=1, period=10.0)
+        assert not result.allowed
+        assert new_tat == tat
+
+
+class TestRateLimiter:
+    """Tests for the rate limit dependency helper."""
+
+    @pytest.fixture(autouse=True)
+    def memory_backend(self, mocker):
+        backend = MemoryRateLimitBackend(max_keys=100)
+        mocker.patch("app_base.base.deps.rate_limit.get_rate_limit_backend", return_value=backend)
+        return backend
+
+    async def test_sets_headers_until_exhausted(self):
+        limiter = RateLimiter(limit=2, period=60, name="test")
+
+        response = Response()
+        await limiter.check(response, "user-1")
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+        assert response.headers["X-RateLimit-Reset"] == "30"
+
+        await limiter.check(Response(), "user-1")
+        with pytest.raises(TooManyRequestsException) as exc_info:
+            await limiter.check(Response(), "user-1")
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "30"
+        assert exc_info.value.headers["X-RateLimit-Remaining"] == "0"
+
+    async def test_keys_are_independent(self):
+        limiter = RateLimiter(limit=1, period=60, name="test")
+        await limiter.check(Response(), "user-1", "workspace-1")
+        await limiter.check(Response(), "user-1", "workspace-2")
+        await limiter.check(Response(), "user-2", "workspace-1")
+        with pytest.raises(TooManyRequestsException):
+            await limiter.check(Response(), "user-1", "workspace-1")
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            RateLimiter(limit=0)
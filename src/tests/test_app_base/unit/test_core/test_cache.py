@@ -0,0 +1,48 @@
+"""Unit app_tests for app_base.core.cache module."""
+
+from app_base.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for expiry, eviction and invalidation."""
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 29.0
+        assert cache.get("a") == 1
+        clock.now = 30.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses, cache.hit_ratio) == (1, 1, 0.5)
+
+    def test_least_recently_used_evicted(self):
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=2, ttl=30.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_value_loaded_across_an_invalidation_is_not_stored(self):
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0)
+        version = cache.version
+        cache.invalidate("a")  # updated while the old value was being loaded
+
+        assert cache.set("a", 1, version=version) is False
+        assert cache.get("a") is None
+        assert cache.set("a", 2, version=cache.version) is True
+        assert cache.get("a") == 2
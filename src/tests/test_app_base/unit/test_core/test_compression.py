@@ -0,0 +1,143 @@
+"""Unit app_tests for app_base.core.middlewares.compression module."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app_base.config import HTTPSettings
+from app_base.core.middlewares.compression import CompressionMiddleware, select_encoding
+
+BODY = "memo contents " * 500
+
+
+def make_app(**overrides) -> FastAPI:
+    settings = HTTPSettings(**{"COMPRESSION_MINIMUM_SIZE": 1024, **overrides})
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, settings=settings)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(BODY, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/image")
+    async def image():
+        return Response(BODY.encode(), media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(BODY.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(10):
+                yield BODY.encode()
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/events")
+    async def events():
+        async def chunks():
+            yield BODY.encode()
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return app
+
+
+async def get(app: FastAPI, path: str, accept_encoding: str = "gzip"):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+class TestSelectEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("gzip, deflate, br, zstd", "zstd"),
+            ("gzip, br", "br"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("*", "zstd"),
+            ("*, zstd;q=0", "br"),
+            ("identity", None),
+            ("gzip;q=0", None),
+            ("", None),
+        ],
+    )
+    def test_negotiation(self, accept_encoding, expected):
+        assert select_encoding(accept_encoding, ("zstd", "br", "gzip")) == expected
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    async def test_gzip(self):
+        response = await get(make_app(), "/large")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert int(response.headers["Content-Length"]) < len(BODY)
+        assert response.headers["ETag"] == 'W/"v1"'
+        assert response.text == BODY
+
+    async def test_brotli(self):
+        pytest.importorskip("brotli")
+        response = await get(make_app(), "/large", "br")
+        assert response.headers["Content-Encoding"] == "br"
+        assert int(response.headers["Content-Length"]) < len(BODY)
+        assert response.text == BODY
+
+    async def test_zstd(self):
+        pytest.importorskip("zstandard")
+        response = await get(make_app(), "/large", "zstd")
+        assert response.headers["Content-Encoding"] == "zstd"
+        assert int(response.headers["Content-Length"]) < len(BODY)
+        assert response.text == BODY
+
+    async def test_not_accepted(self):
+        response = await get(make_app(), "/large", "identity")
+        assert "Content-Encoding" not in response.headers
+        assert response.text == BODY
+
+    async def test_below_minimum_size(self):
+        response = await get(make_app(), "/small")
+        assert "Content-Encoding" not in response.headers
+        assert response.text == "tiny"
+
+    async def test_excluded_content_type(self):
+        response = await get(make_app(), "/image")
+        assert "Content-Encoding" not in response.headers
+
+    async def test_event_stream_is_not_compressed(self):
+        response = await get(make_app(), "/events")
+        assert "Content-Encoding" not in response.headers
+        assert response.text == BODY
+
+    async def test_already_encoded(self):
+        response = await get(make_app(), "/encoded")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.text == BODY
+
+    async def test_streaming_response(self):
+        response = await get(make_app(), "/stream")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        assert response.text == BODY * 10
+
+    async def test_disabled(self):
+        response = await get(make_app(COMPRESSION_ENABLED=False), "/large")
+        assert "Content-Encoding" not in response.headers
+
+    async def test_unavailable_encoding_is_not_offered(self):
+        response = await get(make_app(COMPRESSION_ENCODINGS=["gzip"]), "/large", "zstd, br, gzip;q=0.1")
+        assert response.headers["Content-Encoding"] == "gzip"
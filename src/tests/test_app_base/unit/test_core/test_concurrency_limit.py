@@ -0,0 +1,149 @@
+"""Unit app_tests for app_base.core.middlewares.concurrency_limit module."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from httpx import ASGITransport, AsyncClient
+
+from app_base.config import HTTPSettings
+from app_base.core.middlewares.concurrency_limit import AdaptiveLimiter, ConcurrencyLimitMiddleware
+
+
+def make_settings(**overrides) -> HTTPSettings:
+    defaults = {
+        "CONCURRENCY_LIMIT_INITIAL": 2,
+        "CONCURRENCY_LIMIT_MIN": 1,
+        "CONCURRENCY_LIMIT_MAX": 10,
+        "CONCURRENCY_LIMIT_QUEUE_SIZE": 1,
+        "CONCURRENCY_LIMIT_QUEUE_TIMEOUT": 0.05,
+    }
+    return HTTPSettings(**{**defaults, **overrides})
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AIMD limit and the wait queue."""
+
+    async def test_queued_request_gets_released_slot(self):
+        limiter = AdaptiveLimiter("read", make_settings(CONCURRENCY_LIMIT_QUEUE_TIMEOUT=1.0))
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.snapshot()["queued"] == 1
+        limiter.release(0.01, overloaded=False)
+
+        assert await waiting
+        assert limiter.in_flight == 2
+
+    async def test_full_queue_and_expired_wait_are_shed(self):
+        limiter = AdaptiveLimiter("read", make_settings())
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not await limiter.acquire()  # queue full
+        assert not await waiting  # queue timeout
+        assert limiter.rejected == 2
+        assert limiter.snapshot()["queued"] == 0
+
+    async def test_release_between_timeout_and_resume_still_sheds(self):
+        limiter = AdaptiveLimiter("read", make_settings(CONCURRENCY_LIMIT_QUEUE_TIMEOUT=0.01))
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter = limiter._waiters[0]
+        while not waiter.cancelled():  # the queue timeout cancels the wait...
+            await asyncio.sleep(0)
+        assert not waiting.done()
+        limiter.release(0.01, overloaded=False)  # ...and a release drops it before the task resumes
+
+        assert not await waiting
+        assert limiter.rejected == 1
+        assert limiter.in_flight == 1
+
+    async def test_limit_increases_while_used_and_fast(self):
+        limiter = AdaptiveLimiter("read", make_settings())
+        for _ in range(10):
+            await limiter.acquire()
+            limiter.release(0.01, overloaded=False)
+        assert limiter.limit > 2
+
+    async def test_limit_decreases_on_overload(self):
+        limiter = AdaptiveLimiter("read", make_settings(CONCURRENCY_LIMIT_INITIAL=10))
+        await limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+        assert limiter.limit == pytest.approx(9.0)
+
+    async def test_slow_sample_counts_as_overload(self):
+        limiter = AdaptiveLimiter("read", make_settings(CONCURRENCY_LIMIT_INITIAL=10))
+        limiter.baseline = 0.01
+        await limiter.acquire()
+        limiter.release(0.5, overloaded=False)
+        assert limiter.limit == pytest.approx(9.0)
+
+    async def test_limit_stays_within_bounds(self):
+        limiter = AdaptiveLimiter("read", make_settings(CONCURRENCY_LIMIT_INITIAL=1))
+        for _ in range(5):
+            await limiter.acquire()
+            limiter._last_decrease_at = 0.0
+            limiter.release(0.01, overloaded=True)
+        assert limiter.limit == 1.0
+
+
+class TestConcurrencyLimitMiddleware:
+    """Tests for load shedding in front of the app."""
+
+    @pytest.fixture
+    def release(self):
+        return asyncio.Event()
+
+    @pytest.fixture
+    def limiters(self):
+        return {}
+
+    @pytest.fixture
+    def client(self, release, limiters):
+        app = FastAPI()
+        app.add_middleware(
+            ConcurrencyLimitMiddleware,
+            settings=make_settings(CONCURRENCY_LIMIT_INITIAL=1, CONCURRENCY_LIMIT_QUEUE_SIZE=0),
+            limiters=limiters,
+        )
+
+        @app.get("/slow")
+        async def slow():
+            await release.wait()
+            return PlainTextResponse("done")
+
+        @app.post("/write")
+        async def write():
+            return PlainTextResponse("written")
+
+        @app.get("/api/health")
+        async def health():
+            return PlainTextResponse("ok")
+
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    async def test_saturated_class_sheds_with_retry_after(self, client, release, limiters):
+        first = asyncio.create_task(client.get("/slow"))
+        await asyncio.sleep(0.05)
+
+        shed = await client.get("/slow")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+
+        # Other route classes and exempt paths are not affected
+        assert (await client.post("/write")).status_code == 200
+        assert (await client.get("/api/health")).status_code == 200
+
+        release.set()
+        assert (await first).text == "done"
+        assert limiters["read"].in_flight == 0
+        assert (limiters["read"].accepted, limiters["read"].rejected) == (1, 1)
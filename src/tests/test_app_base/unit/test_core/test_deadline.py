@@ -0,0 +1,97 @@
+"""Unit app_tests for app_base.core.database.deadline module."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import DBAPIError
+
+from app_base.base.deps.timeout import request_timeout
+from app_base.base.exceptions.db import DatabaseException, StatementTimeoutException, database_exception_handler
+from app_base.core.database import deadline as deadline_module
+from app_base.core.database.deadline import RequestDeadline, request_deadline_ctx
+from app_base.core.middlewares.timeout_middleware import TimeoutMiddleware
+
+
+def make_connection(dialect: str = "postgresql"):
+    connection = MagicMock()
+    connection.dialect = SimpleNamespace(name=dialect)
+    return connection
+
+
+@pytest.fixture
+async def deadline():
+    deadline = RequestDeadline(10)
+    token = request_deadline_ctx.set(deadline)
+    yield deadline
+    request_deadline_ctx.reset(token)
+
+
+class TestStatementTimeout:
+    """Tests for the propagation of the deadline into transactions."""
+
+    async def test_transaction_gets_remaining_budget(self, deadline):
+        connection = make_connection()
+
+        deadline_module._after_begin(SimpleNamespace(info={}), None, connection)
+
+        (statement,) = [call.args[0] for call in connection.exec_driver_sql.call_args_list]
+        timeout_ms = int(statement.removeprefix("SET LOCAL statement_timeout = "))
+        assert 9000 < timeout_ms <= 10000
+
+    async def test_other_dialects_are_left_alone(self, deadline):
+        connection = make_connection(dialect="sqlite")
+        deadline_module._after_begin(SimpleNamespace(info={}), None, connection)
+        connection.exec_driver_sql.assert_not_called()
+
+    def test_outside_of_a_request(self):
+        connection = make_connection()
+        deadline_module._after_begin(SimpleNamespace(info={}), None, connection)
+        connection.exec_driver_sql.assert_not_called()
+
+
+class TestCancellation:
+    """Tests for statements cancelled by the statement_timeout."""
+
+    @pytest.mark.parametrize(
+        "sqlstate, expected",
+        [("57014", StatementTimeoutException), ("08006", DatabaseException)],
+    )
+    async def test_cancelled_statement_maps_to_504(self, sqlstate, expected):
+        error = DBAPIError("SELECT pg_sleep(10)", {}, SimpleNamespace(sqlstate=sqlstate))
+        with pytest.raises(expected):
+            async with database_exception_handler():
+                raise error
+
+
+class TestRequestTimeoutOverride:
+    """Tests for per-route timeouts."""
+
+    def make_client(self, default: float, override) -> AsyncClient:
+        app = FastAPI()
+        app.add_middleware(TimeoutMiddleware, timeout=default)
+
+        @app.get("/sleep", dependencies=[Depends(request_timeout(override))])
+        async def sleep(seconds: float):
+            await asyncio.sleep(seconds)
+            return {"slept": seconds}
+
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+
+    async def test_shorter_route_timeout(self):
+        async with self.make_client(default=10, override=0.05) as client:
+            response = await client.get("/sleep", params={"seconds": 1})
+        assert response.status_code == 504
+
+    async def test_longer_route_timeout(self):
+        async with self.make_client(default=0.05, override=1) as client:
+            response = await client.get("/sleep", params={"seconds": 0.1})
+        assert response.status_code == 200
+
+    async def test_route_timeout_read_per_request(self):
+        async with self.make_client(default=0.05, override=lambda: 1) as client:
+            response = await client.get("/sleep", params={"seconds": 0.1})
+        assert response.status_code == 200
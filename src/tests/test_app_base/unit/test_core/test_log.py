@@ -0,0 +1,146 @@
+"""Unit app_tests for app_base.core.log module."""
+
+import logging
+
+import pytest
+
+from app_base.core.log import BackgroundSink, LogSampler, intercept_std_loggers, logger
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def capture():
+    """Add sinks collecting the messages kept; yields a function adding one with a filter."""
+    handler_ids = []
+
+    def add(sink_filter=None, level="DEBUG") -> list[str]:
+        messages: list[str] = []
+        handler_ids.append(logger.add(messages.append, format="{message}", filter=sink_filter, level=level))
+        return messages
+
+    yield add
+    for handler_id in handler_ids:
+        logger.remove(handler_id)
+
+
+class TestLogSampler:
+    """Tests for per-logger sampling and per-call-site rate limiting."""
+
+    def test_sample_rate_by_longest_prefix(self):
+        sampler = LogSampler({"app": 0.5, "app.features.outbox": 0.1})
+        assert sampler.sample_rate("app.features.outbox.scheduler") == 0.1
+        assert sampler.sample_rate("app.features.memos") == 0.5
+        assert sampler.sample_rate("application") == 1.0
+        assert sampler.sample_rate("app_base.core") == 1.0
+
+    def test_sampling(self, capture):
+        sampler = LogSampler({__name__: 0.5}, rand=iter([0.1, 0.9, 0.4, 0.6]).__next__)
+        messages = capture(sampler)
+
+        for i in range(4):
+            logger.info("record {}", i)
+        logger.warning("never sampled")
+
+        assert messages == ["record 0\n", "record 2\n", "never sampled\n"]
+
+    def test_rate_limit_per_call_site(self, capture):
+        clock = FakeClock()
+        sampler = LogSampler({}, rate_limit=2, period=10.0, clock=clock)
+        messages = capture(sampler)
+
+        def log(i: int):
+            logger.info("event {}", i)
+
+        for i in range(5):
+            log(i)
+        logger.info("other call site")
+        clock.now = 10.0
+        log(5)
+
+        assert messages == ["event 0\n", "event 1\n", "other call site\n", "event 5 (3 similar messages suppressed)\n"]
+
+    def test_decision_shared_by_sinks(self, capture):
+        sampler = LogSampler({}, rate_limit=1, period=10.0, clock=FakeClock())
+        first, second = capture(sampler), capture(sampler)
+
+        for _ in range(3):
+            logger.info("repeated")
+
+        assert first == second == ["repeated\n"]
+
+
+class TestBackgroundSink:
+    """Tests for the writer thread."""
+
+    class Target:
+        def __init__(self):
+            self.lines: list[str] = []
+            self.flushes = 0
+            self.stopped = False
+
+        def write(self, message: str) -> None:
+            self.lines.append(message)
+
+        def flush(self) -> None:
+            self.flushes += 1
+
+        def stop(self) -> None:
+            self.stopped = True
+
+    async def test_writes_from_thread(self):
+        target = self.Target()
+        handler_id = logger.add(BackgroundSink(target), format="{message}")
+        try:
+            for i in range(3):
+                logger.info("message {}", i)
+            await logger.complete()
+            assert target.lines == ["message 0\n", "message 1\n", "message 2\n"]
+            assert target.flushes >= 1
+        finally:
+            logger.remove(handler_id)
+        assert target.stopped
+
+    async def test_writes_to_callable(self):
+        lines: list[str] = []
+        handler_id = logger.add(BackgroundSink(lines.append), format="{message}")
+        try:
+            logger.info("message")
+            await logger.complete()
+            assert lines == ["message\n"]
+        finally:
+            logger.remove(handler_id)
+
+    def test_full_queue_drops(self):
+        target = self.Target()
+        sink = BackgroundSink(target, max_queue_size=1)
+        sink._queue.put(None)  # stop the thread, so that nothing is consumed
+        sink._thread.join()
+
+        sink.write("queued\n")
+        sink.write("dropped\n")
+        assert sink.dropped == 1
+
+
+class TestInterceptStdLoggers:
+    """Tests for routing standard library loggers to loguru."""
+
+    def test_std_records_reach_sinks_lazily(self, capture):
+        messages = capture()
+        intercept_std_loggers(["tests.std"], "INFO")
+        std_logger = logging.getLogger("tests.std.module")
+
+        class Expensive:
+            def __str__(self):
+                raise AssertionError("formatted below the level")
+
+        std_logger.debug("skipped %s", Expensive())
+        std_logger.info("kept %s", 1)
+
+        assert messages == ["kept 1\n"]
@@ -0,0 +1,63 @@
+"""Unit app_tests for app_base.core.loop_monitor module."""
+
+import asyncio
+import time
+
+import pytest
+
+from app_base.config import ObservabilitySettings
+from app_base.core.loop_monitor import EventLoopMonitor
+
+
+@pytest.fixture
+async def monitor():
+    settings = ObservabilitySettings(
+        LOOP_MONITOR_INTERVAL=0.01,
+        LOOP_MONITOR_BLOCK_THRESHOLD=0.05,
+        LOOP_MONITOR_SAMPLE_INTERVAL=0.005,
+    )
+    monitor = EventLoopMonitor(settings)
+    monitor.start()
+    yield monitor
+    await monitor.stop()
+
+
+def hash_password_synchronously():
+    """Stands in for a sync call (bcrypt, sync SDK client) made on the event loop."""
+    time.sleep(0.2)
+
+
+async def wait_for_report(monitor: EventLoopMonitor):
+    for _ in range(50):
+        if monitor.reports:
+            return monitor.reports[-1]
+        await asyncio.sleep(0.01)
+    raise AssertionError("no block reported")
+
+
+async def test_block_reported_with_stack(monitor):
+    await asyncio.sleep(0.03)
+    hash_password_synchronously()
+    report = await wait_for_report(monitor)
+
+    assert monitor.blocks == 1
+    assert 0.1 < report.duration < 0.5
+    assert report.sample_count >= 5
+    frames, _ = report.stacks[0]
+    assert "in hash_password_synchronously" in frames[-1]
+
+
+async def test_lag_percentiles(monitor):
+    await asyncio.sleep(0.1)
+    snapshot = monitor.snapshot()
+
+    assert snapshot["running"] is True
+    assert snapshot["lag_samples"] >= 3
+    assert snapshot["lag_max_ms"] >= snapshot["lag_p99_ms"] >= snapshot["lag_p50_ms"] >= 0
+    assert snapshot["blocks"] == 0
+
+
+async def test_stop(monitor):
+    await monitor.stop()
+    assert not monitor.running
+    assert monitor.snapshot()["running"] is False
@@ -0,0 +1,213 @@
+"""Unit app_tests for app_base.core.middlewares module."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app_base.config import get_observability_settings
+from app_base.core.log import get_request_id, logger
+from app_base.core.middlewares import query_counter, request_id_middleware, security_header, server_timing
+from app_base.core.middlewares.security_header import SECURITY_HEADERS
+from app_base.core.middlewares.timeout_middleware import TimeoutMiddleware
+from app_base.core.middlewares.utils import get_route_name, get_route_template
+
+
+def make_client(app: FastAPI) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+
+
+# =============================================================================
+# Tests for route helpers
+# =============================================================================
+
+
+class TestRouteTemplate:
+    """Tests for resolving the route template of a request."""
+
+    @pytest.mark.parametrize(
+        "root_path, path_format, expected",
+        [
+            ("", "/api/v1/workspaces/{workspace_id}", "/api/v1/workspaces/{workspace_id}"),
+            ("/api/v1", "/workspaces/{workspace_id}", "/api/v1/workspaces/{workspace_id}"),
+            ("/api/v1", "/login/", "/api/v1/login/"),
+        ],
+    )
+    def test_get_route_template(self, root_path, path_format, expected):
+        """Should prefix the route path with the mount point of its routes."""
+        scope = {"type": "http", "root_path": root_path, "route": SimpleNamespace(path_format=path_format)}
+        assert get_route_template(scope) == expected
+
+    async def test_included_and_mounted_routes(self):
+        """Should resolve the full template of included and mounted routes, without converters."""
+        items_router = APIRouter(prefix="/items")
+
+        @items_router.get("/{item_id:int}")
+        async def get_item(item_id: int):
+            return {}
+
+        v1_router = APIRouter(prefix="/v1")
+        v1_router.include_router(items_router)
+        sub_app = FastAPI()
+        sub_app.include_router(v1_router)
+        app = FastAPI()
+        app.include_router(v1_router, prefix="/api")
+        app.mount("/mounted", sub_app)
+        templates = []
+
+        async def capture(scope, receive, send):
+            await app(scope, receive, send)
+            templates.append(get_route_template(scope))
+
+        async with make_client(capture) as client:
+            for path in ("/api/v1/items/1", "/mounted/v1/items/1"):
+                assert (await client.get(path)).status_code == 200
+        assert templates == ["/api/v1/items/{item_id}", "/mounted/v1/items/{item_id}"]
+
+    def test_unmatched_route(self):
+        """Should fall back to a placeholder when no route matched."""
+        scope = {"type": "http", "method": "GET", "path": "/nope"}
+        assert get_route_template(scope) is None
+        assert get_route_name(scope) == "GET <unmatched>"
+
+
+# =============================================================================
+# Tests for the ASGI middlewares
+# =============================================================================
+
+
+class TestRequestIDMiddleware:
+    """Tests for RequestIDMiddleware."""
+
+    async def test_request_id_is_shared_with_endpoint_and_response(self):
+        """The id in request.state, the logging context and X-Request-ID should match."""
+        app = FastAPI()
+        request_id_middleware.add_middleware(app)
+
+        @app.get("/echo")
+        async def echo(request: Request):
+            return {"state": request.state.request_id, "context": get_request_id()}
+
+        async with make_client(app) as client:
+            response = await client.get("/echo")
+
+        assert response.status_code == 200
+        request_id = response.headers["X-Request-ID"]
+        assert len(request_id) == 8
+        assert response.json() == {"state": request_id, "context": request_id}
+        assert get_request_id() == "N/A"
+
+
+class TestSecurityHeaderMiddleware:
+    """Tests for SecurityHeaderMiddleware."""
+
+    async def test_headers_are_added(self):
+        app = FastAPI()
+        security_header.add_middleware(app)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        async with make_client(app) as client:
+            response = await client.get("/ping")
+
+        for key, value in SECURITY_HEADERS.items():
+            assert response.headers[key] == value
+
+
+class TestTimeoutMiddleware:
+    """Tests for TimeoutMiddleware."""
+
+    async def test_slow_request_returns_504(self):
+        app = FastAPI()
+        app.add_middleware(TimeoutMiddleware, timeout=0.05)
+
+        @app.get("/slow")
+        async def slow():
+            await asyncio.sleep(1)
+
+        async with make_client(app) as client:
+            response = await client.get("/slow")
+
+        assert response.status_code == 504
+        assert response.text == "Request processing time exceeded limit"
+
+    async def test_deadline_is_lifted_once_the_response_started(self):
+        """A streaming body may take longer than the timeout once headers were sent."""
+        app = FastAPI()
+        app.add_middleware(TimeoutMiddleware, timeout=0.05)
+
+        async def chunks():
+            for chunk in (b"a", b"b"):
+                await asyncio.sleep(0.04)
+                yield chunk
+
+        @app.get("/stream")
+        async def stream():
+            return StreamingResponse(chunks())
+
+        async with make_client(app) as client:
+            response = await client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.content == b"ab"
+
+    async def test_timeout_raised_by_the_app_is_not_swallowed(self):
+        app = FastAPI()
+        app.add_middleware(TimeoutMiddleware, timeout=10)
+
+        @app.get("/fails")
+        async def fails():
+            raise TimeoutError("upstream")
+
+        async with make_client(app) as client:
+            with pytest.raises(TimeoutError, match="upstream"):
+                await client.get("/fails")
+
+
+class TestQueryCounterMiddleware:
+    """Tests for QueryCounterMiddleware."""
+
+    async def test_header_is_set_without_queries(self):
+        app = FastAPI()
+        query_counter.add_middleware(app)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        async with make_client(app) as client:
+            response = await client.get("/ping")
+
+        assert response.headers["X-Query-Count"] == "0"
+
+
+class TestServerTimingMiddleware:
+    """Tests for ServerTimingMiddleware."""
+
+    async def test_header_and_slow_request_log(self, monkeypatch):
+        monkeypatch.setattr(get_observability_settings(), "SLOW_REQUEST_THRESHOLD_MS", 0.0)
+        app = FastAPI()
+        server_timing.add_middleware(app)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        records = []
+        sink_id = logger.add(lambda message: records.append(message.record), level="WARNING")
+        try:
+            async with make_client(app) as client:
+                response = await client.get("/ping")
+        finally:
+            logger.remove(sink_id)
+
+        assert response.headers["Server-Timing"].startswith("total;dur=")
+        slow = [record for record in records if record["message"].startswith("Slow request")]
+        assert slow
+        assert slow[0]["extra"]["route"] == "GET /ping"
+        assert "total" in slow[0]["extra"]["timings_ms"]
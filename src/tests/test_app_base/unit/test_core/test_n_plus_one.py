@@ -0,0 +1,78 @@
+"""Unit app_tests for app_base.core.database.n_plus_one module."""
+
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+from sqlalchemy import StaticPool, String
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app_base.base.exceptions.db import NPlusOneQueryException
+from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
+from app_base.base.repos.base import BaseRepository
+from app_base.core.database.n_plus_one import NPlusOneDetector
+from app_base.core.database.profiling import install_query_listeners, track_queries
+
+
+class MockItem(Base, UUIDMixin, TimestampMixin):
+    """Mock model for N+1 detection."""
+
+    __tablename__ = "mock_n_plus_one_items"
+
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class MockItemSchema(BaseModel):
+    name: str
+
+
+class MockItemRepository(BaseRepository[MockItem, MockItemSchema, MockItemSchema]):
+    model = MockItem
+
+
+@pytest_asyncio.fixture
+async def sqlite_session():
+    """Real in-memory SQLite session so that the engine listeners fire."""
+    install_query_listeners()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[MockItem.__table__])
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+class TestNPlusOneDetector:
+    """Tests for repeated statement shape detection."""
+
+    async def test_distinct_statements_are_not_reported(self, sqlite_session):
+        """Many different statements should not be flagged."""
+        repo = MockItemRepository()
+        detector = NPlusOneDetector(threshold=3)
+        with track_queries(detector) as query_log:
+            await repo.exists(sqlite_session)
+            await repo.get_multi(sqlite_session)
+        assert query_log.count == 3
+        assert detector.repeated_queries == []
+
+    async def test_repeated_shape_is_reported_with_frames(self, sqlite_session):
+        """The same shape repeated with different parameters should be reported once."""
+        repo = MockItemRepository()
+        detector = NPlusOneDetector(threshold=3)
+        with track_queries(detector):
+            for i in range(5):
+                await repo.exists(sqlite_session, where=MockItem.name == f"name-{i}")
+
+        [repeated] = detector.repeated_queries
+        assert repeated.count == 5
+        assert "mock_n_plus_one_items" in repeated.query
+        assert any(frame.startswith("app_base.base.repos.base:exists") for frame in repeated.frames)
+
+    async def test_strict_mode_raises(self, sqlite_session):
+        """Strict mode should raise as soon as the threshold is reached."""
+        repo = MockItemRepository()
+        with pytest.raises(NPlusOneQueryException) as exc_info:
+            with track_queries(NPlusOneDetector(threshold=2, strict=True)):
+                for i in range(3):
+                    await repo.exists(sqlite_session, where=MockItem.name == f"name-{i}")
+        assert "2x" in exc_info.value.log_message
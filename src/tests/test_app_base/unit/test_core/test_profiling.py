@@ -0,0 +1,134 @@
+"""Unit app_tests for app_base.core.database.profiling module."""
+
+import pytest
+
+from app_base.core.database.profiling import (
+    QueryStatsRegistry,
+    RequestQueryLog,
+    fingerprint_sql,
+)
+
+# =============================================================================
+# Tests for fingerprint_sql
+# =============================================================================
+
+
+class TestFingerprintSql:
+    """Tests for SQL normalization."""
+
+    def test_literals_are_normalized(self):
+        """Statements differing only in literals should share a fingerprint."""
+        id_a, query_a = fingerprint_sql("SELECT * FROM users WHERE email = 'a@example.com' AND age > 10")
+        id_b, query_b = fingerprint_sql("SELECT * FROM users WHERE email = 'b@example.com' AND age > 42")
+        assert id_a == id_b
+        assert query_a == "SELECT * FROM users WHERE email = ? AND age > ?"
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT id FROM memos WHERE id = ?",
+            "SELECT id FROM memos WHERE id = $1::UUID",
+            "SELECT id FROM memos WHERE id = %(id_1)s",
+            "SELECT id FROM memos WHERE id = :id_1",
+            "SELECT  id\n  FROM memos   WHERE id = %s",
+        ],
+    )
+    def test_placeholder_styles_are_normalized(self, statement):
+        """Driver-specific placeholders and whitespace should not matter."""
+        assert fingerprint_sql(statement)[1] == "SELECT id FROM memos WHERE id = ?"
+
+    def test_in_lists_are_collapsed(self):
+        """IN-lists of different lengths should share a fingerprint."""
+        id_a, query_a = fingerprint_sql("SELECT * FROM tags WHERE name IN (?, ?)")
+        id_b, _ = fingerprint_sql("SELECT * FROM tags WHERE name IN (?, ?, ?, ?)")
+        assert id_a == id_b
+        assert query_a == "SELECT * FROM tags WHERE name IN (...)"
+
+    def test_multi_row_values_are_collapsed(self):
+        """Multi-row inserts should share a fingerprint regardless of row count."""
+        id_a, _ = fingerprint_sql("INSERT INTO tags (name, workspace_id) VALUES (?, ?)")
+        id_b, _ = fingerprint_sql("INSERT INTO tags (name, workspace_id) VALUES (?, ?), (?, ?), (?, ?)")
+        assert id_a == id_b
+
+    def test_identifiers_with_digits_are_kept(self):
+        """Digits inside identifiers must not be treated as literals."""
+        _, query = fingerprint_sql("SELECT users_1.id FROM users AS users_1 LIMIT 10")
+        assert query == "SELECT users_1.id FROM users AS users_1 LIMIT ?"
+
+    def test_different_shapes_have_different_ids(self):
+        """Different statements should have different fingerprints."""
+        assert fingerprint_sql("SELECT 1")[0] != fingerprint_sql("SELECT * FROM users")[0]
+
+
+# =============================================================================
+# Tests for QueryStatsRegistry
+# =============================================================================
+
+
+class TestQueryStatsRegistry:
+    """Tests for the in-process statement statistics."""
+
+    def test_record_aggregates_by_route_and_fingerprint(self):
+        """Executions should be aggregated per (route, fingerprint)."""
+        registry = QueryStatsRegistry(max_entries=100, sample_size=100)
+        registry.record("GET /a", "SELECT * FROM t WHERE id = 1", 0.010)
+        registry.record("GET /a", "SELECT * FROM t WHERE id = 2", 0.030)
+        registry.record("GET /b", "SELECT * FROM t WHERE id = 3", 0.020)
+
+        rows = registry.snapshot(route="GET /a")
+        assert len(rows) == 1
+        assert rows[0]["calls"] == 2
+        assert rows[0]["total_time_ms"] == pytest.approx(40)
+        assert rows[0]["mean_time_ms"] == pytest.approx(20)
+        assert rows[0]["min_time_ms"] == pytest.approx(10)
+        assert rows[0]["max_time_ms"] == pytest.approx(30)
+        assert len(registry.snapshot()) == 2
+
+    def test_p95(self):
+        """p95 should be computed over the recorded samples."""
+        registry = QueryStatsRegistry(max_entries=100, sample_size=1000)
+        for i in range(1, 101):
+            registry.record("GET /a", "SELECT 1", i / 1000)
+        assert registry.snapshot()[0]["p95_time_ms"] == pytest.approx(95)
+
+    def test_record_request(self):
+        """A request log should be flushed under the given route."""
+        registry = QueryStatsRegistry(max_entries=100, sample_size=100)
+        query_log = RequestQueryLog()
+        query_log.add("SELECT 1", 0.001)
+        query_log.add("SELECT 2", 0.002)
+        registry.record_request("GET /a", query_log)
+
+        rows = registry.snapshot(route="GET /a")
+        assert query_log.count == 2
+        assert rows[0]["calls"] == 2
+
+    def test_snapshot_ordering_and_limit(self):
+        """Snapshot should be sorted descending by the requested key."""
+        registry = QueryStatsRegistry(max_entries=100, sample_size=100)
+        registry.record("GET /a", "SELECT * FROM a", 0.050)
+        for _ in range(3):
+            registry.record("GET /a", "SELECT * FROM b", 0.001)
+
+        assert registry.snapshot(order_by="total_time")[0]["query"] == "SELECT * FROM a"
+        assert registry.snapshot(order_by="calls")[0]["query"] == "SELECT * FROM b"
+        assert len(registry.snapshot(limit=1)) == 1
+
+    def test_max_entries(self):
+        """New fingerprints beyond the limit should be dropped, not grow memory."""
+        registry = QueryStatsRegistry(max_entries=1, sample_size=100)
+        registry.record("GET /a", "SELECT * FROM a", 0.001)
+        registry.record("GET /a", "SELECT * FROM b", 0.001)
+        registry.record("GET /a", "SELECT * FROM a", 0.001)
+
+        rows = registry.snapshot()
+        assert len(rows) == 1
+        assert rows[0]["calls"] == 2
+        assert registry.dropped == 1
+
+    def test_reset(self):
+        """Reset should clear all entries."""
+        registry = QueryStatsRegistry(max_entries=100, sample_size=100)
+        registry.record("GET /a", "SELECT 1", 0.001)
+        registry.reset()
+        assert registry.snapshot() == []
@@ -0,0 +1,109 @@
+"""Unit app_tests for app_base.core.middlewares.profiler module."""
+
+import time
+from typing import Annotated
+
+import orjson
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app_base.core.middlewares import profiler
+from app_base.core.middlewares.profiler import ProfileStore, RequestProfilerMiddleware, render_profile
+from app_base.core.middlewares.request_id_middleware import RequestIDMiddleware
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path) -> ProfileStore:
+    store = ProfileStore(str(tmp_path / "profiles"), max_profiles=2)
+    monkeypatch.setattr(profiler, "get_profile_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    async def busy_dependency() -> int:
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            pass
+        return 1
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int, value: Annotated[int, Depends(busy_dependency)]):
+        return {"id": item_id, "value": value}
+
+    async def authorize(scope) -> bool:
+        return dict(scope["headers"]).get(b"authorization") == b"Bearer admin"
+
+    app.add_middleware(RequestProfilerMiddleware, authorize=authorize)
+    app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestRequestProfilerMiddleware:
+    """Tests for profiling requests on demand."""
+
+    async def test_html_replaces_the_response(self, client):
+        response = await client.get("/items/1", headers={"Authorization": "Bearer admin", "X-Profile": "html"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["X-Profiled-Status"] == "200"
+        assert "X-Request-ID" in response.headers
+
+    async def test_json_via_query_parameter(self, client):
+        response = await client.get("/items/1", params={"_profile": "json"}, headers={"Authorization": "Bearer admin"})
+
+        assert response.status_code == 200
+        assert "busy_dependency" in response.text
+        assert orjson.loads(response.content)["duration"] >= 0.02
+
+    async def test_not_authorized_runs_as_usual(self, client, store):
+        for headers in ({"X-Profile": "html"}, {"Authorization": "Bearer user", "X-Profile": "store"}):
+            response = await client.get("/items/1", headers=headers)
+            assert response.json() == {"id": 1, "value": 1}
+            assert "X-Profile-ID" not in response.headers
+        assert store.list() == []
+
+    async def test_unknown_mode_runs_as_usual(self, client):
+        response = await client.get("/items/1", headers={"Authorization": "Bearer admin", "X-Profile": "flamegraph"})
+        assert response.json() == {"id": 1, "value": 1}
+
+    async def test_store(self, client, store):
+        response = await client.get("/items/1", headers={"Authorization": "Bearer admin", "X-Profile": "store"})
+
+        assert response.json() == {"id": 1, "value": 1}
+        profile_id = response.headers["X-Profile-ID"]
+        assert profile_id == response.headers["X-Request-ID"]
+        (info,) = store.list()
+        assert info["id"] == profile_id
+        assert info["route"] == "/items/{item_id}"
+        assert info["status_code"] == 200
+        body, media_type = render_profile(store.load(profile_id), "speedscope")
+        assert media_type == "application/json"
+        assert b"busy_dependency" in body
+
+
+class TestProfileStore:
+    """Tests for the on-disk profile store."""
+
+    async def test_keeps_most_recent(self, client, store):
+        profile_ids = []
+        for _ in range(3):
+            response = await client.get("/items/1", headers={"Authorization": "Bearer admin", "X-Profile": "store"})
+            profile_ids.append(response.headers["X-Profile-ID"])
+
+        assert [info["id"] for info in store.list()] == profile_ids[:0:-1]
+        assert store.load(profile_ids[0]) is None
+
+    def test_rejects_unsafe_ids(self, store):
+        assert store.load("../../etc/passwd") is None
+        assert store.list() == []
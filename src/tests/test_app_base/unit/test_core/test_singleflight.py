@@ -0,0 +1,120 @@
+"""Unit app_tests for app_base.core.singleflight module."""
+
+import asyncio
+
+import pytest
+
+from app_base.core.singleflight import Singleflight
+
+
+async def test_concurrent_calls_share_one_execution():
+    singleflight = Singleflight()
+    release = asyncio.Event()
+    executions = 0
+
+    async def load():
+        nonlocal executions
+        executions += 1
+        await release.wait()
+        return {"value": 1}
+
+    calls = [asyncio.create_task(singleflight.do("key", load, route="GET /items")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert executions == 1
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    assert all(result is results[0][0] for result, _ in results)
+    assert singleflight.in_flight == 0
+    assert singleflight.snapshot() == [
+        {"route": "GET /items", "calls": 5, "executions": 1, "coalesced": 4, "coalescing_ratio": 0.8}
+    ]
+
+
+async def test_sequential_calls_are_not_cached():
+    singleflight = Singleflight()
+    executions = 0
+
+    async def load():
+        nonlocal executions
+        executions += 1
+        return executions
+
+    assert await singleflight.do("key", load) == (1, False)
+    assert await singleflight.do("key", load) == (2, False)
+
+
+async def test_different_keys_do_not_coalesce():
+    singleflight = Singleflight()
+    release = asyncio.Event()
+
+    async def load(value):
+        await release.wait()
+        return value
+
+    calls = [asyncio.create_task(singleflight.do(key, lambda key=key: load(key))) for key in ("a", "b")]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*calls) == [("a", False), ("b", False)]
+
+
+async def test_exception_is_propagated_to_every_caller():
+    singleflight = Singleflight()
+    release = asyncio.Event()
+
+    async def fail():
+        await release.wait()
+        raise ValueError("boom")
+
+    calls = [asyncio.create_task(singleflight.do("key", fail)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert singleflight.in_flight == 0
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    singleflight = Singleflight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(singleflight.do("key", load))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(singleflight.do("key", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == ("done", True)
+
+
+async def test_cancelled_leader_waits_for_the_shared_call():
+    singleflight = Singleflight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(singleflight.do("key", load))
+    follower = asyncio.create_task(singleflight.do("key", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    follower.cancel()
+    await asyncio.sleep(0)
+    # The follower leaves at once; the leader keeps its resources until the call is done
+    assert follower.cancelled()
+    assert not leader.done()
+
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert singleflight.in_flight == 0
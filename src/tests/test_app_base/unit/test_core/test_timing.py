@@ -0,0 +1,76 @@
+"""Unit app_tests for app_base.core.timing module."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app_base.core.timing import (
+    format_server_timing,
+    timed,
+    timed_async,
+    timed_async_context,
+    track_timings,
+)
+
+
+class TestTimed:
+    """Tests for recording phase durations."""
+
+    def test_noop_outside_of_request(self):
+        with timed("auth"):
+            pass
+
+    def test_records_duration(self):
+        with track_timings() as timings:
+            with timed("auth"):
+                pass
+        assert timings.durations["auth"] >= 0
+        assert "auth" in timings.ended_at
+
+    def test_reentrant_phase_is_counted_once(self):
+        with track_timings() as timings:
+            with timed("usecase"):
+                with timed("usecase"):
+                    pass
+            outer_only = timings.durations["usecase"]
+        assert outer_only == pytest.approx(timings.ended_at["usecase"] - timings.started_at, abs=0.01)
+
+    async def test_timed_async_decorator(self):
+        @timed_async("usecase")
+        async def execute():
+            return 42
+
+        with track_timings() as timings:
+            assert await execute() == 42
+        assert "usecase" in timings.durations
+
+    async def test_timed_async_context_excludes_body(self):
+        events = []
+
+        @asynccontextmanager
+        async def hook():
+            events.append("enter")
+            yield "value"
+            events.append("exit")
+
+        with track_timings() as timings:
+            async with timed_async_context("hooks", hook()) as value:
+                with timed("db"):
+                    assert value == "value"
+        assert events == ["enter", "exit"]
+        assert {"hooks", "db"} <= timings.durations.keys()
+
+    async def test_timed_async_context_propagates_errors(self):
+        @asynccontextmanager
+        async def hook():
+            yield
+
+        with track_timings():
+            with pytest.raises(ValueError):
+                async with timed_async_context("hooks", hook()):
+                    raise ValueError("boom")
+
+
+def test_format_server_timing():
+    header = format_server_timing([("db", 0.0125, "3 queries"), ("total", 0.05, None)])
+    assert header == 'db;dur=12.50;desc="3 queries", total;dur=50.00'
@@ -0,0 +1,278 @@
+"""Unit app_tests for app_base.core.tracing module."""
+
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app_base.config import get_observability_settings
+from app_base.core import tracing
+from app_base.core.log import request_id_var
+from app_base.core.middlewares.request_id_middleware import RequestIDMiddleware
+from app_base.core.middlewares.tracing import TracingMiddleware
+from app_base.core.tracing import (
+    STATUS_ERROR,
+    BatchSpanProcessor,
+    InMemorySpanExporter,
+    JsonFileSpanExporter,
+    OtlpHttpSpanExporter,
+    Span,
+    Tracer,
+    is_sampled,
+    trace_hooks,
+    trace_id_for_request,
+    traced,
+    traced_method,
+)
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(monkeypatch, exporter) -> Tracer:
+    processor = BatchSpanProcessor(exporter, max_queue_size=100, batch_size=10, flush_interval=60)
+    tracer = Tracer(enabled=True, sample_rate=1.0, processor=processor)
+    monkeypatch.setattr(tracing, "get_tracer", lambda: tracer)
+    monkeypatch.setattr(get_observability_settings(), "TRACING_ENABLED", True)
+    return tracer
+
+
+def finished_spans(tracer: Tracer, exporter: InMemorySpanExporter) -> dict[str, Span]:
+    tracer.processor.force_flush()
+    return {span.name: span for span in exporter.spans}
+
+
+class TestTracer:
+    """Tests for span nesting, correlation and sampling."""
+
+    async def test_nested_spans(self, tracer, exporter):
+        @traced("child")
+        async def child():
+            tracer.record_span("db.query", 0.001, {"db.statement": "SELECT ?"})
+
+        token = request_id_var.set("abcd1234")
+        try:
+            with tracer.start_span("root"):
+                await child()
+        finally:
+            request_id_var.reset(token)
+
+        spans = finished_spans(tracer, exporter)
+        root, child_span, query = spans["root"], spans["child"], spans["db.query"]
+        assert root.trace_id == trace_id_for_request("abcd1234")
+        assert root.parent_id is None
+        assert child_span.parent_id == root.span_id
+        assert query.parent_id == child_span.span_id
+        assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+        assert root.attributes["request_id"] == "abcd1234"
+        assert root.end_ns >= child_span.end_ns >= child_span.start_ns >= root.start_ns
+
+    async def test_background_roots_get_their_own_trace(self, tracer, exporter):
+        with tracer.start_span("job"):
+            pass
+        with tracer.start_span("job"):
+            pass
+
+        tracer.processor.force_flush()
+        first, second = exporter.spans
+        assert first.trace_id != second.trace_id
+        assert "request_id" not in first.attributes
+
+    async def test_error_status(self, tracer, exporter):
+        with pytest.raises(ValueError):
+            with tracer.start_span("failing"):
+                raise ValueError("boom")
+
+        span = finished_spans(tracer, exporter)["failing"]
+        assert span.status == STATUS_ERROR
+        assert span.status_message == "ValueError: boom"
+
+    async def test_unsampled_trace_records_nothing(self, tracer, exporter):
+        tracer.sample_rate = 0.0
+
+        @traced("child")
+        async def child():
+            tracer.record_span("db.query", 0.001)
+
+        with tracer.start_span("root") as span:
+            assert span is None
+            await child()
+
+        assert finished_spans(tracer, exporter) == {}
+
+    def test_is_sampled_is_deterministic(self):
+        trace_ids = [trace_id_for_request(f"{i:08x}") for i in range(1000)]
+        kept = [trace_id for trace_id in trace_ids if is_sampled(trace_id, 0.25)]
+        assert 150 < len(kept) < 350
+        assert kept == [trace_id for trace_id in trace_ids if is_sampled(trace_id, 0.25)]
+        assert all(is_sampled(trace_id, 1.0) for trace_id in trace_ids)
+
+    async def test_disabled_tracer(self, monkeypatch):
+        monkeypatch.setattr(tracing, "get_tracer", lambda: Tracer(enabled=False))
+
+        @traced("noop")
+        async def noop():
+            return tracing.get_current_span()
+
+        assert await noop() is None
+
+
+class TestInstrumentation:
+    """Tests for the method and hook decorators."""
+
+    async def test_traced_method_uses_runtime_class(self, tracer, exporter):
+        class BaseRepo:
+            @traced_method
+            async def get(self):
+                return 1
+
+        class MemoRepo(BaseRepo):
+            pass
+
+        assert await MemoRepo().get() == 1
+        assert "MemoRepo.get" in finished_spans(tracer, exporter)
+
+    async def test_trace_hooks_nest_per_mixin(self, tracer, exporter):
+        class Base:
+            @asynccontextmanager
+            async def _context_update(self):
+                yield "ctx"
+
+            def _prepare_update_fields(self):
+                return {}
+
+            async def _post_update(self, obj):
+                return obj
+
+        class CheckMixin(Base):
+            @asynccontextmanager
+            async def _context_update(self):
+                async with super()._context_update() as value:
+                    yield value
+
+            async def _post_update(self, obj):
+                return await super()._post_update(obj)
+
+        class Service(CheckMixin):
+            def _prepare_update_fields(self):
+                return {"field": 1}
+
+        for cls in (CheckMixin, Service):
+            trace_hooks(cls)
+
+        service = Service()
+        async with service._context_update() as value:
+            assert value == "ctx"
+            assert service._prepare_update_fields() == {"field": 1}
+        assert await service._post_update("obj") == "obj"
+
+        spans = finished_spans(tracer, exporter)
+        assert set(spans) == {
+            "CheckMixin._context_update",
+            "Service._prepare_update_fields",
+            "CheckMixin._post_update",
+        }
+        assert spans["Service._prepare_update_fields"].parent_id == spans["CheckMixin._context_update"].span_id
+
+    async def test_traced_context_records_errors_of_the_body(self, tracer, exporter):
+        class Service:
+            @asynccontextmanager
+            async def _context_delete(self):
+                yield
+
+        trace_hooks(Service)
+        with pytest.raises(RuntimeError):
+            async with Service()._context_delete():
+                raise RuntimeError("failed")
+
+        assert finished_spans(tracer, exporter)["Service._context_delete"].status == STATUS_ERROR
+
+    def test_hooks_left_alone_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(get_observability_settings(), "TRACING_ENABLED", False)
+
+        class Service:
+            async def _post_update(self, obj):
+                return obj
+
+        post_update = Service._post_update
+        trace_hooks(Service)
+        assert Service._post_update is post_update
+
+
+class TestExport:
+    """Tests for the processor and the exporters."""
+
+    def test_full_queue_drops_spans(self, exporter):
+        processor = BatchSpanProcessor(exporter, max_queue_size=2, batch_size=10, flush_interval=60)
+        for i in range(3):
+            span = Span(f"span-{i}", trace_id_for_request("r"))
+            span.end_ns = span.start_ns
+            processor.on_end(span)
+
+        processor.shutdown()
+        assert [span.name for span in exporter.spans] == ["span-0", "span-1"]
+        assert processor.dropped == 1
+
+    def test_json_file_exporter(self, tmp_path):
+        path = tmp_path / "traces" / "spans.jsonl"
+        span = Span("GET /memos", trace_id_for_request("r"), attributes={"http.status_code": 200})
+        span.end_ns = span.start_ns + 1_000_000
+
+        JsonFileSpanExporter(str(path), service_name="app").export([span, span])
+
+        lines = path.read_bytes().splitlines()
+        record = orjson.loads(lines[0])
+        assert len(lines) == 2
+        assert record["name"] == "GET /memos"
+        assert record["duration_ms"] == 1.0
+        assert record["service"] == "app"
+
+    def test_otlp_encoding(self):
+        span = Span("outbox.dispatch", trace_id_for_request("r"), parent_id="00f067aa0ba902b7")
+        span.attributes.update({"event.type": "memo_created", "retries": 2, "ok": True})
+        span.end_ns = span.start_ns + 5
+
+        exporter = OtlpHttpSpanExporter("http://localhost:4318/v1/traces", service_name="app")
+        try:
+            payload = exporter.encode([span])
+        finally:
+            exporter.shutdown()
+
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "app"}}]
+        encoded = resource_spans["scopeSpans"][0]["spans"][0]
+        assert encoded["traceId"] == span.trace_id and len(encoded["traceId"]) == 32
+        assert encoded["parentSpanId"] == "00f067aa0ba902b7"
+        assert encoded["endTimeUnixNano"] == str(span.end_ns)
+        assert {"key": "retries", "value": {"intValue": "2"}} in encoded["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in encoded["attributes"]
+
+
+class TestTracingMiddleware:
+    """Tests for the request root span."""
+
+    async def test_root_span_named_after_route(self, tracer, exporter):
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        @traced("load_item")
+        async def get_item(item_id: int):
+            return {"id": item_id}
+
+        app.add_middleware(TracingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/items/1")
+
+        spans = finished_spans(tracer, exporter)
+        root = spans["GET /items/{item_id}"]
+        assert root.kind == "server"
+        assert root.attributes["http.status_code"] == 200
+        assert root.attributes["request_id"] == response.headers["X-Request-ID"]
+        assert spans["load_item"].parent_id == root.span_id
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Measure the cost of logging on the event loop under load.
+
+Concurrent coroutines log from a hot path (like the outbox dispatcher) while a probe
+measures how late the event loop wakes up timers. Each scenario configures the sinks
+the way app_base.core.log does (text file + a stream), writing to a temporary directory:
+
+    python tools/bench_logging.py --records 20000 --concurrency 50
+    python tools/bench_logging.py --slow-sink 0.0005   # simulate a slow disk/pipe (s per write)
+
+Scenarios:
+    sync              sinks write on the calling thread (LOG_ENQUEUE=false)
+    loguru-enqueue    loguru's own enqueue=True (multiprocessing queue, records are pickled)
+    background        file on loguru's enqueue, stream on a BackgroundSink thread (LOG_ENQUEUE=true)
+    background+limit  background, and at most 10 records per call site per second (LOG_RATE_LIMIT)
+    disabled-fstr     DEBUG records below the sink level, formatted eagerly with an f-string
+    disabled-lazy     same records with lazy arguments (logger.debug("... {}", value))
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+os.environ.setdefault("FIRST_USER_EMAIL", "admin@example.com")
+os.environ.setdefault("FIRST_USER_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+
+class SlowStream:
+    """A stream sink taking `delay` seconds per write (a slow terminal, pipe or disk)."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, message: str) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+
+    def flush(self) -> None:
+        pass
+
+
+def configure(log_dir: str, writer: str, rate_limit: int, slow_sink: float):
+    from app_base.core.log import BackgroundSink, LogSampler, format_record, logger
+
+    logger.remove()
+    logger.configure(patcher=format_record)
+    sampler = LogSampler({}, rate_limit=rate_limit, period=1.0)
+    sink_filter = sampler if sampler.enabled else None
+    text_format = "[{extra[request_id]}] {time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{line} | {message}"
+    log_path = os.path.join(log_dir, "bench.log")
+    stream = SlowStream(slow_sink)
+    options = {"level": "INFO", "format": text_format, "filter": sink_filter}
+    logger.add(log_path, rotation="50 MB", enqueue=writer != "sync", **options)
+    if writer == "background":
+        logger.add(BackgroundSink(stream), **options)
+    else:
+        logger.add(stream, enqueue=writer == "enqueue", **options)
+    return logger
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval: float, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        scheduled_at = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(loop.time() - scheduled_at - interval, 0.0))
+
+
+async def run_scenario(logger, mode: str, records: int, concurrency: int) -> tuple[float, list[float]]:
+    per_worker = records // concurrency
+    payload = {"aggregate_id": "5b1e0c1c", "attempt": 1}
+
+    async def worker(worker_id: int):
+        for i in range(per_worker):
+            if mode == "disabled-fstr":
+                logger.debug(f"Dispatching event {i} of worker {worker_id} with payload {payload}")
+            elif mode == "disabled-lazy":
+                logger.debug("Dispatching event {} of worker {} with payload {}", i, worker_id, payload)
+            else:
+                logger.info("Dispatching event {} of worker {} with payload {}", i, worker_id, payload)
+            if i % 10 == 0:
+                await asyncio.sleep(0)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(probe_loop_lag(stop, 0.001, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    # Drain the background writer before the next scenario (not part of the hot path)
+    await logger.complete()
+    return per_worker * concurrency / elapsed, lags
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)]
+
+
+async def main(args):
+    scenarios = [
+        ("sync", "sync", 0),
+        ("loguru-enqueue", "enqueue", 0),
+        ("background", "background", 0),
+        ("background+limit", "background", 10),
+        ("disabled-fstr", "sync", 0),
+        ("disabled-lazy", "sync", 0),
+    ]
+    print(f"{'scenario':<17} {'records/s':>12} {'loop lag p50':>13} {'p99':>9} {'max':>9}")
+    for name, writer, rate_limit in scenarios:
+        with tempfile.TemporaryDirectory(prefix="bench_log_") as log_dir:
+            logger = configure(log_dir, writer, rate_limit, args.slow_sink)
+            throughput, lags = await run_scenario(logger, name, args.records, args.concurrency)
+            logger.remove()
+        print(
+            f"{name:<17} {throughput:>12.0f} {percentile(lags, 50) * 1000:>11.2f}ms"
+            f" {percentile(lags, 99) * 1000:>7.2f}ms {max(lags, default=0) * 1000:>7.2f}ms"
+            f"  (statistics over {len(lags)} probes, mean {statistics.fmean(lags or [0]) * 1000:.2f}ms)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark logging on the event loop.")
+    parser.add_argument("--records", type=int, default=20000, help="Log calls per scenario.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Coroutines logging concurrently.")
+    parser.add_argument("--slow-sink", type=float, default=0.0, help="Seconds per write of the stream sink.")
+    asyncio.run(main(parser.parse_args()))
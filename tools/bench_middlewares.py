@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Measure in-process throughput of the middleware stack.
+
+Requests are driven straight through the ASGI interface (no sockets, no HTTP client)
+so that the numbers reflect the cost of the app itself:
+
+    python tools/bench_middlewares.py --requests 3000 --concurrency 8
+    python tools/bench_middlewares.py --bare   # same app without user middlewares
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+_db_dir = tempfile.mkdtemp(prefix="bench_")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("FIRST_USER_EMAIL", "admin@example.com")
+os.environ.setdefault("FIRST_USER_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+async def seed(memo_count: int) -> tuple[str, str]:
+    """Create tables, the first user, a workspace with memos; return (token, workspace_id)."""
+    from app.features.auth.repos import UserRepository
+    from app.features.auth.services import UserService
+    from app.features.memos.models import Memo
+    from app.features.workspaces.models import Workspace
+    from app_base.base.models.mixin import Base
+    from app_base.config import get_auth_settings
+    from app_base.core.database.engine import get_async_engine
+    from app_base.core.database.transaction import AsyncTransaction
+    from init_data.initial_data import create_first_user
+
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    service = UserService(settings=get_auth_settings(), repo=UserRepository())
+    async with AsyncTransaction() as session:
+        user = await create_first_user(session, service)
+        workspace = Workspace(name="Benchmark", created_by=user.id)
+        session.add(workspace)
+        await session.flush()
+        for i in range(memo_count):
+            session.add(
+                Memo(
+                    workspace_id=workspace.id,
+                    category="bench",
+                    title=f"Memo {i}",
+                    contents="x" * 200,
+                    created_by=user.id,
+                )
+            )
+    token = service.create_access_token(user)
+    return token, str(workspace.id)
+
+
+async def call(app, path: str, headers: list[tuple[bytes, bytes]]) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), *headers],
+        "state": {},
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app, path: str, headers, total: int, concurrency: int) -> float:
+    per_worker = total // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            status = await call(app, path, headers)
+            assert status < 400, f"{path} returned {status}"
+
+    # Warm up (route compilation, statement caches)
+    for _ in range(20):
+        await call(app, path, headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def main(args):
+    from app.main import create_app
+
+    token, workspace_id = await seed(args.memos)
+    app = create_app()
+    if args.bare:
+        app.user_middleware.clear()
+
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+    targets = [
+        ("/api/health", []),
+        (f"/api/v1/workspaces/{workspace_id}/memos", auth),
+    ]
+    for path, headers in targets:
+        results = [await run(app, path, headers, args.requests, args.concurrency) for _ in range(args.rounds)]
+        label = "/api/v1/workspaces/{id}/memos" if "memos" in path else path
+        print(f"{label:<32} best {max(results):>9.1f} req/s  (rounds: {', '.join(f'{r:.1f}' for r in results)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the middleware stack in process.")
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per round and endpoint.")
+    parser.add_argument("--concurrency", type=int, default=8, help="In-flight requests (keep below DB pool size).")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per endpoint (best is reported).")
+    parser.add_argument("--memos", type=int, default=20, help="Memos seeded into the listed workspace.")
+    parser.add_argument("--bare", action="store_true", help="Strip user middlewares for a reference run.")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Measure outbox dispatch throughput (events per second) against dispatch concurrency.
+
+Events are spread over a number of aggregates and drained with process_outbox_events_job;
+the handler only waits `--latency` seconds, standing for a network call:
+
+    python tools/bench_outbox.py --events 2000 --aggregates 100 --latency 0.01
+    python tools/bench_outbox.py --concurrency 1 4 16 64 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+_db_dir = tempfile.mkdtemp(prefix="bench_")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("FIRST_USER_EMAIL", "admin@example.com")
+os.environ.setdefault("FIRST_USER_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+EVENT_TYPE = "BENCH_EVENT"
+
+
+async def seed(events: int, aggregates: int) -> None:
+    """Create tables and `events` pending events over `aggregates` aggregates."""
+    import app.main  # noqa: F401  (registers every model)
+    from app.features.outbox.models import Outbox
+    from app_base.base.models.mixin import Base
+    from app_base.core.database.engine import get_async_engine
+    from app_base.core.database.transaction import AsyncTransaction
+
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncTransaction() as session:
+        session.add_all(
+            Outbox(aggregate_type="bench", aggregate_id=str(i % aggregates), event_type=EVENT_TYPE, payload={"i": i})
+            for i in range(events)
+        )
+
+
+async def drain() -> float:
+    """Run the outbox job until no event is left; return the elapsed seconds."""
+    from app.features.outbox.scheduler import process_outbox_events_job
+
+    start = time.perf_counter()
+    while await process_outbox_events_job():
+        pass
+    return time.perf_counter() - start
+
+
+async def main(args):
+    from app.features.outbox.registry import register_event_handler
+    from app_base.config import get_outbox_settings
+
+    @register_event_handler(EVENT_TYPE)
+    async def handle(event):
+        await asyncio.sleep(args.latency)
+
+    print(f"{args.events} events, {args.aggregates} aggregates, batch {args.batch_size}, latency {args.latency}s")
+    for concurrency in args.concurrency:
+        os.environ["OUTBOX_BATCH_SIZE"] = str(args.batch_size)
+        os.environ["OUTBOX_DISPATCH_CONCURRENCY"] = str(concurrency)
+        get_outbox_settings.cache_clear()
+        await seed(args.events, args.aggregates)
+        elapsed = await drain()
+        print(f"concurrency {concurrency:>4}  {args.events / elapsed:>9.1f} events/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark outbox dispatch against concurrency.")
+    parser.add_argument("--events", type=int, default=2000, help="Pending events per run.")
+    parser.add_argument("--aggregates", type=int, default=100, help="Distinct aggregate ids (ordering groups).")
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated handler latency (s).")
+    parser.add_argument("--batch-size", type=int, default=100, help="OUTBOX_BATCH_SIZE.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64], help="Levels to compare.")
+    asyncio.run(main(parser.parse_args()))